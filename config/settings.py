@@ -5,7 +5,7 @@
 import os
 import json
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 from dotenv import load_dotenv
 
 # 加载 .env 文件
@@ -98,6 +98,300 @@ class Settings:
         """采集时间范围（天数）"""
         return int(self._get_env_or_config("SCRAPE_TIME_RANGE_DAYS", "7"))
 
+    # 并发与限速配置
+    @property
+    def scrape_concurrency(self) -> int:
+        """全局并发采集任务上限（运行时至少扩大到各信号源并发预算之和）"""
+        return max(1, int(self._get_env_or_config("SCRAPE_CONCURRENCY", "4")))
+
+    @property
+    def scrape_source_concurrency(self) -> int:
+        """单个信号源的并发采集任务上限"""
+        return max(1, int(self._get_env_or_config("SCRAPE_SOURCE_CONCURRENCY", "2")))
+
+    @property
+    def scrape_source_concurrency_overrides(self) -> Dict[str, int]:
+        """
+        按信号源单独设置的并发预算（JSON，如 {"Newsbreak": 3, "NAR": 1}），
+        未列出的信号源使用 SCRAPE_SOURCE_CONCURRENCY
+        """
+        raw = self._get_env_or_config("SCRAPE_SOURCE_CONCURRENCY_OVERRIDES", "{}")
+        if isinstance(raw, dict):
+            return raw
+        try:
+            return json.loads(raw) if raw else {}
+        except json.JSONDecodeError:
+            return {}
+
+    @property
+    def scrape_host_concurrency(self) -> int:
+        """单个域名的并发采集任务上限（不低于使用该域名的信号源的并发预算）"""
+        return max(1, int(self._get_env_or_config("SCRAPE_HOST_CONCURRENCY", "2")))
+
+    @property
+    def scrape_host_rate_per_minute(self) -> float:
+        """单个域名每分钟允许启动的采集任务数（令牌桶平均速率）"""
+        return float(self._get_env_or_config("SCRAPE_HOST_RATE_PER_MINUTE", "20"))
+
+    @property
+    def scrape_host_rate_burst(self) -> int:
+        """单个域名允许的突发采集任务数（令牌桶容量）"""
+        return max(1, int(self._get_env_or_config("SCRAPE_HOST_RATE_BURST", "2")))
+
+    # 文章内容抓取配置（共享HTTP连接池）
+    @property
+    def content_fetch_concurrency(self) -> int:
+        """文章内容抓取的总并发连接数"""
+        return max(1, int(self._get_env_or_config("CONTENT_FETCH_CONCURRENCY", "16")))
+
+    @property
+    def content_fetch_per_host(self) -> int:
+        """文章内容抓取的单域名并发连接数"""
+        return max(1, int(self._get_env_or_config("CONTENT_FETCH_PER_HOST", "4")))
+
+    @property
+    def http_validator_cache_mb(self) -> float:
+        """条件请求（ETag / Last-Modified）缓存的正文在内存中占用的上限（MB）"""
+        return float(self._get_env_or_config("HTTP_VALIDATOR_CACHE_MB", "32"))
+
+    @property
+    def content_extract_workers(self) -> int:
+        """
+        正文提取进程池的工作进程数（0 表示在线程池中提取）。
+        默认为CPU核数减一，至少1个、最多4个。
+        """
+        default = max(1, min(4, (os.cpu_count() or 2) - 1))
+        return max(0, int(self._get_env_or_config("CONTENT_EXTRACT_WORKERS", str(default))))
+
+    # 正文磁盘缓存配置
+    @property
+    def content_cache_enabled(self) -> bool:
+        """是否启用文章正文磁盘缓存"""
+        return self._get_env_or_config("CONTENT_CACHE_ENABLED", "true").lower() == "true"
+
+    @property
+    def content_cache_dir(self) -> Path:
+        """正文缓存目录"""
+        return PROJECT_ROOT / self._get_env_or_config("CONTENT_CACHE_DIR", "cache/content")
+
+    @property
+    def content_cache_ttl_days(self) -> float:
+        """正文缓存过期天数"""
+        return float(self._get_env_or_config("CONTENT_CACHE_TTL_DAYS", "14"))
+
+    @property
+    def content_cache_max_mb(self) -> int:
+        """正文缓存总大小上限（MB），超出时按写入时间从旧到新淘汰"""
+        return int(self._get_env_or_config("CONTENT_CACHE_MAX_MB", "256"))
+
+    # 解析结果缓存配置（zipcode → 城市/站点页面URL）
+    @property
+    def resolution_cache_dir(self) -> Path:
+        """解析结果缓存目录"""
+        return PROJECT_ROOT / self._get_env_or_config("RESOLUTION_CACHE_DIR", "cache")
+
+    @property
+    def resolution_cache_ttl_days(self) -> float:
+        """解析结果过期天数"""
+        return float(self._get_env_or_config("RESOLUTION_CACHE_TTL_DAYS", "30"))
+
+    @property
+    def resolution_cache_negative_ttl_days(self) -> float:
+        """负缓存（确认无结果的输入）过期天数"""
+        return float(self._get_env_or_config("RESOLUTION_CACHE_NEGATIVE_TTL_DAYS", "3"))
+
+    # 流式入库配置（采集结果按微批边产生边入库）
+    @property
+    def stream_insert_batch_size(self) -> int:
+        """流式入库微批条数（攒够即入库）"""
+        return max(1, int(self._get_env_or_config("STREAM_INSERT_BATCH_SIZE", "50")))
+
+    @property
+    def stream_insert_flush_seconds(self) -> float:
+        """流式入库微批最长等待秒数（批次第一条入队后超过该时间即入库）"""
+        return float(self._get_env_or_config("STREAM_INSERT_FLUSH_SECONDS", "5"))
+
+    @property
+    def stream_queue_max(self) -> int:
+        """流式入库待处理队列上限（超过时采集方等待，限制峰值内存）"""
+        return max(1, int(self._get_env_or_config("STREAM_QUEUE_MAX", "500")))
+
+    @property
+    def stream_post_queue_max(self) -> int:
+        """入库后等待后处理（Dify审核）的批次数上限（超过时入库暂停，限制峰值内存）"""
+        return max(1, int(self._get_env_or_config("STREAM_POST_QUEUE_MAX", "4")))
+
+    # HTTP快速路径配置（不启动浏览器，直接下载服务端渲染的HTML读取数据）
+    @property
+    def newsbreak_http_fetch_enabled(self) -> bool:
+        """Newsbreak 分类页面是否先通过HTTP读取 __NEXT_DATA__（失败时才打开浏览器页面）"""
+        return self._get_env_or_config("NEWSBREAK_HTTP_FETCH_ENABLED", "true").lower() == "true"
+
+    @property
+    def real_estate_http_fetch_enabled(self) -> bool:
+        """NAR / Freddie Mac / Redfin 列表页是否先通过HTTP下载解析（文章太少时才启动浏览器）"""
+        return self._get_env_or_config("REAL_ESTATE_HTTP_FETCH_ENABLED", "true").lower() == "true"
+
+    @property
+    def real_estate_http_min_articles(self) -> int:
+        """HTTP解析结果少于该篇数（且少于limit）时回退到浏览器采集"""
+        return max(1, int(self._get_env_or_config("REAL_ESTATE_HTTP_MIN_ARTICLES", "3")))
+
+    # 浏览器请求拦截配置（创建context时注册 context.route）
+    @property
+    def resource_blocking_enabled(self) -> bool:
+        """是否拦截浏览器页面中的图片/字体/媒体与广告统计请求"""
+        return self._get_env_or_config("RESOURCE_BLOCKING_ENABLED", "true").lower() == "true"
+
+    def _get_list(self, key: str, default: str) -> List[str]:
+        """读取逗号分隔的列表配置（config.json 中也可直接写数组）"""
+        raw = self._get_env_or_config(key, default)
+        if isinstance(raw, list):
+            return [str(item).strip() for item in raw if str(item).strip()]
+        return [item.strip() for item in str(raw).split(",") if item.strip()]
+
+    @property
+    def resource_block_types(self) -> List[str]:
+        """拦截的资源类型（Playwright resource_type，逗号分隔）"""
+        return self._get_list("RESOURCE_BLOCK_TYPES", "image,media,font")
+
+    @property
+    def resource_block_domains(self) -> List[str]:
+        """拦截的广告/统计域名（匹配子域名，逗号分隔）"""
+        return [d.lower() for d in self._get_list(
+            "RESOURCE_BLOCK_DOMAINS",
+            "doubleclick.net,googlesyndication.com,googletagmanager.com,google-analytics.com,"
+            "googleadservices.com,adservice.google.com,amazon-adsystem.com,facebook.net,"
+            "scorecardresearch.com,quantserve.com,hotjar.com,taboola.com,outbrain.com,criteo.com,"
+            "adnxs.com,moatads.com,chartbeat.com,segment.io"
+        )]
+
+    @property
+    def resource_block_types_overrides(self) -> Dict[str, List[str]]:
+        """
+        按采集源覆盖拦截的资源类型（JSON，如 {"Realtor.com": [], "Redfin": ["image", "media", "font", "stylesheet"]}），
+        未列出的采集源使用 RESOURCE_BLOCK_TYPES；默认 Realtor.com 不按类型拦截（风控对页面资源加载敏感）
+        """
+        raw = self._get_env_or_config("RESOURCE_BLOCK_TYPES_OVERRIDES", '{"Realtor.com": []}')
+        if isinstance(raw, dict):
+            return raw
+        try:
+            return json.loads(raw) if raw else {}
+        except json.JSONDecodeError:
+            return {}
+
+    @property
+    def resource_block_domains_overrides(self) -> Dict[str, List[str]]:
+        """
+        按采集源覆盖拦截的域名（JSON，如 {"Realtor.com": []}），
+        未列出的采集源使用 RESOURCE_BLOCK_DOMAINS；默认 Realtor.com 不拦截任何域名（风控脚本依赖统计/广告请求）
+        """
+        raw = self._get_env_or_config("RESOURCE_BLOCK_DOMAINS_OVERRIDES", '{"Realtor.com": []}')
+        if isinstance(raw, dict):
+            return raw
+        try:
+            return json.loads(raw) if raw else {}
+        except json.JSONDecodeError:
+            return {}
+
+    @property
+    def scraper_base_url_overrides(self) -> Dict[str, str]:
+        """
+        按采集源覆盖站点基础URL（JSON，如 {"NAR": "http://127.0.0.1:8765/nar"}），
+        用于离线回放基准测试（scripts/benchmark_replay.py）；正式运行留空
+        """
+        raw = self._get_env_or_config("SCRAPER_BASE_URL_OVERRIDES", "")
+        if isinstance(raw, dict):
+            return raw
+        try:
+            return json.loads(raw) if raw else {}
+        except json.JSONDecodeError:
+            return {}
+
+    # 浏览器流量HAR录制/回放配置
+    @property
+    def har_mode(self) -> str:
+        """off（默认）/ record（录制每个context的流量）/ replay（从录制回放，不访问线上站点）"""
+        return self._get_env_or_config("HAR_MODE", "off").lower()
+
+    @property
+    def har_dir(self) -> Path:
+        """HAR录制目录（按 采集源/zipcode 分子目录）"""
+        return PROJECT_ROOT / self._get_env_or_config("HAR_DIR", "cache/har")
+
+    @property
+    def har_replay_not_found(self) -> str:
+        """回放时录制中没有的请求：abort（默认，中止请求）/ fallback（访问网络）"""
+        value = self._get_env_or_config("HAR_REPLAY_NOT_FOUND", "abort").lower()
+        return value if value in ("abort", "fallback") else "abort"
+
+    # 运行追踪配置（分段计时）
+    @property
+    def trace_enabled(self) -> bool:
+        """是否为每次采集任务写入JSONL追踪文件（关闭时仍输出 p50/p95 汇总）"""
+        return self._get_env_or_config("TRACE_ENABLED", "true").lower() == "true"
+
+    @property
+    def trace_dir(self) -> Path:
+        """追踪文件目录"""
+        return PROJECT_ROOT / self._get_env_or_config("TRACE_DIR", "logs/traces")
+
+    # Dify审核配置
+    @property
+    def dify_max_connections(self) -> int:
+        """Dify客户端连接池大小（长连接复用）"""
+        return max(1, int(self._get_env_or_config("DIFY_MAX_CONNECTIONS", "10")))
+
+    @property
+    def dify_review_concurrency(self) -> int:
+        """同时审核的zipcode组数"""
+        return max(1, int(self._get_env_or_config("DIFY_REVIEW_CONCURRENCY", "3")))
+
+    @property
+    def dify_speculative_k(self) -> int:
+        """
+        组内推测审核并行数：同时提交前K条，任一通过即取消其余（1 表示逐条顺序审核）。
+        已发出的请求被取消时Dify端可能仍会执行完该工作流。
+        """
+        return max(1, int(self._get_env_or_config("DIFY_SPECULATIVE_K", "1")))
+
+    # 本地URL去重索引配置
+    @property
+    def url_index_enabled(self) -> bool:
+        """是否启用本地URL去重索引（插入前先查本地，避免数据库 IN 查询）"""
+        return self._get_env_or_config("URL_INDEX_ENABLED", "true").lower() == "true"
+
+    @property
+    def url_index_path(self) -> Path:
+        """本地URL去重索引文件路径（SQLite）"""
+        return PROJECT_ROOT / self._get_env_or_config("URL_INDEX_PATH", "cache/url_index.sqlite3")
+
+    @property
+    def url_index_sync_seconds(self) -> int:
+        """按 crawl_time 增量同步索引的最小间隔（秒）"""
+        return int(self._get_env_or_config("URL_INDEX_SYNC_SECONDS", "300"))
+
+    @property
+    def url_index_reconcile_hours(self) -> float:
+        """与数据库全量对账的间隔（小时，0 表示不对账）"""
+        return float(self._get_env_or_config("URL_INDEX_RECONCILE_HOURS", "24"))
+
+    # 浏览器池配置（跨 scrape_source 调用复用 Chromium 进程）
+    @property
+    def browser_pool_enabled(self) -> bool:
+        """是否启用共享浏览器池（headless 采集器共用，Realtor.com 除外）"""
+        return self._get_env_or_config("BROWSER_POOL_ENABLED", "true").lower() == "true"
+
+    @property
+    def browser_pool_size(self) -> int:
+        """浏览器池中保持的最大浏览器进程数"""
+        return max(1, int(self._get_env_or_config("BROWSER_POOL_SIZE", "2")))
+
+    @property
+    def browser_pool_max_pages(self) -> int:
+        """单个浏览器累计打开多少个页面后回收重启（0 表示不按页数回收）"""
+        return int(self._get_env_or_config("BROWSER_POOL_MAX_PAGES", "200"))
+
     # Realtor.com 专用配置（反风控画像）
     @property
     def realtor_locale(self) -> str:
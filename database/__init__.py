@@ -1,4 +1,13 @@
 """数据库模块"""
-from database.supabase_client import DatabaseManager, db_manager
+from database.url_index import UrlSeenIndex
 
-__all__ = ['DatabaseManager', 'db_manager']
+__all__ = ['DatabaseManager', 'db_manager', 'UrlSeenIndex']
+
+
+def __getattr__(name):
+    # Supabase 客户端在导入 supabase_client 时创建，按需导入，
+    # 只使用本地URL索引（如测试）时不触发数据库连接
+    if name in ('DatabaseManager', 'db_manager'):
+        from database import supabase_client
+        return getattr(supabase_client, name)
+    raise AttributeError(f"module 'database' has no attribute {name!r}")
@@ -121,6 +121,7 @@ CREATE TABLE IF NOT EXISTS play_raw_news (
     content TEXT, -- 完整内容，非摘要
     publish_date TIMESTAMPTZ,
     url TEXT NOT NULL,
+    normalized_url TEXT, -- 标准化URL（去重键，由应用层计算）
     language VARCHAR(10) NOT NULL DEFAULT 'en',
     raw_category VARCHAR(255), -- 原始分类标签
     crawl_time TIMESTAMPTZ NOT NULL DEFAULT NOW(),
@@ -145,6 +146,7 @@ CREATE INDEX IF NOT EXISTS idx_raw_news_status ON play_raw_news(status);
 CREATE INDEX IF NOT EXISTS idx_raw_news_publish_date ON play_raw_news(publish_date);
 CREATE INDEX IF NOT EXISTS idx_raw_news_crawl_time ON play_raw_news(crawl_time);
 CREATE INDEX IF NOT EXISTS idx_raw_news_url ON play_raw_news(url);
+CREATE UNIQUE INDEX IF NOT EXISTS idx_raw_news_normalized_url ON play_raw_news(normalized_url);
 
 -- play_raw_news 触发器
 CREATE TRIGGER update_raw_news_updated_at 
@@ -0,0 +1,28 @@
+-- ============================================================================
+-- 003: play_raw_news 增加 normalized_url 列（标准化URL，去重键）
+-- ============================================================================
+-- 说明：
+--   normalized_url 由应用层 DataCleaner.normalize_url 计算（统一https、去查询参数/fragment、
+--   去末尾斜杠、域名小写），insert_raw_news 以 upsert ... on_conflict=normalized_url 写入，
+--   数据库层保证并发运行时也不会插入重复文章。
+--   已有数据库执行 UP Migration 后，运行 scripts/backfill_normalized_url.py 回填历史数据
+--   （重复文章只保留最早的一条拥有 normalized_url，其余保持 NULL 并在脚本输出中列出）。
+-- 日期：2026-10-17
+-- ============================================================================
+
+-- ============================================================================
+-- UP Migration
+-- ============================================================================
+
+ALTER TABLE play_raw_news ADD COLUMN IF NOT EXISTS normalized_url TEXT;
+
+-- 唯一索引（NULL 互不冲突，未回填的历史数据不受影响）；
+-- 使用非部分索引，确保 PostgREST 的 on_conflict=normalized_url 可以匹配
+CREATE UNIQUE INDEX IF NOT EXISTS idx_raw_news_normalized_url ON play_raw_news(normalized_url);
+
+-- ============================================================================
+-- DOWN Migration
+-- ============================================================================
+
+-- DROP INDEX IF EXISTS idx_raw_news_normalized_url;
+-- ALTER TABLE play_raw_news DROP COLUMN IF EXISTS normalized_url;
@@ -11,7 +11,9 @@ from supabase import create_client, Client
 
 from config.settings import settings
 from utils.logger import logger
+from utils.tracing import traced
 from utils.data_cleaner import DataCleaner
+from database.url_index import UrlSeenIndex
 
 
 class DatabaseManager:
@@ -24,8 +26,18 @@ class DatabaseManager:
             settings.supabase_key,
         )
         self.data_cleaner = DataCleaner()  # 用于URL标准化
+        self.url_index: Optional[UrlSeenIndex] = None
+        if settings.url_index_enabled:
+            try:
+                self.url_index = UrlSeenIndex(settings.url_index_path)
+            except Exception as e:
+                logger.warning(f"本地URL索引初始化失败，回退到数据库查询: {str(e)}")
+        self._url_index_synced_at: Optional[datetime] = None
+        self._url_index_lock: Optional[asyncio.Lock] = None
+        self._reconcile_task: Optional[asyncio.Task] = None
         logger.info("Supabase客户端初始化成功")
     
+    @traced()
     async def get_active_sources(self) -> List[Dict[str, Any]]:
         """
         获取所有激活的信号源配置
@@ -45,6 +57,7 @@ class DatabaseManager:
             logger.error(f"获取激活信号源失败: {str(e)}", exc_info=True)
             return []
     
+    @traced()
     async def get_zipcodes_from_magnet(self) -> List[str]:
         """
         从 magnet 表查询非空 zip_code 并去重，等价 SQL：
@@ -77,55 +90,221 @@ class DatabaseManager:
             logger.error(f"从 magnet 获取 Zipcode 失败: {str(e)}", exc_info=True)
             return []
     
-    async def _check_existing_urls(self, normalized_urls: List[str], original_urls: List[str]) -> set:
+    async def _fetch_raw_news_urls(self, since: Optional[str] = None) -> Tuple[List[str], Optional[str]]:
         """
-        批量查询已存在的URL（基于标准化URL比较）
+        分页读取 play_raw_news 的URL（按 (crawl_time, id) 升序的键集分页）
+        
+        crawl_time 不唯一且同步期间仍有新记录写入，按偏移量分页会跳过或重复记录；
+        每页从上一页最后一条的 (crawl_time, id) 之后继续读取
         
         Args:
-            normalized_urls: 标准化后的URL列表（用于比较）
-            original_urls: 原始URL列表（用于数据库查询）
+            since: 只读取 crawl_time >= since 的记录（None表示全量）
             
         Returns:
-            已存在标准化URL的集合
+            元组 (标准化URL列表, 读取到的最大crawl_time)
         """
-        if not normalized_urls or not original_urls or len(normalized_urls) != len(original_urls):
-            return set()
+        page_size = 1000
+        cursor: Optional[Tuple[str, Any]] = None
+        normalized_urls = []
+        latest_crawl_time = since
         
-        try:
-            # 先查询数据库中所有可能的URL（使用原始URL的IN查询）
-            # 注意：Supabase的IN查询有长度限制，需要分批处理
-            batch_size = 100  # 每批最多100个URL
-            existing_normalized_urls = set()
+        while True:
+            def query_page():
+                query = self.client.table('play_raw_news').select('id, url, normalized_url, crawl_time')
+                if since:
+                    query = query.gte('crawl_time', since)
+                if cursor:
+                    crawl_time, last_id = cursor
+                    query = query.or_(
+                        f'crawl_time.gt."{crawl_time}",and(crawl_time.eq."{crawl_time}",id.gt.{last_id})'
+                    )
+                return query.order('crawl_time').order('id').limit(page_size).execute()
             
-            # 创建原始URL到标准化URL的映射
-            url_mapping = dict(zip(original_urls, normalized_urls))
+            response = await asyncio.to_thread(query_page)
+            rows = response.data or []
+            for row in rows:
+                normalized_url = row.get('normalized_url') or self.data_cleaner.normalize_url(row.get('url') or '')
+                if normalized_url:
+                    normalized_urls.append(normalized_url)
+                if row.get('crawl_time'):
+                    latest_crawl_time = row['crawl_time']
             
-            for i in range(0, len(original_urls), batch_size):
-                batch_original_urls = original_urls[i:i + batch_size]
-                
-                def query_batch():
-                    return self.client.table('play_raw_news').select('url').in_('url', batch_original_urls).execute()
-                
-                response = await asyncio.to_thread(query_batch)
+            # crawl_time 在入库时总会写入；缺失时无法继续按键集翻页
+            if len(rows) < page_size or not rows[-1].get('crawl_time'):
+                break
+            cursor = (rows[-1]['crawl_time'], rows[-1]['id'])
+        
+        return normalized_urls, latest_crawl_time
+    
+    def _url_index_guard(self) -> asyncio.Lock:
+        if self._url_index_lock is None:
+            self._url_index_lock = asyncio.Lock()
+        return self._url_index_lock
+    
+    def _needs_reconcile(self, now: datetime) -> bool:
+        """尚未建立索引，或距上次全量对账超过 URL_INDEX_RECONCILE_HOURS"""
+        reconciled_at = self.url_index.get_meta('reconciled_at')
+        reconcile_hours = settings.url_index_reconcile_hours
+        return not reconciled_at or (
+            reconcile_hours > 0
+            and now - datetime.fromisoformat(reconciled_at) >= timedelta(hours=reconcile_hours)
+        )
+    
+    def start_url_index_reconcile(self) -> Optional[asyncio.Task]:
+        """
+        需要全量对账时在后台启动（运行开始时调用），不占用入库路径
+        
+        Returns:
+            对账任务；不需要对账或索引不可用时返回None
+        """
+        if self.url_index is None:
+            return None
+        if self._reconcile_task is not None and not self._reconcile_task.done():
+            return self._reconcile_task
+        try:
+            if not self._needs_reconcile(datetime.utcnow()):
+                return None
+        except Exception as e:
+            logger.warning(f"读取本地URL索引对账时间失败: {str(e)}")
+            return None
+        self._reconcile_task = asyncio.create_task(self.reconcile_url_index())
+        return self._reconcile_task
+    
+    @traced()
+    async def reconcile_url_index(self) -> bool:
+        """
+        全量对账：从数据库重新构建本地URL索引（清除数据库已删除的URL）
+        
+        读取全表期间不持有同步锁，入库前的去重照常使用现有索引；
+        读取期间新入库的记录（crawl_time 不早于水位）由之后的增量同步补上。
+        
+        Returns:
+            是否对账成功
+        """
+        started_at = datetime.utcnow()
+        try:
+            normalized_urls, latest_crawl_time = await self._fetch_raw_news_urls()
+            async with self._url_index_guard():
+                await asyncio.to_thread(self.url_index.replace_all, normalized_urls)
+                self.url_index.set_meta('reconciled_at', started_at.isoformat())
+                if latest_crawl_time:
+                    self.url_index.set_meta('crawl_time_watermark', latest_crawl_time)
+                # 下一次去重前立即增量同步
+                self._url_index_synced_at = None
+            logger.info(f"本地URL索引全量对账完成: {len(normalized_urls)} 条URL")
+            return True
+        except Exception as e:
+            logger.warning(f"本地URL索引全量对账失败: {str(e)}，下次运行开始时重试")
+            return False
+    
+    @traced()
+    async def sync_url_index(self) -> bool:
+        """
+        增量同步本地URL索引（入库前去重时调用）
+        
+        距上次同步不足 URL_INDEX_SYNC_SECONDS 时直接返回；否则按 crawl_time 水位增量拉取。
+        全量对账由 start_url_index_reconcile 在后台执行，不在这里进行。
+        
+        Returns:
+            索引是否可用（尚未完成首次对账或同步失败时返回False，本批去重完全交给数据库唯一索引）
+        """
+        if self.url_index is None:
+            return False
+        
+        async with self._url_index_guard():
+            now = datetime.utcnow()
+            if (
+                self._url_index_synced_at
+                and (now - self._url_index_synced_at).total_seconds() < settings.url_index_sync_seconds
+            ):
+                return True
+            
+            try:
+                if not self.url_index.get_meta('reconciled_at'):
+                    logger.debug("本地URL索引尚未完成首次全量对账，本批去重交给数据库唯一索引")
+                    return False
+                since = self.url_index.get_meta('crawl_time_watermark')
+                normalized_urls, latest_crawl_time = await self._fetch_raw_news_urls(since)
+                await asyncio.to_thread(self.url_index.add_many, normalized_urls)
+                logger.debug(f"本地URL索引增量同步完成: 自 {since} 起 {len(normalized_urls)} 条URL")
                 
-                if response.data:
-                    # 获取数据库中的URL，标准化后与待插入的标准化URL比较
-                    for record in response.data:
-                        db_url = record.get('url')
-                        if db_url:
-                            # 标准化数据库中的URL
-                            db_normalized = self.data_cleaner.normalize_url(db_url)
-                            if db_normalized:
-                                existing_normalized_urls.add(db_normalized)
-            
-            logger.debug(f"URL存在性检查完成: 检查 {len(normalized_urls)} 个URL，发现 {len(existing_normalized_urls)} 个已存在")
-            return existing_normalized_urls
+                if latest_crawl_time:
+                    self.url_index.set_meta('crawl_time_watermark', latest_crawl_time)
+                self._url_index_synced_at = now
+                return True
+            except Exception as e:
+                logger.warning(f"本地URL索引同步失败: {str(e)}，本批去重交给数据库唯一索引")
+                return False
+    
+    def _remember_urls(self, records: List[Dict[str, Any]]):
+        """将已入库记录的标准化URL写入本地索引"""
+        if self.url_index is None or not records:
+            return
+        try:
+            self.url_index.add_many(
+                record.get('normalized_url') or self.data_cleaner.normalize_url(record.get('url') or '')
+                for record in records
+            )
+        except Exception as e:
+            logger.debug(f"写入本地URL索引失败: {str(e)}")
+    
+    async def _check_existing_urls(self, normalized_urls: List[str]) -> set:
+        """
+        用本地URL索引预先过滤已存在的URL（只减少写入量，不发起网络查询）
+        
+        数据库层的最终去重由 normalized_url 唯一索引 + upsert 保证，
+        本地索引不可用时直接返回空集合。
+        
+        Args:
+            normalized_urls: 标准化后的URL列表
             
+        Returns:
+            已存在标准化URL的集合
+        """
+        if not normalized_urls or not await self.sync_url_index():
+            return set()
+        
+        try:
+            existing_normalized_urls = self.url_index.contains_many(normalized_urls)
+            logger.debug(f"URL存在性检查完成（本地索引）: 检查 {len(normalized_urls)} 个URL，发现 {len(existing_normalized_urls)} 个已存在")
+            return existing_normalized_urls
         except Exception as e:
-            logger.warning(f"查询已存在URL失败: {str(e)}，将允许继续插入")
-            # 如果查询失败，返回空集合，允许继续插入（避免因查询失败导致数据丢失）
+            logger.warning(f"查询本地URL索引失败: {str(e)}，本批去重交给数据库唯一索引")
             return set()
     
+    @traced()
+    async def find_existing_urls(self, normalized_urls: List[str]) -> set:
+        """
+        查询哪些标准化URL已在 play_raw_news 中（基于本地URL索引，无网络往返）
+        
+        Args:
+            normalized_urls: 标准化后的URL列表
+            
+        Returns:
+            已存在标准化URL的集合（索引不可用时为空集合）
+        """
+        return await self._check_existing_urls(normalized_urls)
+    
+    async def _upsert_raw_news(self, records: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        以 normalized_url 为冲突键写入（已存在的记录被忽略，并发运行也不会重复插入）
+        
+        Args:
+            records: 带 normalized_url 的记录列表
+            
+        Returns:
+            实际插入的记录（包含自动生成的id）
+        """
+        response = await asyncio.to_thread(
+            lambda: self.client.table('play_raw_news')
+            .upsert(records, on_conflict='normalized_url', ignore_duplicates=True)
+            .execute()
+        )
+        # 成功返回后，无论是新插入还是被忽略的重复，这些URL都已在数据库中
+        self._remember_urls(records)
+        return response.data or []
+    
+    @traced()
     async def insert_raw_news(self, raw_news_list: List[Dict[str, Any]]) -> Tuple[int, List[Dict[str, Any]]]:
         """
         批量插入原始新闻到play_raw_news表
@@ -142,6 +321,7 @@ class DatabaseManager:
                 - language: 语言（默认'en'）
                 - raw_category: 原始分类标签（可选）
                 - status: 状态（默认'new'）
+                normalized_url 由URL自动计算，作为数据库去重键
                 
         Returns:
             元组 (插入数量, 插入的记录列表)，记录列表包含自动生成的id
@@ -166,23 +346,18 @@ class DatabaseManager:
                 if 'status' not in news:
                     news['status'] = 'new'
             
-            # 检查已存在的URL（数据库层去重）
-            # 标准化所有URL用于检查
-            normalized_urls = []
-            original_urls = []
+            # 计算标准化URL（数据库 normalized_url 唯一索引的去重键），同批内重复只保留一条
             normalized_to_news_map = {}
             for news in raw_news_list:
                 url = news.get('url', '')
                 if url:
                     normalized_url = self.data_cleaner.normalize_url(url)
                     if normalized_url:
-                        normalized_urls.append(normalized_url)
-                        original_urls.append(url)
-                        # 保存标准化URL到记录的映射
-                        normalized_to_news_map[normalized_url] = news
+                        news['normalized_url'] = normalized_url
+                        normalized_to_news_map.setdefault(normalized_url, news)
             
-            # 查询已存在的URL（基于标准化URL比较）
-            existing_normalized_urls = await self._check_existing_urls(normalized_urls, original_urls)
+            # 本地索引预过滤已存在的URL（减少写入量，无网络往返）
+            existing_normalized_urls = await self._check_existing_urls(list(normalized_to_news_map))
             
             # 过滤掉已存在的记录
             new_news_list = []
@@ -195,21 +370,19 @@ class DatabaseManager:
                     new_news_list.append(news)
             
             if skipped_count > 0:
-                logger.info(f"数据库层去重: 跳过 {skipped_count} 条已存在的记录，剩余 {len(new_news_list)} 条新记录")
+                logger.info(f"本地索引去重: 跳过 {skipped_count} 条已存在的记录，剩余 {len(new_news_list)} 条新记录")
             
             # 如果没有新记录，直接返回
             if not new_news_list:
                 logger.info("所有记录都已存在，无需插入")
                 return (0, [])
             
-            # 批量插入新记录（使用asyncio.to_thread包装同步调用）
-            response = await asyncio.to_thread(
-                lambda: self.client.table('play_raw_news').insert(new_news_list).execute()
-            )
+            # 批量写入：normalized_url 冲突的记录由数据库忽略，返回值只包含实际插入的记录
+            inserted_records = await self._upsert_raw_news(new_news_list)
+            inserted_count = len(inserted_records)
             
-            if response.data:
-                inserted_records = response.data
-                inserted_count = len(inserted_records)
+            if inserted_count < len(new_news_list):
+                logger.info(f"数据库层去重: 忽略 {len(new_news_list) - inserted_count} 条已存在的记录")
             
             logger.info(f"成功插入 {inserted_count} 条原始新闻")
             
@@ -238,22 +411,13 @@ class DatabaseManager:
                     if 'status' not in news:
                         news['status'] = 'new'
                     
-                    # 单条插入前也检查URL是否存在
-                    url = news.get('url', '')
-                    if url:
-                        normalized_url = self.data_cleaner.normalize_url(url)
-                        existing_urls = await self._check_existing_urls([normalized_url], [url])
-                        if normalized_url in existing_urls:
-                            logger.debug(f"单条插入跳过已存在的URL: {url[:100]}")
-                            continue
+                    if not news.get('normalized_url') and news.get('url'):
+                        news['normalized_url'] = self.data_cleaner.normalize_url(news['url']) or None
                     
-                    # 单条插入也使用异步包装
-                    single_response = await asyncio.to_thread(
-                        lambda: self.client.table('play_raw_news').insert(news).execute()
-                    )
-                    if single_response.data:
-                        inserted_records.extend(single_response.data)
-                    inserted_count += 1
+                    # 单条写入同样以 normalized_url 为冲突键，已存在的记录被忽略
+                    single_inserted = await self._upsert_raw_news([news])
+                    inserted_records.extend(single_inserted)
+                    inserted_count += len(single_inserted)
                 except Exception as single_error:
                     error_info = {
                         'url': news.get('url', 'unknown'),
@@ -267,6 +431,7 @@ class DatabaseManager:
         
         return (inserted_count, inserted_records)
     
+    @traced()
     async def get_recent_raw_news(
         self,
         days: int = 7,
@@ -311,6 +476,7 @@ class DatabaseManager:
             logger.error(f"查询最近原始新闻失败: {str(e)}", exc_info=True)
             return []
     
+    @traced()
     async def log_task(
         self,
         task_type: str,
@@ -367,6 +533,7 @@ class DatabaseManager:
             logger.error(f"记录任务日志失败: {str(e)}", exc_info=True)
             return ""
     
+    @traced()
     async def update_task_log(
         self,
         task_id: str,
@@ -0,0 +1,116 @@
+"""
+本地URL去重索引
+将 play_raw_news 中已存在的标准化URL哈希保存在本地SQLite中，
+插入前先查本地索引，避免每次都对数据库发起分批 IN 查询
+"""
+import hashlib
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Iterable, List, Optional, Set
+
+
+def url_hash(normalized_url: str) -> bytes:
+    """
+    计算标准化URL的哈希（16字节，足以避免碰撞且索引紧凑）
+
+    Args:
+        normalized_url: 标准化后的URL
+
+    Returns:
+        哈希字节串
+    """
+    return hashlib.blake2b(normalized_url.encode('utf-8'), digest_size=16).digest()
+
+
+class UrlSeenIndex:
+    """
+    基于SQLite的标准化URL哈希集合
+
+    - seen 表保存URL哈希（主键，O(1)查找）
+    - meta 表保存增量同步水位（最后同步到的 crawl_time）与上次全量对账时间
+    """
+
+    _LOOKUP_CHUNK = 500  # 单条SQL中的参数个数上限（SQLite默认上限999）
+
+    def __init__(self, path: Path):
+        """
+        初始化索引（文件不存在时自动创建）
+
+        Args:
+            path: SQLite文件路径
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("CREATE TABLE IF NOT EXISTS seen (hash BLOB PRIMARY KEY) WITHOUT ROWID")
+            self._conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM seen").fetchone()[0]
+
+    def contains_many(self, normalized_urls: List[str]) -> Set[str]:
+        """
+        批量查询哪些标准化URL已在索引中
+
+        Args:
+            normalized_urls: 标准化URL列表
+
+        Returns:
+            已存在的标准化URL集合
+        """
+        by_hash = {url_hash(url): url for url in normalized_urls if url}
+        hashes = list(by_hash)
+        found: Set[str] = set()
+        with self._lock:
+            for i in range(0, len(hashes), self._LOOKUP_CHUNK):
+                chunk = hashes[i:i + self._LOOKUP_CHUNK]
+                placeholders = ",".join("?" * len(chunk))
+                rows = self._conn.execute(f"SELECT hash FROM seen WHERE hash IN ({placeholders})", chunk)
+                found.update(by_hash[row[0]] for row in rows)
+        return found
+
+    def add_many(self, normalized_urls: Iterable[str]) -> None:
+        """
+        将标准化URL加入索引
+
+        Args:
+            normalized_urls: 标准化URL
+        """
+        rows = [(url_hash(url),) for url in normalized_urls if url]
+        if not rows:
+            return
+        with self._lock, self._conn:
+            self._conn.executemany("INSERT OR IGNORE INTO seen (hash) VALUES (?)", rows)
+
+    def replace_all(self, normalized_urls: Iterable[str]) -> None:
+        """
+        用数据库全量结果替换索引（对账：清除数据库中已删除的URL）
+
+        Args:
+            normalized_urls: 数据库中全部标准化URL
+        """
+        rows = [(url_hash(url),) for url in normalized_urls if url]
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM seen")
+            self._conn.executemany("INSERT OR IGNORE INTO seen (hash) VALUES (?)", rows)
+
+    def get_meta(self, key: str) -> Optional[str]:
+        """读取元数据"""
+        with self._lock:
+            row = self._conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def set_meta(self, key: str, value: str) -> None:
+        """写入元数据"""
+        with self._lock, self._conn:
+            self._conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, value))
+
+    def close(self) -> None:
+        """关闭SQLite连接"""
+        with self._lock:
+            self._conn.close()
@@ -3,20 +3,36 @@
 协调所有采集器，执行采集任务（配置驱动）
 """
 import asyncio
+import time
+from datetime import datetime
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Set
 
 from config.settings import settings
 from database.supabase_client import db_manager
-from scrapers.newsbreak_scraper import NewsbreakScraper
-from scrapers.patch_scraper import PatchScraper
+from scrapers.newsbreak_scraper import NewsbreakScraper, category_flight, category_path_stats
+from scrapers.patch_scraper import PatchScraper, town_flight
 from scrapers.realtor_scraper import RealtorScraper
+from scrapers.real_estate_scraper import listing_path_stats
 from scrapers.redfin_scraper import RedfinScraper
 from scrapers.nar_scraper import NARScraper
 from scrapers.freddiemac_scraper import FreddieMacScraper
+from scrapers.browser_pool import browser_pool
 from utils.data_cleaner import DataCleaner
+from utils.date_engine import date_engine
 from utils.json_exporter import JSONExporter
 from utils.dify_client import dify_client
+from utils.http_fetcher import http_fetcher
+from utils.content_extractor import content_extractor
+from utils.content_cache import content_cache
+from utils.concurrency import ConcurrencyLimiter, DomainRateLimiter, host_of
+from utils.raw_news_stream import RawNewsStream
+from utils.prefetch_dedupe import PrefetchDeduper
+from utils.har_archive import har_archive, replay_database
+from utils.resolution_cache import flush_resolution_caches
+from utils.resource_blocking import resource_blocker
+from utils.wait_strategy import wait_stats
+from utils.tracing import traced, tracer
 from utils.logger import logger
 from notifications.notification_service import NotificationService
 from scheduler.scheduler_manager import SchedulerManager
@@ -41,6 +57,24 @@ class ScraperCoordinator:
         self.json_exporter = JSONExporter()
         self.notification_service = NotificationService()
         self.sources_cache: List[Dict[str, Any]] = []
+        # 并发与限速（全局/信号源/域名三级并发上限 + 按域名令牌桶，替代固定sleep）
+        self.concurrency_limiter = ConcurrencyLimiter()
+        self.rate_limiter = DomainRateLimiter()
+        # 进行中的采集任务数：调度器中不同信号源的任务可能同时运行，
+        # 进程级共享的连接池/进程池只在最后一个任务结束时关闭
+        self._active_runs = 0
+    
+    @property
+    def _db(self):
+        """数据库访问：HAR回放模式下使用 dry-run 写入端（输入来自录制快照，不写任务日志、不入库）"""
+        return replay_database if har_archive.mode == "replay" else db_manager
+    
+    async def close_shared_resources(self):
+        """关闭进程级共享的连接池与进程池（下次使用时会重新创建）"""
+        await dify_client.close()
+        await http_fetcher.close()
+        # 不等待工作进程退出，避免阻塞事件循环（此时没有排队中的任务）
+        content_extractor.shutdown(wait=False)
     
     async def load_sources_from_db(self) -> List[Dict[str, Any]]:
         """
@@ -50,7 +84,8 @@ class ScraperCoordinator:
             信号源配置列表
         """
         try:
-            sources = await db_manager.get_active_sources()
+            sources = await self._db.get_active_sources()
+            await har_archive.save_snapshot("sources", sources)
             self.sources_cache = sources
             logger.info(f"从数据库加载了 {len(sources)} 个激活的信号源")
             return sources
@@ -108,52 +143,24 @@ class ScraperCoordinator:
         
         return True, None
     
-    def _deduplicate_raw_news(self, raw_news_list: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def _dedupe_key(self, raw_news: Dict[str, Any]) -> str:
         """
-        基于URL去重原始新闻列表
+        运行内去重键：标准化后的URL
         
-        使用URL标准化函数处理URL，确保相同内容的不同URL格式能被识别为重复。
-        保留第一次出现的记录。
+        使用URL标准化函数处理URL，确保相同内容的不同URL格式能被识别为重复，
+        流式管道保留第一次出现的记录。
         
         Args:
-            raw_news_list: 原始新闻列表
+            raw_news: 原始新闻数据字典
             
         Returns:
-            去重后的新闻列表
+            标准化URL；没有URL时返回空字符串（记录保留，不参与去重）
         """
-        if not raw_news_list:
-            return []
-        
-        original_count = len(raw_news_list)
-        seen_urls = set()
-        deduplicated = []
-        
-        for news in raw_news_list:
-            url = news.get('url', '')
-            if not url:
-                # 如果没有URL，保留记录（但记录警告）
-                logger.warning(f"发现没有URL的记录，保留: {news.get('title', 'unknown')[:50]}")
-                deduplicated.append(news)
-                continue
-            
-            # 标准化URL
-            normalized_url = self.data_cleaner.normalize_url(url)
-            
-            if normalized_url and normalized_url not in seen_urls:
-                seen_urls.add(normalized_url)
-                deduplicated.append(news)
-            else:
-                logger.debug(f"发现重复URL，已跳过: {url[:100]}")
-        
-        deduplicated_count = len(deduplicated)
-        removed_count = original_count - deduplicated_count
-        
-        if removed_count > 0:
-            logger.info(f"主流程去重完成: {original_count} -> {deduplicated_count} 条记录（移除 {removed_count} 条重复）")
-        else:
-            logger.debug(f"主流程去重: {original_count} 条记录，无重复")
-        
-        return deduplicated
+        url = raw_news.get('url', '')
+        if not url:
+            logger.warning(f"发现没有URL的记录，保留: {raw_news.get('title', 'unknown')[:50]}")
+            return ''
+        return self.data_cleaner.normalize_url(url) or ''
     
     def _group_by_zipcode(self, records: List[Dict[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
         """
@@ -184,13 +191,109 @@ class ScraperCoordinator:
         
         return groups
     
-    async def _process_dify_review(self, inserted_records: List[Dict[str, Any]]) -> None:
+    async def _review_record(
+        self,
+        zipcode_display: str,
+        record: Dict[str, Any],
+        stats: Dict[str, int]
+    ) -> bool:
         """
-        按zipcode分组，每组顺序调用Dify工作流接口进行审核
+        调用Dify工作流审核单条记录
+        
+        Args:
+            zipcode_display: zipcode组显示名（日志用）
+            record: 插入数据库的记录（包含id）
+            stats: 审核统计（processed/approved/failed，原地累加）
+            
+        Returns:
+            是否通过审核
+        """
+        record_id = record.get('id')
+        if not record_id:
+            logger.warning(f"记录缺少id字段，跳过: {record}")
+            return False
+        
+        try:
+            # 调用Dify工作流
+            response = await dify_client.run_workflow(record_id)
+        except Exception as e:
+            logger.error(f"处理Dify审核时发生异常: zipcode={zipcode_display}, record_id={record_id}, error={str(e)}", exc_info=True)
+            stats['failed'] += 1
+            stats['processed'] += 1
+            return False
+        
+        stats['processed'] += 1
+        if dify_client.is_approved(response):
+            logger.info(f"记录已通过审核: zipcode={zipcode_display}, record_id={record_id}")
+            return True
+        
+        # 未通过或调用失败
+        if "error" in response:
+            logger.warning(f"Dify调用失败: zipcode={zipcode_display}, record_id={record_id}, error={response.get('error')}")
+            stats['failed'] += 1
+        else:
+            logger.debug(f"记录未通过审核: zipcode={zipcode_display}, record_id={record_id}, status={response.get('status')}")
+        return False
+    
+    async def _review_group(
+        self,
+        zipcode_display: str,
+        records: List[Dict[str, Any]],
+        stats: Dict[str, int]
+    ) -> bool:
+        """
+        审核一个zipcode组，任一记录通过即停止
+        
+        DIFY_SPECULATIVE_K 为 1 时逐条顺序调用；大于 1 时每轮同时提交 K 条，
+        任一通过即取消本轮其余调用，否则继续下一轮。
+        
+        Args:
+            zipcode_display: zipcode组显示名（日志用）
+            records: 组内记录（按入库顺序）
+            stats: 审核统计
+            
+        Returns:
+            该组是否通过审核
+        """
+        k = settings.dify_speculative_k
+        
+        for start in range(0, len(records), k):
+            window = records[start:start + k]
+            tasks = [
+                asyncio.create_task(self._review_record(zipcode_display, record, stats))
+                for record in window
+            ]
+            try:
+                for next_done in asyncio.as_completed(tasks):
+                    if await next_done:
+                        remaining = len(records) - start - len(window) + sum(not t.done() for t in tasks)
+                        logger.info(f"zipcode组 {zipcode_display} 已通过审核，停止处理该组剩余 {remaining} 条记录")
+                        return True
+            finally:
+                for task in tasks:
+                    if not task.done():
+                        task.cancel()
+        
+        return False
+    
+    async def _process_dify_review(
+        self,
+        inserted_records: List[Dict[str, Any]],
+        approved_groups: Optional[Set[str]] = None
+    ) -> None:
+        """
+        按zipcode分组调用Dify工作流接口进行审核
+        
+        多个zipcode组并发审核（DIFY_REVIEW_CONCURRENCY），组内顺序或推测并行（DIFY_SPECULATIVE_K）。
         
         Args:
             inserted_records: 插入数据库的记录列表（包含id和zip_code）
+            approved_groups: 已通过审核的zipcode组（跨批次共享，已通过的组直接跳过，
+                本批新通过的组会加入该集合）
         """
+        if approved_groups is None:
+            approved_groups = set()
+        
         if not inserted_records:
             logger.info("没有需要审核的记录")
             return
@@ -199,58 +302,31 @@ class ScraperCoordinator:
         groups = self._group_by_zipcode(inserted_records)
         logger.info(f"按zipcode分组完成，共 {len(groups)} 组")
         
-        total_processed = 0
-        total_approved = 0
-        total_failed = 0
+        stats = {'processed': 0, 'approved': 0, 'failed': 0}
+        semaphore = asyncio.Semaphore(settings.dify_review_concurrency)
         
-        # 遍历每个zipcode组
-        for zipcode, records in groups.items():
+        async def _process_group(zipcode: str, records: List[Dict[str, Any]]):
             zipcode_display = "(空)" if zipcode == "__empty__" else zipcode
-            logger.info(f"开始处理zipcode组: {zipcode_display}，共 {len(records)} 条记录")
-            
-            group_approved = False
-            
-            # 每组内按顺序调用Dify接口
-            for i, record in enumerate(records, 1):
-                record_id = record.get('id')
-                if not record_id:
-                    logger.warning(f"记录缺少id字段，跳过: {record}")
-                    continue
-                
-                logger.debug(f"调用Dify接口: zipcode={zipcode_display}, record_id={record_id} ({i}/{len(records)})")
-                
-                try:
-                    # 调用Dify工作流
-                    response = await dify_client.run_workflow(record_id)
-                    
-                    # 检查是否通过
-                    if dify_client.is_approved(response):
-                        logger.info(f"记录已通过审核: zipcode={zipcode_display}, record_id={record_id}")
-                        total_approved += 1
-                        group_approved = True
-                        # 该组已通过，停止处理后续记录
-                        logger.info(f"zipcode组 {zipcode_display} 已通过审核，停止处理该组剩余 {len(records) - i} 条记录")
-                        break
-                    else:
-                        # 未通过或调用失败
-                        if "error" in response:
-                            logger.warning(f"Dify调用失败: zipcode={zipcode_display}, record_id={record_id}, error={response.get('error')}")
-                            total_failed += 1
-                        else:
-                            logger.debug(f"记录未通过审核: zipcode={zipcode_display}, record_id={record_id}, status={response.get('status')}")
-                    
-                    total_processed += 1
-                    
-                except Exception as e:
-                    logger.error(f"处理Dify审核时发生异常: zipcode={zipcode_display}, record_id={record_id}, error={str(e)}", exc_info=True)
-                    total_failed += 1
-                    total_processed += 1
-                    # 继续处理下一条，不中断整组
-            
-            if not group_approved:
-                logger.info(f"zipcode组 {zipcode_display} 处理完成，未通过审核")
+            if zipcode in approved_groups:
+                logger.debug(f"zipcode组 {zipcode_display} 已在之前的批次通过审核，跳过 {len(records)} 条记录")
+                return
+            async with semaphore:
+                logger.info(f"开始处理zipcode组: {zipcode_display}，共 {len(records)} 条记录")
+                if await self._review_group(zipcode_display, records, stats):
+                    stats['approved'] += 1
+                    approved_groups.add(zipcode)
+                else:
+                    logger.info(f"zipcode组 {zipcode_display} 处理完成，未通过审核")
+        
+        results = await asyncio.gather(
+            *[_process_group(zipcode, records) for zipcode, records in groups.items()],
+            return_exceptions=True
+        )
+        for zipcode, result in zip(groups, results):
+            if isinstance(result, Exception):
+                logger.error(f"zipcode组 {zipcode} 审核异常: {str(result)}", exc_info=result)
         
-        logger.info(f"Dify审核流程完成: 总处理={total_processed}, 通过={total_approved}, 失败={total_failed}")
+        logger.info(f"Dify审核流程完成: 总处理={stats['processed']}, 通过={stats['approved']}, 失败={stats['failed']}")
     
     def _extract_raw_category(self, article: Dict[str, Any]) -> Optional[str]:
         """
@@ -282,12 +358,16 @@ class ScraperCoordinator:
         Returns:
             Zipcode 列表；异常或无数据时返回 []。
         """
-        return await db_manager.get_zipcodes_from_magnet()
+        zipcodes = await self._db.get_zipcodes_from_magnet()
+        await har_archive.save_snapshot("zipcodes", zipcodes)
+        return zipcodes
     
+    @traced()
     async def scrape_source(
         self,
         source_config: Dict[str, Any],
-        zipcode: Optional[str] = None
+        zipcode: Optional[str] = None,
+        deduper: Optional[PrefetchDeduper] = None
     ) -> List[dict]:
         """
         采集指定信号源的新闻
@@ -295,6 +375,7 @@ class ScraperCoordinator:
         Args:
             source_config: 信号源配置
             zipcode: 邮政编码（仅局部新闻需要）
+            deduper: 抓取正文前的去重器（一次采集任务共用；不提供时只按数据库去重）
             
         Returns:
             原始新闻列表
@@ -314,7 +395,7 @@ class ScraperCoordinator:
                 return []
             
             # 记录任务开始
-            task_log_id = await db_manager.log_task(
+            task_log_id = await self._db.log_task(
                 task_type="local_news" if zipcode else "real_estate",
                 status="running",
                 source_id=source_id,
@@ -324,28 +405,38 @@ class ScraperCoordinator:
             
             # 执行采集（添加超时控制，防止单个源阻塞太久）
             try:
-                if zipcode:
-                    # 局部新闻采集
-                    articles = await asyncio.wait_for(
-                        scraper.scrape(zipcode=zipcode, limit=10),
-                        timeout=300  # 5分钟超时
-                    )
-                else:
-                    # 房地产新闻采集
-                    articles = await asyncio.wait_for(
-                        scraper.scrape(limit=20),
-                        timeout=300  # 5分钟超时
-                    )
+                async with tracer.span("scrape_source.scrape", source=source_name, zipcode=zipcode) as span:
+                    if zipcode:
+                        # 局部新闻采集
+                        articles = await asyncio.wait_for(
+                            scraper.scrape(zipcode=zipcode, limit=10),
+                            timeout=300  # 5分钟超时
+                        )
+                    else:
+                        # 房地产新闻采集
+                        articles = await asyncio.wait_for(
+                            scraper.scrape(limit=20),
+                            timeout=300  # 5分钟超时
+                        )
+                    span.set(articles=len(articles))
             except asyncio.TimeoutError:
                 logger.error(f"采集超时: {source_name} (ID: {source_id})")
                 articles = []
             
             if articles:
-                # 清洗数据
-                cleaned_articles = self.data_cleaner.clean_articles(articles)
+                # 清洗数据（CPU密集，放到线程中执行避免阻塞事件循环）
+                async with tracer.span("scrape_source.clean", source=source_name, articles=len(articles)):
+                    cleaned_articles = await asyncio.to_thread(self.data_cleaner.clean_articles, articles)
+                
+                # 抓取正文前去重：剔除本次运行已出现和已入库的URL，只为新文章抓取正文
+                if deduper is None:
+                    deduper = PrefetchDeduper(self._db.find_existing_urls)
+                async with tracer.span("scrape_source.dedupe", source=source_name, articles=len(cleaned_articles)):
+                    cleaned_articles = await deduper.filter_new(cleaned_articles)
                 
                 # 批量获取文章真实内容
-                cleaned_articles = await self._fetch_articles_content(cleaned_articles)
+                async with tracer.span("scrape_source.fetch_content", source=source_name, articles=len(cleaned_articles)):
+                    cleaned_articles = await self._fetch_articles_content(cleaned_articles)
                 
                 # 转换为play_raw_news格式并验证
                 for article in cleaned_articles:
@@ -355,7 +446,7 @@ class ScraperCoordinator:
                         'zip_code': zipcode if zipcode else article.get('zipcode') or article.get('zip_code'),  # 兼容zipcode和zip_code字段
                         'title': article.get('title', ''),
                         'content': article.get('content') or article.get('content_summary', ''),
-                        'publish_date': article.get('publish_date'),
+                        'publish_date': date_engine.isoformat(article.get('publish_date')),  # 入库前转为ISO字符串
                         'url': article.get('url', ''),
                         'language': article.get('language', 'en'),
                         'raw_category': self._extract_raw_category(article),
@@ -371,14 +462,14 @@ class ScraperCoordinator:
                     all_news.append(raw_news)
                 
                 # 更新任务日志
-                await db_manager.update_task_log(
+                await self._db.update_task_log(
                     task_log_id,
                     status="success",
                     articles_count=len(all_news),
                     source_id=source_id
                 )
             else:
-                await db_manager.update_task_log(
+                await self._db.update_task_log(
                     task_log_id,
                     status="success",
                     articles_count=0,
@@ -399,7 +490,7 @@ class ScraperCoordinator:
             
             # 更新任务日志
             try:
-                await db_manager.log_task(
+                await self._db.log_task(
                     task_type="local_news" if zipcode else "real_estate",
                     status="failed",
                     source_id=source_id,
@@ -412,6 +503,106 @@ class ScraperCoordinator:
         
         return all_news
     
+    async def _run_source_pipeline(
+        self,
+        source_config: Dict[str, Any],
+        zipcodes: List[str],
+        stream: RawNewsStream,
+        deduper: Optional[PrefetchDeduper] = None
+    ) -> int:
+        """
+        单个信号源的采集流水线
+        
+        房地产源直接采集一次；局部新闻源按zipcode有界并发扇出
+        （并发度由 ConcurrencyLimiter 控制，请求密度由按域名令牌桶控制）。
+        每个zipcode采集完成后立即推入流式入库管道，不在内存中累积。
+        
+        Args:
+            source_config: 信号源配置
+            zipcodes: zipcode列表（仅局部新闻源使用）
+            stream: 流式入库管道
+            deduper: 抓取正文前的去重器（所有信号源共用）
+            
+        Returns:
+            该信号源采集到的原始新闻条数
+        """
+        content_scope = source_config.get('content_scope')
+        source_name = source_config.get('source_name')
+        started_at = time.monotonic()
+        news_count = 0
+        
+        logger.info(f"处理信号源: {source_name} (ID: {source_config.get('id')})")
+        
+        async def _scrape_and_stream(zipcode: Optional[str] = None) -> int:
+            raw_news = await self._scrape_source_limited(source_config, zipcode=zipcode, deduper=deduper)
+            await stream.put(raw_news)
+            return len(raw_news)
+        
+        if content_scope in ['real_estate', 'housing']:
+            # 房地产新闻，不需要zipcode
+            news_count = await _scrape_and_stream()
+            
+        elif content_scope == 'local_business':
+            # 局部新闻，需要zipcode
+            if not zipcodes:
+                logger.warning(f"局部新闻源 {source_name} 需要zipcode，但magnet中无zip_code")
+                return 0
+            
+            results = await asyncio.gather(
+                *[_scrape_and_stream(zipcode) for zipcode in zipcodes],
+                return_exceptions=True
+            )
+            for zipcode, result in zip(zipcodes, results):
+                if isinstance(result, Exception):
+                    logger.error(f"Zipcode {zipcode} 采集异常 ({source_name}): {str(result)}")
+                    continue
+                news_count += result
+        else:
+            logger.warning(f"未知的内容范围 {content_scope}，跳过信号源: {source_name}")
+        
+        logger.info(
+            f"信号源 {source_name} 流水线完成: {news_count} 条原始新闻，"
+            f"耗时 {time.monotonic() - started_at:.1f}s"
+        )
+        return news_count
+    
+    def _source_host(self, source_config: Dict[str, Any]) -> str:
+        """
+        获取信号源的目标域名（用于按域名限并发/限速）
+        
+        Args:
+            source_config: 信号源配置
+            
+        Returns:
+            域名；没有entry_url时退化为信号源名称
+        """
+        return host_of(source_config.get('entry_url') or '') or str(source_config.get('source_name', 'unknown'))
+    
+    async def _scrape_source_limited(
+        self,
+        source_config: Dict[str, Any],
+        zipcode: Optional[str] = None,
+        deduper: Optional[PrefetchDeduper] = None
+    ) -> List[dict]:
+        """
+        在并发与限速约束下执行 scrape_source
+        
+        Args:
+            source_config: 信号源配置
+            zipcode: 邮政编码（仅局部新闻需要）
+            deduper: 抓取正文前的去重器
+            
+        Returns:
+            原始新闻列表
+        """
+        source_name = str(source_config.get('source_name', 'unknown'))
+        host = self._source_host(source_config)
+        async with self.concurrency_limiter.slot(source_name, host):
+            await self.rate_limiter.acquire(host)
+            if zipcode:
+                logger.info(f"  处理Zipcode: {zipcode} ({source_name})")
+            return await self.scrape_source(source_config, zipcode=zipcode, deduper=deduper)
+    
     async def _fetch_articles_content(self, articles: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
         批量获取文章真实内容
@@ -427,8 +618,8 @@ class ScraperCoordinator:
         
         from utils.article_content_fetcher import fetch_article_content
         
-        # 创建信号量控制并发数（3个并发）
-        semaphore = asyncio.Semaphore(3)
+        # 控制单批并发数（连接复用与单域名上限由共享HTTP抓取层负责）
+        semaphore = asyncio.Semaphore(settings.content_fetch_concurrency)
         
         async def _fetch_content_for_article(article: Dict[str, Any]) -> Dict[str, Any]:
             """为单篇文章获取内容"""
@@ -481,8 +672,31 @@ class ScraperCoordinator:
         logger.info("=" * 50)
         logger.info("开始执行采集任务")
         logger.info("=" * 50)
+        if har_archive.active:
+            logger.info(
+                f"HAR {har_archive.mode} 模式：浏览器流量与文章正文{'录制到' if har_archive.mode == 'record' else '回放自'} {settings.har_dir}"
+                + ("（dry-run：不写数据库、不调用Dify）" if har_archive.mode == "replay" else "")
+            )
         
-        all_raw_news = []
+        stream: Optional[RawNewsStream] = None
+        self._active_runs += 1
+        if self._active_runs == 1:
+            # 没有并发任务时开始新一轮：清空上一轮保留的页面结果与统计
+            town_flight.reset()
+            category_flight.reset()
+            category_path_stats.reset()
+            listing_path_stats.reset()
+            NewsbreakScraper.reset_http_path()
+            wait_stats.reset()
+            har_archive.start_run()
+            resource_blocker.reset()
+            browser_pool.reset_stats()
+            http_fetcher.reset_stats()
+            content_cache.reset_stats()
+        # 本地URL索引需要全量对账时在后台进行，不阻塞入库
+        self._db.start_url_index_reconcile()
+        # 本次任务的分段计时：各span写入追踪文件，结束时输出 p50/p95 汇总
+        trace_run = tracer.start_run()
         
         try:
             # 1. 加载信号源配置
@@ -496,62 +710,47 @@ class ScraperCoordinator:
                 logger.warning("没有找到激活的信号源")
                 return
             
-            # 2. 加载 zipcode 列表（用于局部新闻，来自 Supabase 表 magnet）
-            zipcodes = await self.load_zipcodes()
+            # 2. 加载 zipcode 列表（用于局部新闻，来自 Supabase 表 magnet；没有局部新闻源时跳过）
+            zipcodes = []
+            if any(s.get('content_scope') == 'local_business' for s in sources):
+                zipcodes = await self.load_zipcodes()
+            
+            # 3. 启动流式入库管道：运行内去重 → 微批存储到数据库（play_raw_news表）
+            #    → Dify工作流审核（按zipcode分组，已通过的组跨批次跳过），同时按批次追加导出JSONL
+            approved_groups: Set[str] = set()
+            export_filename = f"raw_news_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}.jsonl"
+            #    （HAR回放模式下不入库、不调用Dify，只导出JSONL）
+            replaying = har_archive.mode == "replay"
+            stream = RawNewsStream(
+                insert_func=self._db.insert_raw_news,
+                key_func=self._dedupe_key,
+                on_flushed=lambda batch: self.json_exporter.append_jsonl(batch, export_filename),
+                on_inserted=None if replaying else (lambda records: self._process_dify_review(records, approved_groups))
+            )
+            await stream.start()
+            deduper = PrefetchDeduper(self._db.find_existing_urls)
+            
+            # 4. 每个信号源作为独立的异步流水线并行执行（各自的并发预算，全局上限按预算之和扩大），
+            #    结果在采集完成后立即进入流式管道，慢源不会拖慢其他源
+            self.concurrency_limiter.reserve(str(source.get('source_name', 'unknown')) for source in sources)
+            pipeline_results = await asyncio.gather(
+                *[self._run_source_pipeline(source, zipcodes, stream, deduper) for source in sources],
+                return_exceptions=True
+            )
+            for source, result in zip(sources, pipeline_results):
+                if isinstance(result, Exception):
+                    logger.error(f"信号源流水线异常 ({source.get('source_name')}): {str(result)}", exc_info=result)
             
-            # 3. 按内容范围分组处理
-            for source in sources:
-                content_scope = source.get('content_scope')
-                source_name = source.get('source_name')
-                
-                logger.info(f"处理信号源: {source_name} (ID: {source.get('id')})")
-                
-                if content_scope in ['real_estate', 'housing']:
-                    # 房地产新闻，不需要zipcode
-                    news = await self.scrape_source(source)
-                    all_raw_news.extend(news)
-                    await asyncio.sleep(2)  # 避免请求过快
-                    
-                elif content_scope == 'local_business':
-                    # 局部新闻，需要zipcode
-                    if not zipcodes:
-                        logger.warning(f"局部新闻源 {source_name} 需要zipcode，但magnet中无zip_code")
-                        continue
-                    
-                    for zipcode in zipcodes:
-                        logger.info(f"  处理Zipcode: {zipcode}")
-                        news = await self.scrape_source(source, zipcode=zipcode)
-                        all_raw_news.extend(news)
-                        await asyncio.sleep(2)  # 避免请求过快
-            
-            # 3.5. 主流程去重（合并所有scraper结果后）
-            if all_raw_news:
-                logger.info("=" * 50)
-                logger.info("开始主流程去重")
-                logger.info("=" * 50)
-                all_raw_news = self._deduplicate_raw_news(all_raw_news)
-            
-            # 4. 存储到数据库（play_raw_news表）
-            inserted_records = []
-            if all_raw_news:
-                logger.info(f"准备存储 {len(all_raw_news)} 条原始新闻到数据库")
-                inserted_count, inserted_records = await db_manager.insert_raw_news(all_raw_news)
-                logger.info(f"成功存储 {inserted_count} 条原始新闻")
-            else:
+            # 5. 刷出剩余批次并等待审核完成
+            stream_stats = await stream.close()
+            stream = None
+            deduper.log_stats()
+            if stream_stats['received'] == 0:
                 logger.warning("没有采集到任何新闻")
-            
-            # 4.5. Dify工作流审核（按zipcode分组）
-            if inserted_records:
-                logger.info("=" * 50)
-                logger.info("开始Dify工作流审核流程")
-                logger.info("=" * 50)
-                await self._process_dify_review(inserted_records)
-                logger.info("=" * 50)
-            
-            # 5. 导出JSON
-            if all_raw_news:
-                json_path = self.json_exporter.export_by_date_and_source(all_raw_news)
-                logger.info(f"JSON导出完成: {json_path}")
+            else:
+                logger.info(f"成功存储 {stream_stats['inserted']} 条原始新闻")
+                if stream_stats['flushed']:
+                    logger.info(f"JSON导出完成: {self.json_exporter.output_dir / export_filename}")
             
             logger.info("=" * 50)
             logger.info("采集任务完成")
@@ -564,6 +763,30 @@ class ScraperCoordinator:
                 error_message=str(e)
             )
             raise
+        finally:
+            # 异常退出时也刷出已采集的批次，避免丢失
+            if stream is not None:
+                await stream.close()
+            # 本次任务结束，回收浏览器池（仍被其他任务使用的浏览器会在其context关闭后回收）
+            browser_pool.log_stats()
+            await browser_pool.close()
+            town_flight.log_stats("Patch town页面")
+            category_flight.log_stats("Newsbreak 城市分类页面")
+            category_path_stats.log_stats()
+            listing_path_stats.log_stats()
+            resource_blocker.log_stats()
+            wait_stats.log_stats()
+            har_archive.log_stats()
+            http_fetcher.log_stats()
+            await flush_resolution_caches()
+            self._active_runs -= 1
+            if self._active_runs == 0:
+                # 没有其他进行中的任务时才关闭共享的会话与进程池，避免中断并发任务的请求和排队中的提取
+                await self.close_shared_resources()
+            if settings.content_cache_enabled:
+                await content_cache.prune()
+                content_cache.log_stats()
+            tracer.finish_run(trace_run)
 
 
 async def main():
@@ -604,6 +827,8 @@ async def main():
             except KeyboardInterrupt:
                 logger.info("收到停止信号，正在关闭...")
                 scheduler_manager.stop()
+            finally:
+                await coordinator.close_shared_resources()
         else:
             logger.warning("没有找到激活的信号源，无法启动调度器")
             # 手动触发一次
@@ -1,5 +1,6 @@
 """采集器模块"""
 from scrapers.base_scraper import BaseScraper
+from scrapers.browser_pool import BrowserPool, browser_pool
 from scrapers.local_news_scraper import LocalNewsScraper
 from scrapers.newsbreak_scraper import NewsbreakScraper
 from scrapers.patch_scraper import PatchScraper
@@ -11,6 +12,8 @@ from scrapers.freddiemac_scraper import FreddieMacScraper
 
 __all__ = [
     'BaseScraper',
+    'BrowserPool',
+    'browser_pool',
     'LocalNewsScraper',
     'NewsbreakScraper',
     'PatchScraper',
@@ -13,7 +13,12 @@ from fake_useragent import UserAgent
 from playwright.async_api import async_playwright, Browser, Page, Playwright
 
 from config.settings import settings
+from scrapers.browser_pool import browser_pool
+from utils.date_engine import date_engine
+from utils.har_archive import har_archive
 from utils.logger import logger
+from utils.resource_blocking import resource_blocker
+from utils.tracing import traced
 
 
 class BaseScraper(ABC):
@@ -33,6 +38,12 @@ class BaseScraper(ABC):
         self.context = None  # 保存context引用，防止被垃圾回收
         self._is_persistent_context = False  # 标志：是否使用 persistent context（如 Realtor.com）
         self._is_cleaning_up = False  # 标志：是否正在清理资源（用于区分正常关闭和意外断开）
+        self._use_browser_pool = False  # 标志：当前浏览器是否来自共享浏览器池（不由本采集器关闭）
+        self.har_scope: Optional[str] = None  # HAR录制/回放的分组（zipcode；房地产新闻为None）
+    
+    def _base_url(self, default: str) -> str:
+        """站点基础URL（SCRAPER_BASE_URL_OVERRIDES 可按采集源覆盖，如离线回放基准测试指向本地服务器）"""
+        return settings.scraper_base_url_overrides.get(self.source_name) or default
     
     async def _get_random_user_agent(self) -> str:
         """获取随机User-Agent"""
@@ -58,6 +69,19 @@ class BaseScraper(ABC):
         delay = random.uniform(min_delay, max_delay)
         await asyncio.sleep(delay)
     
+    def _parse_date(self, date_str: Optional[str]) -> datetime:
+        """
+        解析页面上的发布时间（共享日期引擎：ISO、相对时间如 "5h" / "2 days ago"、自然语言日期）
+        
+        Args:
+            date_str: 日期字符串
+            
+        Returns:
+            带时区的datetime；为空或无法解析时使用当前时间
+        """
+        return date_engine.parse(date_str) or date_engine.now()
+    
+    @traced()
     async def _setup_browser(self, headless: bool = True) -> Browser:
         """
         设置并启动浏览器
@@ -68,6 +92,16 @@ class BaseScraper(ABC):
         Returns:
             Browser实例
         """
+        # headless 采集优先使用共享浏览器池，避免每次采集都启动 Chromium
+        if headless and settings.browser_pool_enabled:
+            if self.browser and self._use_browser_pool and self.browser.is_connected():
+                return self.browser
+            self.browser = await browser_pool.acquire_browser()
+            self._use_browser_pool = True
+            self._is_persistent_context = False
+            logger.debug(f"{self.source_name}: 使用共享浏览器池中的浏览器")
+            return self.browser
+        
         # 如果浏览器已存在且未关闭，直接返回
         if self.browser:
             try:
@@ -117,6 +151,7 @@ class BaseScraper(ABC):
                         "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
                     },
                 )
+                await resource_blocker.apply(self.context, self.source_name)
                 # persistent context 没有单独的 browser.close() 入口，取其 browser 引用用于通用逻辑
                 self.browser = self.context.browser
                 self._is_persistent_context = True
@@ -205,6 +240,39 @@ class BaseScraper(ABC):
             self.browser = None
             raise
     
+    async def _build_context_options(self) -> Dict[str, Any]:
+        """
+        构建当前采集源的context画像（UA、viewport、locale、headers、timezone_id）
+        
+        Returns:
+            传给 browser.new_context 的参数字典
+        """
+        # 获取user agent
+        user_agent = await self._get_random_user_agent()
+        
+        # Realtor.com 强制 en-US 画像（locale/headers/timezone/UA 一致化）
+        locale = settings.realtor_locale if self.source_name == "Realtor.com" else "en-US"
+        extra_http_headers = {}
+        if self.source_name == 'Realtor.com':
+            # 为Realtor.com设置一致化的请求头（en-US）
+            extra_http_headers = {
+                'Accept-Language': settings.realtor_accept_language,
+                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8'
+            }
+        
+        # 构建context参数
+        context_kwargs = {
+            'user_agent': user_agent,
+            'viewport': {'width': 1920, 'height': 1080},
+            'locale': locale
+        }
+        if self.source_name == "Realtor.com":
+            context_kwargs["timezone_id"] = settings.realtor_timezone_id
+        if extra_http_headers:
+            context_kwargs['extra_http_headers'] = extra_http_headers
+        return context_kwargs
+    
+    @traced()
     async def _create_page(self) -> Page:
         """
         创建新页面并设置反爬虫策略
@@ -230,9 +298,10 @@ class BaseScraper(ABC):
                 except:
                     pass
                 try:
-                    if self.browser:
+                    # 池中的浏览器由浏览器池负责回收，这里只释放引用
+                    if self.browser and not self._use_browser_pool:
                         await self.browser.close()
-                        self.browser = None
+                    self.browser = None
                 except:
                     pass
                 await self._setup_browser()
@@ -268,36 +337,26 @@ class BaseScraper(ABC):
             except Exception as e:
                 raise Exception(f"浏览器在创建context前已断开: {str(e)}")
             
-            # 获取user agent
-            user_agent = await self._get_random_user_agent()
+            context_kwargs = await self._build_context_options()
+            # HAR_MODE=record 时录制该context的流量（persistent context 不录制）
+            context_kwargs.update(har_archive.context_options(self.source_name, self.har_scope))
             
-            # 创建context
-            # Realtor.com 强制 en-US 画像（locale/headers/timezone/UA 一致化）
-            locale = settings.realtor_locale if self.source_name == "Realtor.com" else "en-US"
-            extra_http_headers = {}
-            if self.source_name == 'Realtor.com':
-                # 为Realtor.com设置一致化的请求头（en-US）
-                extra_http_headers = {
-                    'Accept-Language': settings.realtor_accept_language,
-                    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8'
-                }
-            
-            # 构建context参数
-            context_kwargs = {
-                'user_agent': user_agent,
-                'viewport': {'width': 1920, 'height': 1080},
-                'locale': locale
-            }
-            if self.source_name == "Realtor.com":
-                context_kwargs["timezone_id"] = settings.realtor_timezone_id
-            if extra_http_headers:
-                context_kwargs['extra_http_headers'] = extra_http_headers
-            
-            self.context = await self.browser.new_context(**context_kwargs)
+            if self._use_browser_pool:
+                # 池可能因浏览器退役/断开而换用另一个浏览器，以context实际所属浏览器为准
+                self.context = await browser_pool.new_context(self.browser, **context_kwargs)
+                self.browser = self.context.browser
+            else:
+                self.context = await self.browser.new_context(**context_kwargs)
             
             if not self.context:
                 raise Exception("Context创建返回None")
             
+            # HAR_MODE=replay 时从录制回放（先于请求拦截注册：后注册的路由先匹配）
+            await har_archive.apply_replay(self.context, self.source_name, self.har_scope)
+            
+            # 按采集源策略拦截图片/字体/媒体与广告统计请求
+            await resource_blocker.apply(self.context, self.source_name)
+            
             # 处理对话框（alert/confirm/prompt）
             self.context.on("dialog", lambda dialog: dialog.accept())
             
@@ -382,7 +441,11 @@ class BaseScraper(ABC):
             
             # 然后关闭浏览器（这会触发disconnected事件，但我们已经设置了标志）
             # 注意：persistent context 的 browser 由 context 管理，通常不需要单独 close
-            if self.browser and not self._is_persistent_context:
+            # 共享浏览器池中的浏览器保持常驻，只释放引用
+            if self.browser and self._use_browser_pool:
+                self.browser = None
+                self._use_browser_pool = False
+            elif self.browser and not self._is_persistent_context:
                 try:
                     await self.browser.close()
                 except Exception as e:
@@ -419,7 +482,7 @@ class BaseScraper(ABC):
             - source: 来源名称（字符串）
             - title: 标题
             - url: 链接
-            - publish_date: 发布时间（ISO格式字符串）
+            - publish_date: 发布时间（带时区的datetime，入库时转为ISO字符串）
             - content: 完整内容（优先，如果无法获取完整内容则使用content_summary）
             - content_summary: 摘要（如果无法获取完整内容）
             - keywords: 关键词列表（可选）
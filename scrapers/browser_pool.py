@@ -0,0 +1,239 @@
+"""
+共享浏览器池
+在进程内保持 N 个常驻 Chromium，跨 scrape_source 调用复用，避免每次采集都启动/销毁浏览器
+"""
+import asyncio
+from typing import Any, Dict, List, Optional
+
+from playwright.async_api import async_playwright, Browser, BrowserContext, Playwright
+
+from config.settings import settings
+from utils.logger import logger
+
+
+class _PooledBrowser:
+    """池中单个浏览器的状态"""
+
+    def __init__(self, browser: Browser, index: int):
+        self.browser = browser
+        self.index = index
+        self.pages_opened = 0
+        self.active_contexts: List[BrowserContext] = []
+        self.retired = False  # 已退役：不再分配新context，context全部关闭后回收
+        self.closing = False  # 正在由池主动关闭（用于区分意外断开）
+
+    def is_healthy(self) -> bool:
+        """浏览器是否仍可用于分配新context"""
+        if self.retired or self.closing:
+            return False
+        try:
+            return self.browser.is_connected()
+        except Exception:
+            return False
+
+
+class BrowserPool:
+    """
+    进程级浏览器池
+
+    - 懒启动，最多保持 size 个 headless 浏览器
+    - 每次分配独立的 BrowserContext（按采集源画像设置 UA/locale/headers/timezone_id）
+    - 浏览器累计打开 max_pages 个页面或意外断开后回收
+    - 统计 launch / reuse / recycle 次数
+    """
+
+    def __init__(self, size: Optional[int] = None, max_pages: Optional[int] = None):
+        """
+        初始化浏览器池
+
+        Args:
+            size: 最大浏览器数量（默认使用配置）
+            max_pages: 单个浏览器回收前最多打开的页面数（默认使用配置，0表示不限制）
+        """
+        self._size = size
+        self._max_pages = max_pages
+        self._playwright: Optional[Playwright] = None
+        self._entries: List[_PooledBrowser] = []
+        self._context_owner: Dict[int, _PooledBrowser] = {}
+        self._lock: Optional[asyncio.Lock] = None
+        self._closing = False
+        self._next_index = 0
+        self.stats: Dict[str, int] = {
+            "launched": 0,
+            "reused": 0,
+            "recycled": 0,
+            "contexts": 0,
+        }
+
+    @property
+    def size(self) -> int:
+        return self._size or settings.browser_pool_size
+
+    @property
+    def max_pages(self) -> int:
+        return self._max_pages if self._max_pages is not None else settings.browser_pool_max_pages
+
+    def _get_lock(self) -> asyncio.Lock:
+        # 懒创建，确保绑定到当前运行的事件循环
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        return self._lock
+
+    async def _launch(self) -> _PooledBrowser:
+        """启动一个新的 headless 浏览器并加入池（调用方需持有锁）"""
+        if not self._playwright:
+            self._playwright = await async_playwright().start()
+            logger.debug("浏览器池: Playwright已启动")
+
+        browser = await self._playwright.chromium.launch(
+            headless=True,
+            args=[
+                '--disable-blink-features=AutomationControlled',
+                '--disable-dev-shm-usage',
+                '--no-sandbox',
+            ],
+            timeout=60000,
+        )
+        entry = _PooledBrowser(browser, self._next_index)
+        self._next_index += 1
+        browser.on("disconnected", lambda _browser: self._on_disconnected(entry))
+        self._entries.append(entry)
+        self.stats["launched"] += 1
+        logger.info(f"浏览器池: 启动浏览器 #{entry.index}（当前 {len(self._entries)}/{self.size}）")
+        return entry
+
+    async def _acquire_entry(self) -> _PooledBrowser:
+        """选择负载最低的健康浏览器，不足 size 个且都在忙时启动新浏览器"""
+        async with self._get_lock():
+            self._closing = False
+            healthy = [e for e in self._entries if e.is_healthy()]
+            if healthy:
+                least_loaded = min(healthy, key=lambda e: len(e.active_contexts))
+                if not least_loaded.active_contexts or len(healthy) >= self.size:
+                    self.stats["reused"] += 1
+                    return least_loaded
+            return await self._launch()
+
+    async def acquire_browser(self) -> Browser:
+        """
+        获取一个可用的浏览器（优先复用已启动的浏览器）
+
+        Returns:
+            Browser实例（由池持有，调用方不应直接关闭）
+        """
+        entry = await self._acquire_entry()
+        return entry.browser
+
+    async def new_context(self, browser: Optional[Browser] = None, **context_kwargs: Any) -> BrowserContext:
+        """
+        在池中浏览器上创建独立的 context
+
+        Args:
+            browser: 期望使用的浏览器（通常来自 acquire_browser）；已退役或断开时自动换一个
+            **context_kwargs: 传给 browser.new_context 的参数（UA/locale/headers/timezone_id 等）
+
+        Returns:
+            BrowserContext实例，调用方用完后直接 close() 即可归还
+        """
+        entry = next((e for e in self._entries if e.browser is browser), None)
+        if entry is None or not entry.is_healthy():
+            entry = await self._acquire_entry()
+
+        context = await entry.browser.new_context(**context_kwargs)
+        entry.active_contexts.append(context)
+        self._context_owner[id(context)] = entry
+        self.stats["contexts"] += 1
+        context.on("page", lambda _page: self._on_page_opened(entry))
+        context.on("close", lambda ctx: self._on_context_closed(ctx))
+        return context
+
+    def _on_page_opened(self, entry: _PooledBrowser):
+        """记录页面数，达到上限后退役该浏览器"""
+        entry.pages_opened += 1
+        if self.max_pages and entry.pages_opened >= self.max_pages and not entry.retired:
+            entry.retired = True
+            self.stats["recycled"] += 1
+            logger.info(f"浏览器池: 浏览器 #{entry.index} 已打开 {entry.pages_opened} 个页面，退役等待回收")
+
+    def _on_context_closed(self, context: BrowserContext):
+        """context关闭后归还；退役浏览器的context全部关闭时真正关闭浏览器"""
+        entry = self._context_owner.pop(id(context), None)
+        if entry is None:
+            return
+        if context in entry.active_contexts:
+            entry.active_contexts.remove(context)
+        if entry.retired and not entry.active_contexts and not entry.closing:
+            asyncio.ensure_future(self._close_entry(entry))
+
+    def _on_disconnected(self, entry: _PooledBrowser):
+        """浏览器断开：主动关闭时忽略，意外断开时移出池并计入回收"""
+        if entry.closing:
+            return
+        logger.warning(f"浏览器池: 浏览器 #{entry.index} 意外断开，已移出池")
+        entry.retired = True
+        entry.closing = True
+        self.stats["recycled"] += 1
+        if entry in self._entries:
+            self._entries.remove(entry)
+        for context in entry.active_contexts:
+            self._context_owner.pop(id(context), None)
+        entry.active_contexts.clear()
+
+    async def _close_entry(self, entry: _PooledBrowser):
+        """关闭并移除池中的浏览器"""
+        async with self._get_lock():
+            if entry.closing and entry not in self._entries:
+                return
+            entry.closing = True
+            if entry in self._entries:
+                self._entries.remove(entry)
+            try:
+                await entry.browser.close()
+            except Exception as e:
+                logger.debug(f"浏览器池: 关闭浏览器 #{entry.index} 失败: {str(e)}")
+            logger.debug(f"浏览器池: 浏览器 #{entry.index} 已回收（累计 {entry.pages_opened} 个页面）")
+            await self._stop_playwright_if_idle()
+
+    async def _stop_playwright_if_idle(self):
+        """池已关闭且没有浏览器时停止Playwright（调用方需持有锁）"""
+        if self._closing and not self._entries and self._playwright:
+            try:
+                await self._playwright.stop()
+            except Exception as e:
+                logger.debug(f"浏览器池: 停止Playwright失败: {str(e)}")
+            finally:
+                self._playwright = None
+
+    async def close(self):
+        """
+        关闭浏览器池
+        空闲浏览器立即关闭；仍有活动context的浏览器退役，待context全部关闭后回收。
+        关闭后再次获取浏览器会重新启动。
+        """
+        idle_entries = []
+        async with self._get_lock():
+            self._closing = True
+            for entry in self._entries:
+                entry.retired = True
+                if not entry.active_contexts:
+                    idle_entries.append(entry)
+            if not self._entries:
+                await self._stop_playwright_if_idle()
+        for entry in idle_entries:
+            await self._close_entry(entry)
+
+    def reset_stats(self):
+        """清零统计（每轮采集开始时调用，日志中的统计只反映本轮）"""
+        for key in self.stats:
+            self.stats[key] = 0
+
+    def log_stats(self):
+        """输出浏览器池统计"""
+        logger.info(
+            f"浏览器池统计: 启动={self.stats['launched']}, 复用={self.stats['reused']}, "
+            f"回收={self.stats['recycled']}, context={self.stats['contexts']}"
+        )
+
+
+# 全局浏览器池实例
+browser_pool = BrowserPool()
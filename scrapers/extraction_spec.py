@@ -0,0 +1,326 @@
+"""
+声明式列表页提取规格
+每个信号源用一份规格描述文章容器选择器与各字段的备选选择器，
+由注入页面的同一个JS函数一次性提取全部文章（一次 page.evaluate），
+取代逐容器、逐字段的 query_selector / inner_text / get_attribute / is_visible 往返；
+服务端渲染的列表页也可以不启动浏览器，直接按同一规格解析HTML文本
+"""
+import re
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+from bs4 import BeautifulSoup
+
+from utils.logger import logger
+
+
+@dataclass
+class FieldSpec:
+    """
+    字段提取规格
+
+    - attr 为 None：按顺序取第一个（可见且）文本非空的元素的文本
+    - attr 不为 None：取第一个（可见的）匹配元素的该属性；text_fallback=True 时属性为空则取其文本
+    """
+    selectors: List[str]
+    attr: Optional[str] = None
+    text_fallback: bool = False
+
+    def to_js(self) -> Dict[str, Any]:
+        return {"selectors": list(self.selectors), "attr": self.attr, "textFallback": self.text_fallback}
+
+
+@dataclass
+class ExtractionSpec:
+    """
+    列表页提取规格
+
+    - containers: 文章容器选择器（按优先级），取第一个匹配数量达到 min_count 的选择器
+    - fields: 字段名 → FieldSpec
+    - required: 必需字段，缺失时改用 fallback_fields 重新提取，仍缺失则丢弃该容器
+    - visible_only: 容器与字段元素是否要求可见（与 Playwright is_visible 一致）
+    - require_link: 容器内是否必须包含 a[href]
+    """
+    containers: List[str]
+    fields: Dict[str, FieldSpec]
+    required: Tuple[str, ...] = ("title", "url")
+    fallback_fields: Optional[Dict[str, FieldSpec]] = None
+    min_count: int = 3
+    visible_only: bool = True
+    require_link: bool = True
+
+    def to_js(self) -> Dict[str, Any]:
+        return {
+            "containers": list(self.containers),
+            "fields": {name: spec.to_js() for name, spec in self.fields.items()},
+            "required": list(self.required),
+            "fallbackFields": (
+                {name: spec.to_js() for name, spec in self.fallback_fields.items()}
+                if self.fallback_fields else None
+            ),
+            "minCount": self.min_count,
+            "visibleOnly": self.visible_only,
+            "requireLink": self.require_link,
+        }
+
+
+@dataclass
+class ListingResult:
+    """一次批量提取的结果"""
+    selector: Optional[str]
+    container_count: int
+    items: List[Dict[str, Optional[str]]] = field(default_factory=list)
+
+
+# 通用文章字段（各信号源特定选择器失败时的回退，与逐元素提取的通用选择器一致）
+GENERIC_ARTICLE_FIELDS: Dict[str, FieldSpec] = {
+    "title": FieldSpec([
+        "h1", "h2", "h3", "h4",
+        ".title", ".headline", ".article-title", ".post-title",
+        "[data-testid*='title']",
+        "a[href] > *:first-child",
+        "a.title", "a.headline"
+    ]),
+    "url": FieldSpec([
+        "a[href]",
+        "a.article-link",
+        "a[href*='/news']",
+        "a[href*='/article']",
+        "a[href*='/story']",
+        ".title a",
+        ".headline a"
+    ], attr="href"),
+    "publish_date": FieldSpec([
+        "time[datetime]",
+        "time",
+        ".date", ".publish-date", ".published-date",
+        "[datetime]",
+        ".timestamp",
+        "[data-testid*='date']",
+        ".meta time",
+        ".byline time"
+    ], attr="datetime", text_fallback=True),
+    "summary": FieldSpec([
+        ".summary", ".excerpt", ".description",
+        ".article-summary", ".post-excerpt",
+        "p:not(.title):not(.headline)",
+        ".snippet", ".preview"
+    ]),
+}
+
+GENERIC_ARTICLE_SPEC = ExtractionSpec(
+    containers=[
+        "article",
+        ".article-card",
+        ".news-item",
+        "[data-testid='article']",
+        ".card",
+        "div[class*='article']",
+        "div[class*='news']"
+    ],
+    fields=GENERIC_ARTICLE_FIELDS,
+)
+
+
+# 在页面内执行的提取函数：参数为 ExtractionSpec.to_js() 加上 maxContainers / limit
+_EXTRACT_LISTING_JS = """
+(spec) => {
+    const visible = (el) => {
+        if (!spec.visibleOnly) return true;
+        const rect = el.getBoundingClientRect();
+        return rect.width > 0 && rect.height > 0 && getComputedStyle(el).visibility !== 'hidden';
+    };
+    const textOf = (el) => (el.innerText || el.textContent || '').trim();
+    const pick = (root, field) => {
+        for (const selector of field.selectors) {
+            let el = null;
+            try { el = root.querySelector(selector); } catch (e) { continue; }
+            if (!el || !visible(el)) continue;
+            if (field.attr) {
+                const value = el.getAttribute(field.attr);
+                if (value) return value;
+                return field.textFallback ? (textOf(el) || null) : null;
+            }
+            const text = textOf(el);
+            if (text) return text;
+        }
+        return null;
+    };
+    const extract = (root, fields) => {
+        const values = {};
+        for (const [name, field] of Object.entries(fields)) values[name] = pick(root, field);
+        return values;
+    };
+    const complete = (values) => spec.required.every((name) => values[name]);
+
+    let containers = [];
+    let used = null;
+    for (const selector of spec.containers) {
+        let found = [];
+        try { found = Array.from(document.querySelectorAll(selector)); } catch (e) { continue; }
+        found = found.filter((el) => visible(el) && (!spec.requireLink || el.querySelector('a[href]')));
+        if (found.length > 0 && found.length >= spec.minCount) {
+            containers = found;
+            used = selector;
+            break;
+        }
+    }
+
+    const items = [];
+    const max = spec.maxContainers == null ? containers.length : spec.maxContainers;
+    for (const el of containers.slice(0, max)) {
+        let values = extract(el, spec.fields);
+        if (!complete(values) && spec.fallbackFields) values = extract(el, spec.fallbackFields);
+        if (!complete(values)) continue;
+        items.push(values);
+        if (spec.limit && items.length >= spec.limit) break;
+    }
+    return {selector: used, containerCount: containers.length, items: items};
+}
+"""
+
+
+async def extract_listing(
+    page,
+    spec: ExtractionSpec,
+    max_containers: Optional[int] = None,
+    limit: Optional[int] = None
+) -> Optional[ListingResult]:
+    """
+    在页面内一次性提取列表页全部文章
+
+    Args:
+        page: Playwright页面对象
+        spec: 提取规格
+        max_containers: 最多检查的容器数量
+        limit: 最多返回的文章数量（提取到足够数量即停止）
+
+    Returns:
+        ListingResult；页面执行失败（如页面已关闭）时返回None，调用方可回退到逐元素提取
+    """
+    args = spec.to_js()
+    args["maxContainers"] = max_containers
+    args["limit"] = limit
+    started = time.monotonic()
+    try:
+        raw = await page.evaluate(_EXTRACT_LISTING_JS, args)
+    except Exception as e:
+        logger.warning(f"批量提取列表页失败，回退逐元素提取: {str(e)[:200]}")
+        return None
+
+    result = ListingResult(
+        selector=raw.get("selector"),
+        container_count=raw.get("containerCount", 0),
+        items=raw.get("items") or [],
+    )
+    logger.debug(
+        f"批量提取列表页: 选择器={result.selector}, 容器={result.container_count}, "
+        f"文章={len(result.items)}, 耗时={(time.monotonic() - started) * 1000:.0f}ms"
+    )
+    return result
+
+
+_HIDDEN_STYLE = re.compile(r"(display\s*:\s*none|visibility\s*:\s*hidden)", re.IGNORECASE)
+_NON_RENDERED_TAGS = {"template", "noscript", "script", "style", "head"}
+
+
+def _statically_hidden(el) -> bool:
+    """HTML文本中可判断的不可见（hidden属性、内联 display:none / visibility:hidden、不渲染的父元素）"""
+    node = el
+    while node is not None and getattr(node, "name", None) and node.name != "[document]":
+        if node.name in _NON_RENDERED_TAGS or node.has_attr("hidden"):
+            return True
+        if _HIDDEN_STYLE.search(node.get("style", "")):
+            return True
+        node = node.parent
+    return False
+
+
+def _text_of(el) -> str:
+    return " ".join(el.get_text(" ", strip=True).split())
+
+
+def _select(root, selector: str, first: bool):
+    try:
+        return root.select_one(selector) if first else root.select(selector)
+    except Exception:
+        return None if first else []
+
+
+def _pick_from_html(root, field_spec: Dict[str, Any], visible_only: bool) -> Optional[str]:
+    for selector in field_spec["selectors"]:
+        el = _select(root, selector, first=True)
+        if el is None or (visible_only and _statically_hidden(el)):
+            continue
+        if field_spec["attr"]:
+            value = el.get(field_spec["attr"])
+            if value:
+                return value
+            return (_text_of(el) or None) if field_spec["textFallback"] else None
+        text = _text_of(el)
+        if text:
+            return text
+    return None
+
+
+def extract_listing_from_html(
+    html: str,
+    spec: ExtractionSpec,
+    max_containers: Optional[int] = None,
+    limit: Optional[int] = None
+) -> ListingResult:
+    """
+    不启动浏览器，按提取规格解析HTML文本中的列表页文章（与 extract_listing 的JS语义一致）
+
+    可见性只能按HTML文本判断（hidden属性、内联样式等），依赖CSS或脚本渲染的页面应回退到浏览器
+
+    Args:
+        html: 页面HTML
+        spec: 提取规格
+        max_containers: 最多检查的容器数量
+        limit: 最多返回的文章数量
+
+    Returns:
+        ListingResult
+    """
+    started = time.monotonic()
+    args = spec.to_js()
+    soup = BeautifulSoup(html or "", "lxml")
+
+    containers: List[Any] = []
+    used = None
+    for selector in spec.containers:
+        found = [
+            el for el in _select(soup, selector, first=False)
+            if not (spec.visible_only and _statically_hidden(el))
+            and (not spec.require_link or el.select_one("a[href]") is not None)
+        ]
+        if found and len(found) >= spec.min_count:
+            containers = found
+            used = selector
+            break
+
+    def extract(root, fields):
+        return {name: _pick_from_html(root, field_spec, spec.visible_only) for name, field_spec in fields.items()}
+
+    def complete(values):
+        return all(values.get(name) for name in spec.required)
+
+    items = []
+    for el in containers[:max_containers if max_containers is not None else len(containers)]:
+        values = extract(el, args["fields"])
+        if not complete(values) and args["fallbackFields"]:
+            values = extract(el, args["fallbackFields"])
+        if not complete(values):
+            continue
+        items.append(values)
+        if limit and len(items) >= limit:
+            break
+
+    result = ListingResult(selector=used, container_count=len(containers), items=items)
+    logger.debug(
+        f"解析列表页HTML: 选择器={result.selector}, 容器={result.container_count}, "
+        f"文章={len(result.items)}, 耗时={(time.monotonic() - started) * 1000:.0f}ms"
+    )
+    return result
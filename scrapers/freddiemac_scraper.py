@@ -3,21 +3,84 @@ Freddie Mac采集器
 采集房地产行业新闻
 """
 from typing import List, Dict, Any, Optional
-from datetime import datetime
 from scrapers.real_estate_scraper import RealEstateScraper
 from scrapers.robust_scraper_mixin import RobustScraperMixin
+from scrapers.extraction_spec import ExtractionSpec, FieldSpec, GENERIC_ARTICLE_FIELDS
 from utils.logger import logger
+from utils.wait_strategy import wait_for_any_selector
+from utils.tracing import traced
 
 
 class FreddieMacScraper(RealEstateScraper, RobustScraperMixin):
     """Freddie Mac新闻采集器"""
     
+    # 列表页提取规格：优先使用Drupal特定选择器，必需字段缺失时回退到通用字段
+    extraction_spec = ExtractionSpec(
+        containers=[
+            "article.node.node--type-nir-news",   # Drupal特定选择器
+            "article.node",                      # 更宽松的Drupal选择器
+            "article",
+            ".article-card",
+            ".news-item",
+            "[data-testid='article']",
+            ".press-release",
+            ".card",
+            "div[class*='article']",
+            "div[class*='press']"
+        ],
+        fields={
+            "title": FieldSpec([
+                "h3.nir-widget--news--headline > a",  # Drupal特定选择器
+                "h3.nir-widget--news--headline",      # 如果没有链接
+                "h1", "h2", "h3", "h4",              # 通用fallback
+                ".title", ".headline", ".article-title", ".post-title",
+                "[data-testid*='title']",
+                "a[href] > *:first-child",
+                "a.title", "a.headline"
+            ]),
+            "url": FieldSpec([
+                "h3.nir-widget--news--headline > a",  # Drupal标题链接
+                "a[href]",
+                "a.article-link",
+                "a[href*='/news']",
+                "a[href*='/article']",
+                "a[href*='/story']",
+                ".title a",
+                ".headline a"
+            ], attr="href"),
+            "publish_date": FieldSpec([
+                ".nir-widget--news--date-time.article-date",  # Drupal特定选择器
+                ".nir-widget--news--date-time",               # 更宽松的选择器
+                "time[datetime]",
+                "time",
+                ".date", ".publish-date", ".published-date",
+                "[datetime]",
+                ".timestamp",
+                "[data-testid*='date']",
+                ".meta time",
+                ".byline time"
+            ], attr="datetime", text_fallback=True),
+            "summary": FieldSpec([
+                ".nir-widget--news--teaser",      # Drupal特定选择器
+                ".summary", ".excerpt", ".description",
+                ".article-summary", ".post-excerpt",
+                "p:not(.title):not(.headline)",
+                ".snippet", ".preview"
+            ]),
+        },
+        fallback_fields=GENERIC_ARTICLE_FIELDS,
+    )
+    
+    # 列表页为服务端渲染，先直接解析HTML，文章太少才启动浏览器
+    http_listing = True
+    
     def __init__(self):
         super().__init__(
             "Freddie Mac",
             "https://freddiemac.gcs-web.com/?_gl=1*qtpff7*_gcl_au*MTY1ODc4ODI2MC4xNzY5NDkwOTAx*_ga*MTI2MTk2MjU0LjE3Njk0OTA5MDQ.*_ga_B5N0FKC09S*czE3Njk0OTA5MDQkbzEkZzEkdDE3Njk0OTA5MDQkajYwJGwwJGgw"
         )
     
+    @traced()
     async def _scrape_real_estate_news(self, limit: int = 20) -> List[Dict[str, Any]]:
         """采集Freddie Mac的房地产新闻"""
         articles = []
@@ -29,46 +92,25 @@ class FreddieMacScraper(RealEstateScraper, RobustScraperMixin):
             
             logger.debug(f"访问: {self.base_url}")
             
-            await page.goto(self.base_url, wait_until="networkidle", timeout=30000)
+            # 只等DOM加载，文章容器按条件等待（不再等待 networkidle：广告/统计请求会一直拖到超时）
+            await page.goto(self.base_url, wait_until="domcontentloaded", timeout=30000)
             await self._random_delay()
             
             # 使用多种备选选择器，优先使用Drupal特定选择器
-            article_selectors = [
-                "article.node.node--type-nir-news",   # Drupal特定选择器
-                "article.node",                      # 更宽松的Drupal选择器
-                "article",
-                ".article-card",
-                ".news-item",
-                "[data-testid='article']",
-                ".press-release",
-                ".card",
-                "div[class*='article']",
-                "div[class*='press']"
-            ]
+            article_selectors = self.extraction_spec.containers
             
-            # 尝试等待任一选择器
-            for selector in article_selectors:
-                try:
-                    await page.wait_for_selector(selector, timeout=5000)
-                    break
-                except Exception as e:
-                    logger.debug(f"等待选择器 {selector} 超时: {str(e)}")
-                    continue
+            # 等待任一选择器出现（一次轮询，取代逐个选择器串行等待）
+            await wait_for_any_selector(page, article_selectors, "freddiemac.articles", timeout=10)
             
-            # 使用robust方法查找元素
-            article_elements = await self.find_elements_with_fallback(page, article_selectors)
+            # 按提取规格一次性提取全部文章（单次 page.evaluate）
+            articles_data = await self.extract_articles_bulk(page, max_containers=limit)
             
-            logger.debug(f"找到 {len(article_elements)} 个文章元素")
+            logger.debug(f"提取到 {len(articles_data)} 篇文章")
             
-            for i, element in enumerate(article_elements[:limit]):
-                try:
-                    article = await self._extract_article_data(element)
-                    if article:
-                        articles.append(article)
-                        await self._random_delay(0.5, 1.5)
-                except Exception as e:
-                    logger.warning(f"提取第 {i+1} 篇文章失败: {str(e)}", exc_info=True)
-                    continue
+            for article_data in articles_data:
+                article = self._build_article(article_data)
+                if article:
+                    articles.append(article)
             
         except Exception as e:
             logger.error(f"Freddie Mac采集过程出错: {str(e)}", exc_info=True)
@@ -79,121 +121,9 @@ class FreddieMacScraper(RealEstateScraper, RobustScraperMixin):
         
         return articles
     
-    async def extract_article_data_robust(self, element, zipcode=None) -> Optional[Dict[str, Any]]:
-        """
-        使用Freddie Mac特定的Drupal选择器提取文章数据
-        优先使用Drupal框架的精确选择器，失败后回退到通用fallback
-        
-        Args:
-            element: 文章元素
-            zipcode: 邮政编码（可选，Freddie Mac不使用）
-            
-        Returns:
-            文章数据字典
-        """
+    def _build_article(self, article_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """将提取的字段转换为文章数据（补全URL、解析日期）"""
         try:
-            # 标题 - 优先使用Drupal选择器
-            title = await self.find_element_with_fallback(
-                element,
-                [
-                    "h3.nir-widget--news--headline > a",  # Drupal特定选择器
-                    "h3.nir-widget--news--headline",      # 如果没有链接
-                    "h1", "h2", "h3", "h4",              # 通用fallback
-                    ".title", ".headline", ".article-title", ".post-title",
-                    "[data-testid*='title']",
-                    "a[href] > *:first-child",
-                    "a.title", "a.headline"
-                ]
-            )
-            
-            # 链接 - 优先使用Drupal选择器
-            link_elem = await self.find_element_with_fallback(
-                element,
-                [
-                    "h3.nir-widget--news--headline > a",  # Drupal标题链接
-                    "a[href]",
-                    "a.article-link",
-                    "a[href*='/news']",
-                    "a[href*='/article']",
-                    "a[href*='/story']",
-                    ".title a",
-                    ".headline a"
-                ],
-                extract_text=False
-            )
-            
-            url = ""
-            if link_elem:
-                href = await link_elem.get_attribute("href")
-                if href:
-                    url = href
-            
-            # 日期 - 优先使用Drupal选择器
-            date_elem = await self.find_element_with_fallback(
-                element,
-                [
-                    ".nir-widget--news--date-time.article-date",  # Drupal特定选择器
-                    ".nir-widget--news--date-time",               # 更宽松的选择器
-                    "time[datetime]",
-                    "time",
-                    ".date", ".publish-date", ".published-date",
-                    "[datetime]",
-                    ".timestamp",
-                    "[data-testid*='date']",
-                    ".meta time",
-                    ".byline time"
-                ],
-                extract_text=False
-            )
-            
-            publish_date = None
-            if date_elem:
-                datetime_attr = await date_elem.get_attribute("datetime")
-                if datetime_attr:
-                    publish_date = datetime_attr
-                else:
-                    date_text = await date_elem.inner_text()
-                    if date_text:
-                        publish_date = date_text.strip()
-            
-            # 摘要 - 优先使用Drupal选择器
-            summary = await self.find_element_with_fallback(
-                element,
-                [
-                    ".nir-widget--news--teaser",      # Drupal特定选择器
-                    ".summary", ".excerpt", ".description",
-                    ".article-summary", ".post-excerpt",
-                    "p:not(.title):not(.headline)",
-                    ".snippet", ".preview"
-                ]
-            )
-            
-            # 验证必需字段
-            if not title or not url:
-                # 如果特定选择器失败，回退到通用方法
-                logger.debug("Freddie Mac特定选择器失败，回退到通用fallback")
-                return await super().extract_article_data_robust(element, zipcode)
-            
-            return {
-                "title": title,
-                "url": url,
-                "publish_date": publish_date or "",
-                "content": summary or "",
-                "content_summary": summary or "",
-                "keywords": [],
-                "zipcode": zipcode if zipcode else None
-            }
-            
-        except Exception as e:
-            logger.warning(f"Freddie Mac特定选择器提取失败: {str(e)}，回退到通用方法")
-            return await super().extract_article_data_robust(element, zipcode)
-    
-    async def _extract_article_data(self, element) -> Dict[str, Any]:
-        """从文章元素中提取数据（使用健壮的多选择器机制）"""
-        try:
-            # 使用robust mixin提取数据（现在会优先使用Freddie Mac特定选择器）
-            article_data = await self.extract_article_data_robust(element)
-            
             if not article_data:
                 return None
             
@@ -203,16 +133,7 @@ class FreddieMacScraper(RealEstateScraper, RobustScraperMixin):
                 url = f"https://freddiemac.gcs-web.com{url}" if url.startswith('/') else f"https://freddiemac.gcs-web.com/{url}"
             
             # 解析日期
-            publish_date = article_data.get('publish_date', '')
-            if publish_date:
-                try:
-                    from dateutil import parser
-                    publish_date = parser.parse(publish_date).isoformat()
-                except Exception as e:
-                    logger.debug(f"日期解析失败: {publish_date} - {str(e)}")
-                    publish_date = datetime.utcnow().isoformat()
-            else:
-                publish_date = datetime.utcnow().isoformat()
+            publish_date = self._parse_date(article_data.get('publish_date', ''))
             
             return {
                 "source": self.source_name,
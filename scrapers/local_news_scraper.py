@@ -5,6 +5,7 @@
 from typing import List, Dict, Any
 from scrapers.base_scraper import BaseScraper
 from utils.logger import logger
+from utils.tracing import traced
 
 
 class LocalNewsScraper(BaseScraper):
@@ -19,6 +20,7 @@ class LocalNewsScraper(BaseScraper):
         """
         super().__init__(source_name)
     
+    @traced()
     async def scrape(self, zipcode: str, limit: int = 10) -> List[Dict[str, Any]]:
         """
         采集指定Zipcode的局部新闻
@@ -31,6 +33,7 @@ class LocalNewsScraper(BaseScraper):
             文章列表
         """
         logger.info(f"{self.source_name}: 开始采集Zipcode {zipcode} 的新闻")
+        self.har_scope = zipcode
         
         try:
             articles = await self._scrape_zipcode_news(zipcode, limit)
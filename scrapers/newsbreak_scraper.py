@@ -3,20 +3,89 @@ Newsbreak采集器
 采集基于Zipcode的局部新闻
 """
 import asyncio
-import re
 import json
+from pathlib import Path
 from typing import List, Dict, Any, Optional
-from datetime import datetime, timedelta, timezone
+from datetime import timedelta
+from config.settings import settings
 from scrapers.local_news_scraper import LocalNewsScraper
 from scrapers.robust_scraper_mixin import RobustScraperMixin
+from scrapers.extraction_spec import ExtractionSpec, FieldSpec, extract_listing
+from utils.concurrency import SingleFlight
+from utils.date_engine import date_engine
+from utils.har_archive import har_archive
+from utils.http_fetcher import http_fetcher
 from utils.logger import logger
+from utils.next_data import extract_next_data, feed_from_next_data, match_news_link, news_links_by_slug
+from utils.path_stats import PathStats
+from utils.resolution_cache import ResolutionCache
+from utils.wait_strategy import count_matches, wait_for_any_selector, wait_for_new_matches
+from utils.tracing import traced
+
+# zipcode → 城市页面路径（如 '/beverly-hills-ca'）的持久化缓存，跨运行复用
+city_url_cache = ResolutionCache("newsbreak_city_url")
+
+# 城市分类页面（{city_url}-{category}）在一次运行中只采集一次：多个zipcode指向同一城市时共享结果
+category_flight = SingleFlight(result_ttl=3600)
+
+# 分类页面各采集路径的命中统计：http（HTTP读取JSON）/ page_json（浏览器页面JSON）/ dom / empty / failed
+category_path_stats = PathStats("Newsbreak 城市分类页面")
+
+# HTTP路径连续未命中（下载失败或没有 __NEXT_DATA__）达到该次数后，本轮采集不再尝试（如被反爬拦截）
+HTTP_PATH_MAX_CONSECUTIVE_MISSES = 3
+
+# locations页面自动完成的建议链接（href和aria-label都以/开头），按输入前后的数量变化判断建议是否出现
+CITY_SUGGESTION_SELECTOR = ", ".join([
+    "a[href^='/'][aria-label^='/']",
+    ".autocomplete__list-item a.autocomplete__btn",
+    ".autocomplete__list-item a",
+    "a.autocomplete__btn",
+    "[class*='autocomplete'] a"
+])
+
+# 自动完成下拉列表本身（用于确认"列表已渲染但没有建议项"，不包含宽泛的 div[class*='absolute']）
+CITY_SUGGESTION_LIST_SELECTORS = [
+    "div[class*='absolute'][class*='text-base']",
+    ".autocomplete__list",
+]
+
+# 分类列表页提取规格：容器取第一个有匹配的选择器，字段不要求可见（与逐容器提取一致）
+CATEGORY_LISTING_SPEC = ExtractionSpec(
+    containers=[
+        "section.my-1",
+        "section.my-1.md\\:my-2",
+        "div.flex.flex-col section",
+        "section[class*='my-']",
+        "article",
+        "div[class*='article']"
+    ],
+    fields={
+        "title": FieldSpec(["h3.text-xl"]),
+        "url": FieldSpec(['a[aria-label*="/"]'], attr="href"),
+        "summary": FieldSpec(["p.text-base.text-gray-light"]),
+        "time_text": FieldSpec(["div.text-gray-light.text-sm"]),
+    },
+    min_count=1,
+    visible_only=False,
+    require_link=False,
+)
 
 
 class NewsbreakScraper(LocalNewsScraper, RobustScraperMixin):
     """Newsbreak新闻采集器"""
     
+    # HTTP路径连续未命中次数（同一轮采集的各zipcode共享，每轮开始时由 reset_http_path 清零）
+    _http_consecutive_misses = 0
+
     def __init__(self):
         super().__init__("Newsbreak")
+        # 分类页面所在站点（可被 SCRAPER_BASE_URL_OVERRIDES 覆盖；文章URL始终使用正式站点）
+        self.site_url = self._base_url("https://www.newsbreak.com").rstrip('/')
+    
+    @classmethod
+    def reset_http_path(cls):
+        """新一轮采集开始时重新启用HTTP路径（上一轮连续未命中而停用的状态不延续到下一轮）"""
+        cls._http_consecutive_misses = 0
     
     async def _extract_json_data(self, page) -> Optional[Dict[str, Any]]:
         """
@@ -45,13 +114,10 @@ class NewsbreakScraper(LocalNewsScraper, RobustScraperMixin):
             next_data = json.loads(script_content)
             
             # 提取feed数据
-            if 'props' in next_data and 'pageProps' in next_data['props']:
-                page_props = next_data['props']['pageProps']
-                if 'feed' in page_props:
-                    feed = page_props['feed']
-                    if feed and len(feed) > 0:
-                        logger.debug(f"从JSON中提取到 {len(feed)} 篇文章")
-                        return {'feed': feed, 'next_data': next_data}
+            feed = feed_from_next_data(next_data)
+            if feed:
+                logger.debug(f"从JSON中提取到 {len(feed)} 篇文章")
+                return {'feed': feed, 'next_data': next_data}
             
             logger.debug("JSON中未找到feed数据")
             return None
@@ -63,6 +129,7 @@ class NewsbreakScraper(LocalNewsScraper, RobustScraperMixin):
             logger.warning(f"提取__NEXT_DATA__ JSON失败: {str(e)}")
             return None
     
+    @traced()
     async def _scrape_zipcode_news(self, zipcode: str, limit: int = 10) -> List[Dict[str, Any]]:
         """
         采集Newsbreak的Zipcode新闻
@@ -92,19 +159,23 @@ class NewsbreakScraper(LocalNewsScraper, RobustScraperMixin):
             if not page:
                 raise Exception("页面创建失败")
             
-            # Step 1: 访问locations页面并选择城市
-            city_url = await self._select_city_by_zipcode(page, zipcode)
+            # Step 1: 解析城市页面（缓存命中时跳过locations页面流程）
+            city_url = await self._resolve_city_url(page, zipcode)
             if not city_url:
                 logger.warning(f"{self.source_name}: 无法找到zipcode {zipcode} 对应的城市页面，跳过")
                 return []
             
             logger.info(f"{self.source_name}: 找到城市URL: {city_url}")
             
-            # Step 2: 并行采集三个分类（每个分类使用独立的页面）
+            # Step 2: 并行采集三个分类（每个分类使用独立的页面；同一城市的其他zipcode复用本次结果）
             categories = ['business', 'education', 'poi_housing']
             
             async def scrape_category_with_page(category: str):
-                """为每个分类创建独立页面并采集"""
+                """优先通过HTTP读取分类页面JSON；读取不到时为分类创建独立页面采集"""
+                http_articles = await self._scrape_category_via_http(city_url, category, zipcode, limit)
+                if http_articles:
+                    return http_articles
+                
                 category_page = None
                 try:
                     # 为每个分类创建新页面，避免并发冲突
@@ -121,8 +192,15 @@ class NewsbreakScraper(LocalNewsScraper, RobustScraperMixin):
                         except Exception:
                             pass
             
+            async def scrape_category_once(category: str):
+                """同一城市的分类页面只采集一次，结果复制后标记为当前zipcode"""
+                results = await category_flight.do(
+                    (city_url, category, limit), lambda: scrape_category_with_page(category)
+                )
+                return [dict(article, zipcode=zipcode) for article in results]
+            
             category_results = await asyncio.gather(
-                *[scrape_category_with_page(category) for category in categories],
+                *[scrape_category_once(category) for category in categories],
                 return_exceptions=True
             )
             
@@ -187,6 +265,31 @@ class NewsbreakScraper(LocalNewsScraper, RobustScraperMixin):
         except Exception:
             return False
     
+    @traced()
+    async def _resolve_city_url(self, page, zipcode: str) -> Optional[str]:
+        """
+        获取zipcode对应的城市URL：优先读取解析缓存，未命中时通过locations页面选择并写入缓存
+        
+        Args:
+            page: Playwright页面对象
+            zipcode: 邮政编码
+            
+        Returns:
+            城市URL（如 '/beverly-hills-ca'），如果没有对应城市返回None
+        """
+        found, city_url = city_url_cache.get(zipcode)
+        if found:
+            if city_url:
+                logger.info(f"{self.source_name}: 城市URL缓存命中: {zipcode} -> {city_url}")
+            else:
+                logger.info(f"{self.source_name}: zipcode {zipcode} 已确认无对应城市（负缓存），跳过")
+            return city_url
+        
+        city_url = await self._select_city_by_zipcode(page, zipcode)
+        if city_url:
+            city_url_cache.put(zipcode, city_url)
+        return city_url
+    
     async def _select_city_by_zipcode(self, page, zipcode: str) -> Optional[str]:
         """
         通过locations页面选择zipcode对应的城市
@@ -302,15 +405,16 @@ class NewsbreakScraper(LocalNewsScraper, RobustScraperMixin):
                     
                     # 尝试使用fill而不是type，避免触发某些检测机制
                     # 如果fill失败，再尝试type
+                    # 记录输入前页面上已有的同类链接数量
+                    suggestions_before = await count_matches(page, CITY_SUGGESTION_SELECTOR)
+                    
                     try:
                         await zipcode_input.fill(zipcode)
-                        await asyncio.sleep(2)  # 等待自动完成建议出现
                         logger.debug(f"{self.source_name}: 使用fill方法输入zipcode成功")
                     except Exception as fill_error:
                         logger.debug(f"{self.source_name}: fill方法失败，尝试type: {str(fill_error)[:50]}")
                         # 如果fill失败，尝试type
                         await zipcode_input.type(zipcode, delay=200)  # 更慢的输入速度
-                        await asyncio.sleep(2)  # 等待自动完成建议出现
                     
                     input_success = True
                     break
@@ -351,14 +455,21 @@ class NewsbreakScraper(LocalNewsScraper, RobustScraperMixin):
                 logger.error(f"{self.source_name}: 输入zipcode失败：经过 {max_input_retries + 1} 次尝试后仍无法输入")
                 return None
             
-            # 额外触发事件确保自动完成被触发
-            try:
-                await zipcode_input.evaluate("element => { element.dispatchEvent(new Event('input', { bubbles: true })); }")
-                await asyncio.sleep(0.5)
-                await zipcode_input.evaluate("element => { element.dispatchEvent(new KeyboardEvent('keyup', { bubbles: true, key: '0' })); }")
-                await asyncio.sleep(1)
-            except Exception as e:
-                logger.debug(f"{self.source_name}: 触发输入事件失败: {str(e)}")
+            # 等待自动完成建议出现（原固定等待：输入后2秒 + 触发事件后1.5秒）
+            suggestion_ready = await wait_for_new_matches(
+                page, CITY_SUGGESTION_SELECTOR, suggestions_before, "newsbreak.city_suggestions", timeout=3, baseline=3.5
+            )
+            
+            # 建议未出现时额外触发事件确保自动完成被触发
+            if not suggestion_ready:
+                try:
+                    await zipcode_input.evaluate("element => { element.dispatchEvent(new Event('input', { bubbles: true })); }")
+                    await zipcode_input.evaluate("element => { element.dispatchEvent(new KeyboardEvent('keyup', { bubbles: true, key: '0' })); }")
+                    suggestion_ready = await wait_for_new_matches(
+                        page, CITY_SUGGESTION_SELECTOR, suggestions_before, "newsbreak.city_suggestions_retrigger", timeout=3
+                    )
+                except Exception as e:
+                    logger.debug(f"{self.source_name}: 触发输入事件失败: {str(e)}")
             
             # 根据用户提供的HTML结构，使用更准确的选择器
             # 容器: <div class="jsx-3294552676 absolute text-base ...">
@@ -383,19 +494,17 @@ class NewsbreakScraper(LocalNewsScraper, RobustScraperMixin):
             
             first_suggestion = None
             
-            # 策略1: 先等待容器出现，再查找链接
-            container_found = False
-            for container_selector in container_selectors:
-                try:
-                    # 使用attached状态而不是visible，因为元素可能在视口外
-                    await page.wait_for_selector(container_selector, timeout=10000, state="attached")
-                    logger.debug(f"{self.source_name}: 自动完成容器已出现: {container_selector}")
-                    container_found = True
-                    await asyncio.sleep(1)  # 等待内容渲染
-                    break
-                except Exception as e:
-                    logger.debug(f"{self.source_name}: 容器选择器 {container_selector} 等待超时: {str(e)[:80]}")
-                    continue
+            # 策略1: 先等待容器出现（任一选择器，attached即可，元素可能在视口外），再查找链接
+            container_selector = await wait_for_any_selector(
+                page, container_selectors, "newsbreak.city_suggestion_container", timeout=10
+            )
+            container_found = container_selector is not None
+            if container_found and not suggestion_ready:
+                logger.debug(f"{self.source_name}: 自动完成容器已出现: {container_selector}")
+                # 等待建议链接渲染（原固定等待1秒）
+                suggestion_ready = await wait_for_new_matches(
+                    page, CITY_SUGGESTION_SELECTOR, suggestions_before, "newsbreak.city_suggestion_render", timeout=2, baseline=1
+                )
             
             # 策略2: 查找建议链接
             if container_found:
@@ -445,8 +554,10 @@ class NewsbreakScraper(LocalNewsScraper, RobustScraperMixin):
             
             # 策略4: 如果还是找不到，等待更长时间并再次尝试
             if not first_suggestion:
-                logger.debug(f"{self.source_name}: 等待额外5秒后再次尝试...")
-                await asyncio.sleep(5)
+                logger.debug(f"{self.source_name}: 最多等待5秒建议链接出现后再次尝试...")
+                await wait_for_new_matches(
+                    page, CITY_SUGGESTION_SELECTOR, suggestions_before, "newsbreak.city_suggestion_late", timeout=5, baseline=5
+                )
                 for selector in suggestion_selectors:
                     try:
                         suggestions = await page.query_selector_all(selector)
@@ -468,6 +579,12 @@ class NewsbreakScraper(LocalNewsScraper, RobustScraperMixin):
             
             if not first_suggestion:
                 logger.warning(f"{self.source_name}: 未找到自动完成建议项，已尝试所有选择器")
+                # 只有下拉列表已渲染且确认为空时才记为负缓存；列表未出现（加载慢、反爬页面、选择器变化）
+                # 可能是临时失败，不缓存，下次运行重新解析
+                if await self._suggestion_list_confirmed_empty(page):
+                    city_url_cache.put_negative(zipcode)
+                else:
+                    logger.debug(f"{self.source_name}: 建议列表未渲染，无法确认zipcode {zipcode} 没有城市，不写入负缓存")
                 # 尝试截图以便调试
                 try:
                     screenshot_path = Path("logs/newsbreak_debug_screenshot.png")
@@ -519,6 +636,26 @@ class NewsbreakScraper(LocalNewsScraper, RobustScraperMixin):
             logger.error(f"{self.source_name}: 选择城市失败: {str(e)}", exc_info=True)
             return None
     
+    @traced()
+    async def _suggestion_list_confirmed_empty(self, page) -> bool:
+        """自动完成下拉列表已渲染（可见）且其中没有任何建议链接"""
+        try:
+            return await page.evaluate(
+                """(selectors) => {
+                    for (const selector of selectors) {
+                        const list = document.querySelector(selector);
+                        if (list && list.getClientRects().length > 0) {
+                            return list.querySelectorAll("a[href^='/']").length === 0;
+                        }
+                    }
+                    return false;
+                }""",
+                CITY_SUGGESTION_LIST_SELECTORS,
+            )
+        except Exception as e:
+            logger.debug(f"{self.source_name}: 检查建议列表失败: {str(e)[:50]}")
+            return False
+    
     async def _scrape_category(self, category_page, city_url: str, category: str, zipcode: str, limit: int) -> List[Dict[str, Any]]:
         """
         采集指定分类的文章
@@ -537,7 +674,7 @@ class NewsbreakScraper(LocalNewsScraper, RobustScraperMixin):
         
         try:
             # 构建分类URL
-            category_url = f"https://www.newsbreak.com{city_url}-{category}"
+            category_url = f"{self.site_url}{city_url}-{category}"
             logger.info(f"{self.source_name}: 采集分类 {category}，URL: {category_url}")
             
             # 导航到分类页面（带重试机制）
@@ -599,6 +736,19 @@ class NewsbreakScraper(LocalNewsScraper, RobustScraperMixin):
             if not nav_success:
                 raise Exception(f"分类 {category} 导航失败：经过 {max_nav_retries + 1} 次尝试后仍无法导航")
             
+            # 优先读取服务端渲染的 __NEXT_DATA__（domcontentloaded 后即可读取，无需处理弹窗和等待列表渲染）
+            try:
+                articles = await self._articles_from_next_data(
+                    await category_page.content(), zipcode, city_url, limit
+                )
+            except Exception as e:
+                logger.debug(f"{self.source_name}: 分类 {category} 读取页面JSON失败: {str(e)[:100]}")
+                articles = []
+            if articles:
+                category_path_stats.record("page_json")
+                logger.info(f"{self.source_name}: 分类 {category} 从页面JSON提取 {len(articles)} 篇文章")
+                return articles
+            
             await self._random_delay(1, 2)
             
             # 处理可能的弹窗
@@ -615,62 +765,157 @@ class NewsbreakScraper(LocalNewsScraper, RobustScraperMixin):
             except Exception:
                 pass
             
-            # 等待文章列表加载
-            await asyncio.sleep(2)
-            
-            # 查找文章容器（使用提供的HTML结构，带重试）
-            article_containers = []
-            article_selectors = [
-                "section.my-1",
-                "section.my-1.md\\:my-2",
-                "div.flex.flex-col section",
-                "section[class*='my-']",
-                "article",
-                "div[class*='article']"
-            ]
+            # 等待文章列表加载（原固定等待2秒）
+            await wait_for_any_selector(
+                category_page, CATEGORY_LISTING_SPEC.containers, "newsbreak.category_list", timeout=5, baseline=2
+            )
             
-            for selector in article_selectors:
-                try:
-                    # 检查页面是否仍然有效
+            # 按提取规格一次性提取全部文章（单次 page.evaluate，多取一些容器，因为可能有些无效）
+            listing = await extract_listing(category_page, CATEGORY_LISTING_SPEC, max_containers=limit * 2, limit=limit)
+            if listing is not None:
+                if not listing.container_count:
+                    logger.warning(f"{self.source_name}: 分类 {category} 未找到文章容器")
+                    category_path_stats.record("empty")
+                    return []
+                logger.info(f"{self.source_name}: 分类 {category} 找到 {listing.container_count} 个文章容器")
+                articles = [self._article_from_fields(values, zipcode, city_url) for values in listing.items]
+            else:
+                # 页面内执行失败时回退：逐个查找文章容器（带重试）
+                article_containers = []
+                for selector in CATEGORY_LISTING_SPEC.containers:
                     try:
-                        _ = category_page.url
-                    except Exception:
-                        logger.warning(f"{self.source_name}: 分类 {category} 页面在查询文章时已关闭")
-                        break
+                        # 检查页面是否仍然有效
+                        try:
+                            _ = category_page.url
+                        except Exception:
+                            logger.warning(f"{self.source_name}: 分类 {category} 页面在查询文章时已关闭")
+                            break
                     
-                    article_containers = await category_page.query_selector_all(selector)
-                    if article_containers:
-                        logger.debug(f"{self.source_name}: 分类 {category} 使用选择器 {selector} 找到 {len(article_containers)} 个容器")
-                        break
-                except Exception as e:
-                    logger.debug(f"{self.source_name}: 分类 {category} 选择器 {selector} 失败: {str(e)[:50]}")
-                    continue
+                        article_containers = await category_page.query_selector_all(selector)
+                        if article_containers:
+                            logger.debug(f"{self.source_name}: 分类 {category} 使用选择器 {selector} 找到 {len(article_containers)} 个容器")
+                            break
+                    except Exception as e:
+                        logger.debug(f"{self.source_name}: 分类 {category} 选择器 {selector} 失败: {str(e)[:50]}")
+                        continue
             
-            if not article_containers:
-                logger.warning(f"{self.source_name}: 分类 {category} 未找到文章容器")
-                return []
+                if not article_containers:
+                    logger.warning(f"{self.source_name}: 分类 {category} 未找到文章容器")
+                    category_path_stats.record("empty")
+                    return []
             
-            logger.info(f"{self.source_name}: 分类 {category} 找到 {len(article_containers)} 个文章容器")
+                logger.info(f"{self.source_name}: 分类 {category} 找到 {len(article_containers)} 个文章容器")
             
-            # 提取文章数据
-            for i, container in enumerate(article_containers[:limit * 2]):  # 多取一些，因为可能有些无效
-                try:
-                    article = await self._extract_article_from_html(container, zipcode, city_url)
-                    if article:
-                        articles.append(article)
-                        if len(articles) >= limit:
-                            break
-                except Exception as e:
-                    logger.debug(f"{self.source_name}: 提取分类 {category} 第 {i+1} 篇文章失败: {str(e)}")
-                    continue
+                # 提取文章数据
+                for i, container in enumerate(article_containers[:limit * 2]):  # 多取一些，因为可能有些无效
+                    try:
+                        article = await self._extract_article_from_html(container, zipcode, city_url)
+                        if article:
+                            articles.append(article)
+                            if len(articles) >= limit:
+                                break
+                    except Exception as e:
+                        logger.debug(f"{self.source_name}: 提取分类 {category} 第 {i+1} 篇文章失败: {str(e)}")
+                        continue
             
+            category_path_stats.record("dom" if articles else "empty")
             logger.info(f"{self.source_name}: 分类 {category} 成功提取 {len(articles)} 篇文章")
             
         except Exception as e:
             logger.warning(f"{self.source_name}: 采集分类 {category} 失败: {str(e)}", exc_info=True)
+            category_path_stats.record("failed")
         
         return articles
     
+    @traced()
+    async def _scrape_category_via_http(self, city_url: str, category: str, zipcode: str, limit: int) -> List[Dict[str, Any]]:
+        """
+        不打开浏览器，直接下载分类页面HTML并从 __NEXT_DATA__ 提取文章
+        
+        Args:
+            city_url: 城市URL（如 '/beverly-hills-ca'）
+            category: 分类名称
+            zipcode: 邮政编码
+            limit: 采集数量限制
+            
+        Returns:
+            文章列表；未启用、下载失败或页面中没有可用的feed时返回空列表（由调用方回退到浏览器页面）
+        """
+        if not settings.newsbreak_http_fetch_enabled or har_archive.active:
+            return []
+        if NewsbreakScraper._http_consecutive_misses >= HTTP_PATH_MAX_CONSECUTIVE_MISSES:
+            return []
+        
+        category_url = f"{self.site_url}{city_url}-{category}"
+        try:
+            html = await http_fetcher.fetch_text(category_url, timeout=30)
+            next_data = extract_next_data(html) if html else None
+            # 只有下载失败或页面中没有可解析的 __NEXT_DATA__ 才算未命中；feed 为空是正常结果（该分类暂无新闻）
+            if next_data is None:
+                self._record_http_miss()
+                return []
+            NewsbreakScraper._http_consecutive_misses = 0
+            articles = await self._articles_from_next_data(html, zipcode, city_url, limit, next_data=next_data)
+        except Exception as e:
+            logger.debug(f"{self.source_name}: 分类 {category} HTTP读取失败: {str(e)[:100]}")
+            self._record_http_miss()
+            return []
+        
+        if not articles:
+            return []
+        
+        category_path_stats.record("http")
+        logger.info(f"{self.source_name}: 分类 {category} 通过HTTP从JSON提取 {len(articles)} 篇文章，URL: {category_url}")
+        return articles
+    
+    def _record_http_miss(self):
+        """记录一次HTTP路径未命中，连续达到上限时本轮采集停用HTTP路径"""
+        NewsbreakScraper._http_consecutive_misses += 1
+        if NewsbreakScraper._http_consecutive_misses == HTTP_PATH_MAX_CONSECUTIVE_MISSES:
+            logger.warning(
+                f"{self.source_name}: HTTP读取分类页面连续 {HTTP_PATH_MAX_CONSECUTIVE_MISSES} 次失败或没有 __NEXT_DATA__，"
+                f"本次运行改用浏览器页面"
+            )
+    
+    async def _articles_from_next_data(
+        self, html: str, zipcode: str, city_url: str, limit: int, next_data: Optional[Dict[str, Any]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        从分类页面HTML的 __NEXT_DATA__ feed 提取文章
+        feed 中没有文章URL，按标题slug与页面中服务端渲染的 /news/<id>-<slug> 链接对应，找不到链接的文章跳过
+        
+        Args:
+            html: 分类页面HTML
+            zipcode: 邮政编码
+            city_url: 城市URL
+            limit: 采集数量限制
+            next_data: 已解析的 __NEXT_DATA__（不提供时从 html 中解析）
+            
+        Returns:
+            文章列表（feed 缺失或没有可对应的链接时为空）
+        """
+        feed = feed_from_next_data(next_data if next_data is not None else extract_next_data(html))
+        if not feed:
+            return []
+        
+        links = news_links_by_slug(html)
+        city = self._city_from_url(city_url)
+        articles = []
+        for item in feed:
+            path = match_news_link(item.get('title', ''), links)
+            if not path:
+                continue
+            article = await self._extract_article_from_json(item, zipcode, url=f"https://www.newsbreak.com{path}")
+            if article:
+                article["city"] = city
+                articles.append(article)
+                if len(articles) >= limit:
+                    break
+        
+        if len(articles) < len(feed) and len(articles) < limit:
+            logger.debug(f"{self.source_name}: JSON feed {len(feed)} 篇，其中 {len(articles)} 篇找到对应链接")
+        return articles
+    
     async def _extract_article_from_html(self, container, zipcode: str, city_url: str) -> Optional[Dict[str, Any]]:
         """
         从HTML容器中提取文章数据
@@ -702,12 +947,6 @@ class NewsbreakScraper(LocalNewsScraper, RobustScraperMixin):
             if not url:
                 return None
             
-            # 确保URL是绝对URL
-            if url.startswith('/'):
-                url = f"https://www.newsbreak.com{url}"
-            elif not url.startswith('http'):
-                url = f"https://www.newsbreak.com/{url}"
-            
             # 提取摘要（p.text-base.text-gray-light）
             summary_elem = await container.query_selector("p.text-base.text-gray-light")
             summary = ""
@@ -716,41 +955,67 @@ class NewsbreakScraper(LocalNewsScraper, RobustScraperMixin):
             
             # 提取时间（相对时间文本，如"5小时"）
             time_elem = await container.query_selector("div.text-gray-light.text-sm")
-            publish_date = None
+            time_text = None
             if time_elem:
                 time_text = await time_elem.inner_text()
-                if time_text:
-                    publish_date = self._parse_date(time_text)
-            
-            # 如果没有提取到时间，使用当前时间
-            if not publish_date:
-                publish_date = datetime.utcnow().isoformat()
-            
-            # 从city_url提取城市名称（如 '/beverly-hills-ca' -> 'Beverly Hills'）
-            city = ""
-            if city_url:
-                # 移除前导斜杠，分割并处理
-                city_parts = city_url.lstrip('/').split('/')
-                if city_parts:
-                    city_name = city_parts[-1].replace('-', ' ').title()
-                    city = city_name
             
-            return {
-                "source": self.source_name,
-                "zipcode": zipcode,
-                "city": city,
-                "title": title.strip(),
-                "url": url,
-                "publish_date": publish_date,
-                "content": summary.strip() if summary else "",
-                "content_summary": summary.strip() if summary else "",
-                "keywords": []
-            }
+            return self._article_from_fields(
+                {"title": title, "url": url, "summary": summary, "time_text": time_text},
+                zipcode,
+                city_url
+            )
             
         except Exception as e:
             logger.debug(f"{self.source_name}: 从HTML提取文章数据失败: {str(e)}")
             return None
     
+    def _article_from_fields(self, values: Dict[str, Optional[str]], zipcode: str, city_url: str) -> Dict[str, Any]:
+        """
+        将列表页提取的字段转换为文章数据（补全URL、解析相对时间、从城市URL提取城市名称）
+        
+        Args:
+            values: 字段值（title, url, summary, time_text）
+            zipcode: 邮政编码
+            city_url: 城市URL
+            
+        Returns:
+            文章数据字典
+        """
+        url = values.get("url") or ""
+        summary = values.get("summary") or ""
+        
+        # 确保URL是绝对URL
+        if url.startswith('/'):
+            url = f"https://www.newsbreak.com{url}"
+        elif not url.startswith('http'):
+            url = f"https://www.newsbreak.com/{url}"
+        
+        # 解析时间（相对时间文本，如"5h"），没有时使用当前时间
+        publish_date = self._parse_date(values.get("time_text"))
+        
+        return {
+            "source": self.source_name,
+            "zipcode": zipcode,
+            "city": self._city_from_url(city_url),
+            "title": (values.get("title") or "").strip(),
+            "url": url,
+            "publish_date": publish_date,
+            "content": summary.strip(),
+            "content_summary": summary.strip(),
+            "keywords": []
+        }
+    
+    @staticmethod
+    def _city_from_url(city_url: str) -> str:
+        """从city_url提取城市名称（如 '/beverly-hills-ca' -> 'Beverly Hills Ca'）"""
+        city = ""
+        if city_url:
+            # 移除前导斜杠，分割并处理
+            city_parts = city_url.lstrip('/').split('/')
+            if city_parts:
+                city = city_parts[-1].replace('-', ' ').title()
+        return city
+    
     def _deduplicate_articles(self, articles: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
         基于URL去重文章列表
@@ -783,53 +1048,34 @@ class NewsbreakScraper(LocalNewsScraper, RobustScraperMixin):
             过滤后的文章列表（只包含24小时内的）
         """
         filtered = []
-        now = datetime.now(timezone.utc)  # 使用offset-aware时间
-        cutoff_time = now - timedelta(hours=24)
+        cutoff_time = date_engine.now() - timedelta(hours=24)
         
         for article in articles:
-            publish_date_str = article.get('publish_date')
-            if not publish_date_str:
+            if not article.get('publish_date'):
                 # 如果没有发布日期，跳过
                 continue
             
-            try:
-                # 解析日期
-                if isinstance(publish_date_str, str):
-                    # 尝试解析ISO格式
-                    try:
-                        publish_date = datetime.fromisoformat(publish_date_str.replace('Z', '+00:00'))
-                    except ValueError:
-                        # 如果ISO解析失败，使用dateutil
-                        from dateutil import parser
-                        publish_date = parser.parse(publish_date_str)
-                else:
-                    publish_date = publish_date_str
-                
-                # 确保publish_date是offset-aware
-                if publish_date.tzinfo is None:
-                    # 假设是UTC时间
-                    publish_date = publish_date.replace(tzinfo=timezone.utc)
-                
-                # 检查是否在24小时内
-                if publish_date >= cutoff_time:
-                    filtered.append(article)
-                else:
-                    logger.debug(f"{self.source_name}: 文章超过24小时，已过滤: {article.get('title', '')[:50]}")
-                    
-            except Exception as e:
-                logger.warning(f"{self.source_name}: 日期解析失败，保留文章: {str(e)}")
+            # 采集时已解析为datetime，这里不再重复解析字符串
+            publish_date = date_engine.parse(article['publish_date'])
+            if publish_date is None:
+                logger.warning(f"{self.source_name}: 日期解析失败，保留文章: {article.get('publish_date')}")
                 # 如果解析失败，保留文章（避免丢失数据）
                 filtered.append(article)
+            elif publish_date >= cutoff_time:
+                filtered.append(article)
+            else:
+                logger.debug(f"{self.source_name}: 文章超过24小时，已过滤: {article.get('title', '')[:50]}")
         
         return filtered
     
-    async def _extract_article_from_json(self, article_item: Dict[str, Any], zipcode: str) -> Optional[Dict[str, Any]]:
+    async def _extract_article_from_json(self, article_item: Dict[str, Any], zipcode: str, url: Optional[str] = None) -> Optional[Dict[str, Any]]:
         """
         从JSON数据中提取文章信息
         
         Args:
             article_item: JSON中的文章数据
             zipcode: Zipcode
+            url: 已确认的文章URL（从页面链接对应得到）；为None时使用docid构建临时URL
             
         Returns:
             文章数据字典
@@ -839,33 +1085,25 @@ class NewsbreakScraper(LocalNewsScraper, RobustScraperMixin):
             if not title:
                 return None
             
-            # 提取日期
-            date_str = article_item.get('date', '')
-            if date_str:
-                try:
-                    # 尝试解析日期格式 "2026-01-26 21:56:00"
-                    publish_date = datetime.strptime(date_str, "%Y-%m-%d %H:%M:%S").isoformat()
-                except Exception as e:
-                    logger.debug(f"日期解析失败: {date_str} - {str(e)}")
-                    publish_date = self._parse_date(date_str)
-            else:
-                publish_date = datetime.utcnow().isoformat()
+            # 提取日期（格式 "2026-01-26 21:56:00"，走ISO快速路径；没有时使用当前时间）
+            publish_date = self._parse_date(article_item.get('date', ''))
             
             # 提取摘要
             summary = article_item.get('summary', '')
             
-            # 提取URL - TODO: 需要验证URL构建逻辑（docid -> URL）
-            docid = article_item.get('docid', '')
-            if not docid:
-                # 如果没有docid，无法构建URL，跳过这篇文章
-                logger.warning(f"Newsbreak文章缺少docid，无法构建URL，跳过: {title[:50]}")
-                return None
-            
-            # 尝试从JSON中查找完整URL，如果找不到则使用docid构建临时URL
-            # TODO: 验证Newsbreak URL构建逻辑（docid -> URL）
-            # 当前使用docid作为临时标识，实际URL可能需要从DOM或其他字段获取
-            url = f"https://www.newsbreak.com/news/{docid}"  # 临时URL格式，需要验证
-            logger.debug(f"使用docid构建URL: {url} (需要验证)")
+            if not url:
+                # 提取URL - TODO: 需要验证URL构建逻辑（docid -> URL）
+                docid = article_item.get('docid', '')
+                if not docid:
+                    # 如果没有docid，无法构建URL，跳过这篇文章
+                    logger.warning(f"Newsbreak文章缺少docid，无法构建URL，跳过: {title[:50]}")
+                    return None
+                
+                # 使用docid构建临时URL
+                # TODO: 验证Newsbreak URL构建逻辑（docid -> URL）
+                # 当前使用docid作为临时标识，实际URL可能需要从DOM或其他字段获取
+                url = f"https://www.newsbreak.com/news/{docid}"  # 临时URL格式，需要验证
+                logger.debug(f"使用docid构建URL: {url} (需要验证)")
             
             return {
                 "source": self.source_name,
@@ -906,11 +1144,7 @@ class NewsbreakScraper(LocalNewsScraper, RobustScraperMixin):
                 url = f"https://www.newsbreak.com{url}" if url.startswith('/') else f"https://www.newsbreak.com/{url}"
             
             # 解析日期
-            publish_date = article_data.get('publish_date', '')
-            if publish_date:
-                publish_date = self._parse_date(publish_date)
-            else:
-                publish_date = datetime.utcnow().isoformat()
+            publish_date = self._parse_date(article_data.get('publish_date', ''))
             
             return {
                 "source": self.source_name,
@@ -926,47 +1160,3 @@ class NewsbreakScraper(LocalNewsScraper, RobustScraperMixin):
         except Exception as e:
             logger.warning(f"提取文章数据失败: {str(e)}")
             return None
-    
-    def _parse_date(self, date_str: str) -> str:
-        """
-        解析日期字符串为ISO格式
-        
-        Args:
-            date_str: 日期字符串（如 "2 hours ago", "Yesterday", "2024-01-15"）
-            
-        Returns:
-            ISO格式日期字符串
-        """
-        if not date_str:
-            return datetime.utcnow().isoformat()
-        
-        date_str = date_str.strip().lower()
-        now = datetime.utcnow()
-        
-        # 处理相对时间
-        if "just now" in date_str or "now" in date_str:
-            return now.isoformat()
-        elif "minute" in date_str:
-            minutes = int(re.search(r'(\d+)', date_str).group(1)) if re.search(r'(\d+)', date_str) else 0
-            return (now - timedelta(minutes=minutes)).isoformat()
-        elif "hour" in date_str:
-            hours = int(re.search(r'(\d+)', date_str).group(1)) if re.search(r'(\d+)', date_str) else 0
-            return (now - timedelta(hours=hours)).isoformat()
-        elif "day" in date_str or "yesterday" in date_str:
-            days = 1 if "yesterday" in date_str else (int(re.search(r'(\d+)', date_str).group(1)) if re.search(r'(\d+)', date_str) else 1)
-            return (now - timedelta(days=days)).isoformat()
-        elif "week" in date_str:
-            weeks = int(re.search(r'(\d+)', date_str).group(1)) if re.search(r'(\d+)', date_str) else 1
-            return (now - timedelta(weeks=weeks)).isoformat()
-        elif "month" in date_str:
-            months = int(re.search(r'(\d+)', date_str).group(1)) if re.search(r'(\d+)', date_str) else 1
-            return (now - timedelta(days=months * 30)).isoformat()
-        else:
-            # 尝试解析标准日期格式
-            try:
-                from dateutil import parser
-                parsed_date = parser.parse(date_str)
-                return parsed_date.isoformat()
-            except Exception as e:
-                logger.debug(f"日期解析失败: {date_str} - {str(e)}")
-                return now.isoformat()
@@ -3,13 +3,25 @@
 处理全国性房地产行业新闻采集
 """
 from typing import List, Dict, Any
+from config.settings import settings
 from scrapers.base_scraper import BaseScraper
+from utils.har_archive import har_archive
+from utils.http_fetcher import http_fetcher
 from utils.logger import logger
+from utils.path_stats import PathStats
+from utils.tracing import traced
+
+# 列表页采集路径命中统计：http（直接解析HTML，未启动浏览器）/ browser（回退到Playwright）
+listing_path_stats = PathStats("房地产新闻列表页")
 
 
 class RealEstateScraper(BaseScraper):
     """房地产新闻采集器基类"""
     
+    # 列表页是否服务端渲染：为True时先用HTTP下载并按 extraction_spec 解析，文章太少才启动浏览器
+    # （子类需同时混入 RobustScraperMixin 并实现 _build_article）
+    http_listing: bool = False
+    
     def __init__(self, source_name: str, base_url: str):
         """
         初始化房地产新闻采集器
@@ -19,8 +31,9 @@ class RealEstateScraper(BaseScraper):
             base_url: 网站基础URL
         """
         super().__init__(source_name)
-        self.base_url = base_url
+        self.base_url = self._base_url(base_url)
     
+    @traced()
     async def scrape(self, limit: int = 20) -> List[Dict[str, Any]]:
         """
         采集房地产新闻
@@ -34,6 +47,15 @@ class RealEstateScraper(BaseScraper):
         logger.info(f"{self.source_name}: 开始采集房地产新闻")
         
         try:
+            if self.http_listing and settings.real_estate_http_fetch_enabled and not har_archive.active:
+                articles = await self._scrape_listing_via_http(limit)
+                if len(articles) >= min(limit, settings.real_estate_http_min_articles):
+                    listing_path_stats.record("http")
+                    logger.info(f"{self.source_name}: 采集完成（HTTP），获得 {len(articles)} 篇文章")
+                    return articles
+                logger.info(f"{self.source_name}: HTTP解析列表页只得到 {len(articles)} 篇文章，改用浏览器采集")
+                listing_path_stats.record("browser")
+            
             articles = await self._scrape_real_estate_news(limit)
             logger.info(f"{self.source_name}: 采集完成，获得 {len(articles)} 篇文章")
             return articles
@@ -41,6 +63,31 @@ class RealEstateScraper(BaseScraper):
             logger.error(f"{self.source_name}: 采集失败: {str(e)}", exc_info=True)
             return []
     
+    @traced()
+    async def _scrape_listing_via_http(self, limit: int) -> List[Dict[str, Any]]:
+        """
+        不启动浏览器：通过共享HTTP抓取层下载列表页，并按信号源的提取规格解析
+        
+        Args:
+            limit: 采集数量限制
+            
+        Returns:
+            文章列表；下载失败或解析不到文章时返回空列表
+        """
+        try:
+            html = await http_fetcher.fetch_text(self.base_url, timeout=30)
+            if not html:
+                return []
+            articles = []
+            for article_data in self.extract_articles_from_html(html, max_containers=limit):
+                article = self._build_article(article_data)
+                if article:
+                    articles.append(article)
+            return articles
+        except Exception as e:
+            logger.warning(f"{self.source_name}: HTTP解析列表页失败: {str(e)[:200]}")
+            return []
+    
     async def _scrape_real_estate_news(self, limit: int) -> List[Dict[str, Any]]:
         """
         子类需要实现的具体采集逻辑
@@ -10,13 +10,61 @@ from typing import List, Dict, Any, Optional
 from datetime import datetime
 from scrapers.real_estate_scraper import RealEstateScraper
 from scrapers.robust_scraper_mixin import RobustScraperMixin
+from scrapers.extraction_spec import ExtractionSpec, FieldSpec, GENERIC_ARTICLE_FIELDS
 from utils.logger import logger
+from utils.wait_strategy import wait_for_any_selector, wait_for_selectors_gone
+from utils.tracing import traced
 from config.settings import settings
 
 
 class RealtorScraper(RealEstateScraper, RobustScraperMixin):
     """Realtor.com新闻采集器"""
     
+    # 列表页提取规格：优先使用Realtor.com特定选择器，必需字段缺失时回退到通用字段
+    extraction_spec = ExtractionSpec(
+        containers=[
+            "div.sc-1ri3r0p-0",  # 根据实际HTML结构
+            "div[class*='sc-1ri3r0p-0']",  # 部分匹配
+            "div[class*='Cardstyles']",  # 卡片样式
+            "div.card-content",  # 通用
+            "div[class*='card']",  # 最通用
+            "article",
+            ".article-card",
+            ".news-item"
+        ],
+        fields={
+            "title": FieldSpec([
+                "h3.sc-1ewhvwh-0",  # 精确匹配
+                "h3[class*='sc-1ewhvwh-0']",  # 部分匹配
+                "h3[font-weight='bold']",  # 属性匹配
+                ".card-content h3",  # card-content内的h3
+                "h3",  # 通用fallback
+                "h2", "h1"
+            ]),
+            "url": FieldSpec([
+                "a[href*='/news/real-estate-news/']",  # 最可靠
+                ".card-content a[href*='/news/real-estate-news/']",  # card-content内
+                "h3 a",  # 标题内的链接
+                "a[href]",  # 通用链接
+            ], attr="href"),
+            "publish_date": FieldSpec([
+                "time[datetime]",
+                "time",
+                ".date", ".publish-date", ".published-date",
+                "[datetime]",
+                ".timestamp"
+            ], attr="datetime", text_fallback=True),
+            "summary": FieldSpec([
+                "p.dsOTPE",  # 精确匹配
+                "p[class*='dsOTPE']",  # 部分匹配
+                ".card-content p:not(a p)",  # card-content内的p，排除链接内的
+                ".card-content p",  # card-content内的p
+                "p"  # 通用fallback
+            ]),
+        },
+        fallback_fields=GENERIC_ARTICLE_FIELDS,
+    )
+    
     # TODO: 需要重新保存DOM并分析Realtor.com结构
     # 当前DOM文件可能未保存成功，需要运行 save_all_doms.py 重新保存并分析
     
@@ -30,6 +78,7 @@ class RealtorScraper(RealEstateScraper, RobustScraperMixin):
         super().__init__("Realtor.com", "https://www.realtor.com/news/real-estate-news/")
         self.use_headless = headless  # Realtor.com使用headed模式验证
     
+    @traced()
     async def _scrape_real_estate_news(self, limit: int = 20) -> List[Dict[str, Any]]:
         """
         采集Realtor.com的房地产新闻
@@ -101,8 +150,9 @@ class RealtorScraper(RealEstateScraper, RobustScraperMixin):
                 timeout=30000
             )
             
-            # 等待页面DOM加载完成
-            await asyncio.sleep(2)  # 固定延迟，让页面开始渲染
+            # 等待文章列表开始渲染（原固定等待2秒）
+            article_selectors = self.extraction_spec.containers
+            await wait_for_any_selector(page, article_selectors[:3], "realtor.initial_render", timeout=2, baseline=2)
 
             # 首次人工放行模式：给用户时间在弹出窗口中完成验证/放行
             if (not self.use_headless) and settings.realtor_manual_gate_seconds > 0:
@@ -113,10 +163,13 @@ class RealtorScraper(RealEstateScraper, RobustScraperMixin):
 
             # 封禁页“过渡等待”：Realtor 有时先返回封禁/等待页，约 2s 后由前端替换为正常内容，
             # 在此时间内不判定为封禁，避免误杀。
+            # 文章列表出现即说明已过渡到正常内容，不必等满
             settlement = getattr(settings, "realtor_block_settlement_seconds", 4.0)
             if settlement > 0:
-                logger.debug(f"Realtor.com: 等待封禁页过渡 {settlement}s 后再检测")
-                await asyncio.sleep(settlement)
+                logger.debug(f"Realtor.com: 最多等待封禁页过渡 {settlement}s 后再检测")
+                await wait_for_any_selector(
+                    page, article_selectors[:3], "realtor.block_settlement", timeout=settlement, baseline=settlement
+                )
 
             # 快速判定是否命中封禁页（用于日志一眼识别）
             # try:
@@ -159,8 +212,10 @@ class RealtorScraper(RealEstateScraper, RobustScraperMixin):
                 # 检查是否有Cloudflare挑战
                 cf_challenge = await page.query_selector("#challenge-form, .cf-browser-verification")
                 if cf_challenge:
-                    logger.warning("检测到Cloudflare验证，等待自动处理...")
-                    await asyncio.sleep(10)  # 增加等待时间
+                    logger.warning("检测到Cloudflare验证，等待自动处理（最多10秒）...")
+                    await wait_for_selectors_gone(
+                        page, ["#challenge-form", ".cf-browser-verification"], "realtor.cloudflare", timeout=10, baseline=10
+                    )
             except Exception as e:
                 logger.debug(f"检查弹窗/Cloudflare验证失败: {str(e)}")
             
@@ -176,33 +231,14 @@ class RealtorScraper(RealEstateScraper, RobustScraperMixin):
             except Exception as e:
                 logger.debug(f"滚动模拟失败: {str(e)}")
             
-            # 等待文章列表加载 - 使用实际DOM结构的选择器
-            article_selectors = [
-                "div.sc-1ri3r0p-0",  # 根据实际HTML结构
-                "div[class*='sc-1ri3r0p-0']",  # 部分匹配
-                "div[class*='Cardstyles']",  # 卡片样式
-                "div.card-content",  # 通用
-                "div[class*='card']",  # 最通用
-                "article",
-                ".article-card",
-                ".news-item"
-            ]
-            
-            # 等待文章元素出现（使用实际选择器）
-            article_found = False
-            for selector in article_selectors[:3]:  # 优先使用前3个实际选择器
-                try:
-                    await page.wait_for_selector(selector, timeout=10000)
-                    logger.debug(f"找到文章容器: {selector}")
-                    article_found = True
-                    break
-                except Exception as e:
-                    logger.debug(f"等待选择器 {selector} 超时: {str(e)}")
-                    continue
-            
-            if not article_found:
+            # 等待文章元素出现（优先使用前3个实际选择器）
+            selector = await wait_for_any_selector(page, article_selectors[:3], "realtor.articles", timeout=10)
+            if selector:
+                logger.debug(f"找到文章容器: {selector}")
+            else:
                 logger.warning("未找到文章容器，继续尝试通用选择器...")
-                await asyncio.sleep(3)  # 额外等待
+                # 最多再等3秒任一通用选择器出现（原固定等待3秒）
+                await wait_for_any_selector(page, article_selectors, "realtor.articles_fallback", timeout=3, baseline=3)
             
             # 在headed模式下保存截图（用于验证）
             if not self.use_headless:
@@ -216,20 +252,15 @@ class RealtorScraper(RealEstateScraper, RobustScraperMixin):
                 except Exception as e:
                     logger.debug(f"保存截图失败: {str(e)}")
             
-            # 使用robust方法查找元素
-            article_elements = await self.find_elements_with_fallback(page, article_selectors)
+            # 按提取规格一次性提取全部文章（单次 page.evaluate）
+            articles_data = await self.extract_articles_bulk(page, max_containers=limit)
             
-            logger.debug(f"找到 {len(article_elements)} 个文章元素")
+            logger.debug(f"提取到 {len(articles_data)} 篇文章")
             
-            for i, element in enumerate(article_elements[:limit]):
-                try:
-                    article = await self._extract_article_data(element)
-                    if article:
-                        articles.append(article)
-                        await self._random_delay(0.5, 1.5)
-                except Exception as e:
-                    logger.warning(f"提取第 {i+1} 篇文章失败: {str(e)}", exc_info=True)
-                    continue
+            for article_data in articles_data:
+                article = self._build_article(article_data)
+                if article:
+                    articles.append(article)
             
         except Exception as e:
             logger.error(f"Realtor.com采集过程出错: {str(e)}", exc_info=True)
@@ -271,108 +302,9 @@ class RealtorScraper(RealEstateScraper, RobustScraperMixin):
         except Exception as e:
             logger.debug(f"Realtor.com: dump封禁证据失败: {str(e)}")
     
-    async def extract_article_data_robust(
-        self,
-        element,
-        zipcode: Optional[str] = None
-    ) -> Optional[Dict[str, Any]]:
-        """
-        使用Realtor.com特定的选择器提取文章数据
-        优先使用实际DOM结构的选择器，失败后回退到通用fallback
-        """
+    def _build_article(self, article_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """将提取的字段转换为文章数据（补全URL、解析日期）"""
         try:
-            # 标题 - 使用Realtor特定选择器
-            title = await self.find_element_with_fallback(
-                element,
-                [
-                    "h3.sc-1ewhvwh-0",  # 精确匹配
-                    "h3[class*='sc-1ewhvwh-0']",  # 部分匹配
-                    "h3[font-weight='bold']",  # 属性匹配
-                    ".card-content h3",  # card-content内的h3
-                    "h3",  # 通用fallback
-                    "h2", "h1"
-                ]
-            )
-            
-            # 链接 - 使用Realtor特定选择器
-            link_elem = await self.find_element_with_fallback(
-                element,
-                [
-                    "a[href*='/news/real-estate-news/']",  # 最可靠
-                    ".card-content a[href*='/news/real-estate-news/']",  # card-content内
-                    "h3 a",  # 标题内的链接
-                    "a[href]",  # 通用链接
-                ],
-                extract_text=False
-            )
-            
-            url = ""
-            if link_elem:
-                href = await link_elem.get_attribute("href")
-                if href:
-                    url = href
-            
-            # 摘要 - 使用Realtor特定选择器
-            summary = await self.find_element_with_fallback(
-                element,
-                [
-                    "p.dsOTPE",  # 精确匹配
-                    "p[class*='dsOTPE']",  # 部分匹配
-                    ".card-content p:not(a p)",  # card-content内的p，排除链接内的
-                    ".card-content p",  # card-content内的p
-                    "p"  # 通用fallback
-                ]
-            )
-            
-            # 日期 - 尝试多种选择器
-            date_elem = await self.find_element_with_fallback(
-                element,
-                [
-                    "time[datetime]",
-                    "time",
-                    ".date", ".publish-date", ".published-date",
-                    "[datetime]",
-                    ".timestamp"
-                ],
-                extract_text=False
-            )
-            
-            publish_date = None
-            if date_elem:
-                datetime_attr = await date_elem.get_attribute("datetime")
-                if datetime_attr:
-                    publish_date = datetime_attr
-                else:
-                    date_text = await date_elem.inner_text()
-                    if date_text:
-                        publish_date = date_text.strip()
-            
-            # 验证必需字段
-            if not title or not url:
-                # 如果特定选择器失败，回退到通用方法
-                logger.debug("Realtor特定选择器失败，回退到通用fallback")
-                return await super().extract_article_data_robust(element, zipcode)
-            
-            return {
-                "title": title,
-                "url": url,
-                "publish_date": publish_date or "",
-                "content": summary or "",
-                "content_summary": summary or "",
-                "keywords": [],
-                "zipcode": zipcode if zipcode else None
-            }
-            
-        except Exception as e:
-            logger.warning(f"Realtor特定选择器提取失败: {str(e)}，回退到通用方法")
-            return await super().extract_article_data_robust(element, zipcode)
-    
-    async def _extract_article_data(self, element) -> Dict[str, Any]:
-        """从文章元素中提取数据（使用Realtor特定的选择器）"""
-        try:
-            # 使用Realtor特定的robust方法提取数据
-            article_data = await self.extract_article_data_robust(element)
-            
             if not article_data:
                 return None
             
@@ -382,11 +314,7 @@ class RealtorScraper(RealEstateScraper, RobustScraperMixin):
                 url = f"https://www.realtor.com{url}" if url.startswith('/') else f"https://www.realtor.com/{url}"
             
             # 解析日期
-            publish_date = article_data.get('publish_date', '')
-            if publish_date:
-                publish_date = self._parse_date(publish_date)
-            else:
-                publish_date = datetime.utcnow().isoformat()
+            publish_date = self._parse_date(article_data.get('publish_date', ''))
             
             return {
                 "source": self.source_name,
@@ -401,16 +329,3 @@ class RealtorScraper(RealEstateScraper, RobustScraperMixin):
         except Exception as e:
             logger.warning(f"提取文章数据失败: {str(e)}")
             return None
-    
-    def _parse_date(self, date_str: str) -> str:
-        """解析日期字符串为ISO格式"""
-        if not date_str:
-            return datetime.utcnow().isoformat()
-        
-        try:
-            from dateutil import parser
-            parsed_date = parser.parse(date_str)
-            return parsed_date.isoformat()
-        except Exception as e:
-            logger.debug(f"日期解析失败: {date_str} - {str(e)}")
-            return datetime.utcnow().isoformat()
@@ -1,14 +1,20 @@
 """
 健壮的Scraper混入类
-提供多种备选选择器，提高元素提取成功率
+提供多种备选选择器，提高元素提取成功率；列表页按声明式提取规格批量提取
 """
 from typing import List, Optional, Dict, Any
+from scrapers.extraction_spec import (
+    ExtractionSpec, FieldSpec, GENERIC_ARTICLE_SPEC, extract_listing, extract_listing_from_html
+)
 from utils.logger import logger
 
 
 class RobustScraperMixin:
     """健壮的Scraper混入类，提供多选择器尝试机制"""
     
+    # 列表页提取规格（子类按信号源覆盖）
+    extraction_spec: ExtractionSpec = GENERIC_ARTICLE_SPEC
+    
     async def find_element_with_fallback(
         self,
         element,
@@ -86,13 +92,52 @@ class RobustScraperMixin:
         
         return []
     
+    async def _extract_fields(self, element, fields: Dict[str, FieldSpec]) -> Dict[str, Optional[str]]:
+        """
+        按字段规格逐元素提取（与批量提取的JS语义一致）
+        
+        Args:
+            element: 文章元素
+            fields: 字段名 → FieldSpec
+            
+        Returns:
+            字段名 → 值（未找到为None）
+        """
+        values = {}
+        for name, spec in fields.items():
+            if spec.attr is None:
+                values[name] = await self.find_element_with_fallback(element, spec.selectors)
+                continue
+            found = await self.find_element_with_fallback(element, spec.selectors, extract_text=False)
+            value = None
+            if found:
+                value = await found.get_attribute(spec.attr)
+                if not value and spec.text_fallback:
+                    value = ((await found.inner_text()) or "").strip() or None
+            values[name] = value
+        return values
+    
+    @staticmethod
+    def _article_data_from_fields(values: Dict[str, Optional[str]], zipcode: Optional[str] = None) -> Dict[str, Any]:
+        """将字段值转换为文章数据字典（extract_article_data_robust 的返回格式）"""
+        summary = values.get("summary") or ""
+        return {
+            "title": values.get("title"),
+            "url": values.get("url"),
+            "publish_date": values.get("publish_date") or "",
+            "content": summary,
+            "content_summary": summary,
+            "keywords": [],
+            "zipcode": zipcode if zipcode else None
+        }
+    
     async def extract_article_data_robust(
         self,
         element,
         zipcode: Optional[str] = None
     ) -> Optional[Dict[str, Any]]:
         """
-        使用多种备选选择器提取文章数据
+        按信号源的提取规格（extraction_spec）提取单个文章元素，必需字段缺失时回退到通用字段
         
         Args:
             element: 文章元素
@@ -101,91 +146,72 @@ class RobustScraperMixin:
         Returns:
             文章数据字典
         """
-        try:
-            # 标题 - 多种备选选择器
-            title = await self.find_element_with_fallback(
-                element,
-                [
-                    "h1", "h2", "h3", "h4",
-                    ".title", ".headline", ".article-title", ".post-title",
-                    "[data-testid*='title']",
-                    "a[href] > *:first-child",
-                    "a.title", "a.headline"
-                ]
-            )
-            
-            # 链接 - 多种备选选择器
-            link_elem = await self.find_element_with_fallback(
-                element,
-                [
-                    "a[href]",
-                    "a.article-link",
-                    "a[href*='/news']",
-                    "a[href*='/article']",
-                    "a[href*='/story']",
-                    ".title a",
-                    ".headline a"
-                ],
-                extract_text=False
-            )
-            
-            url = ""
-            if link_elem:
-                href = await link_elem.get_attribute("href")
-                if href:
-                    url = href
-            
-            # 日期 - 多种备选选择器
-            date_elem = await self.find_element_with_fallback(
-                element,
-                [
-                    "time[datetime]",
-                    "time",
-                    ".date", ".publish-date", ".published-date",
-                    "[datetime]",
-                    ".timestamp",
-                    "[data-testid*='date']",
-                    ".meta time",
-                    ".byline time"
-                ],
-                extract_text=False
-            )
-            
-            publish_date = None
-            if date_elem:
-                datetime_attr = await date_elem.get_attribute("datetime")
-                if datetime_attr:
-                    publish_date = datetime_attr
-                else:
-                    date_text = await date_elem.inner_text()
-                    if date_text:
-                        publish_date = date_text.strip()
-            
-            # 摘要 - 多种备选选择器
-            summary = await self.find_element_with_fallback(
-                element,
-                [
-                    ".summary", ".excerpt", ".description",
-                    ".article-summary", ".post-excerpt",
-                    "p:not(.title):not(.headline)",
-                    ".snippet", ".preview"
-                ]
-            )
-            
-            # 验证必需字段
-            if not title or not url:
-                return None
+        spec = self.extraction_spec
+        candidates = [spec.fields]
+        if spec.fallback_fields:
+            candidates.append(spec.fallback_fields)
+        
+        for fields in candidates:
+            try:
+                values = await self._extract_fields(element, fields)
+            except Exception as e:
+                logger.warning(f"提取文章数据失败: {str(e)}")
+                continue
+            if all(values.get(name) for name in spec.required):
+                return self._article_data_from_fields(values, zipcode)
+            logger.debug("特定选择器未提取到必需字段，回退到通用fallback")
+        return None
+    
+    async def extract_articles_bulk(
+        self,
+        page,
+        max_containers: int,
+        zipcode: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        按提取规格一次性提取列表页文章（单次 page.evaluate）；页面内执行失败时回退到逐元素提取
+        
+        Args:
+            page: Playwright页面对象
+            max_containers: 最多处理的文章容器数量
+            zipcode: 邮政编码（可选）
             
-            return {
-                "title": title,
-                "url": url,
-                "publish_date": publish_date or "",
-                "content": summary or "",
-                "content_summary": summary or "",
-                "keywords": [],
-                "zipcode": zipcode if zipcode else None
-            }
+        Returns:
+            文章数据字典列表（格式同 extract_article_data_robust）
+        """
+        spec = self.extraction_spec
+        result = await extract_listing(page, spec, max_containers=max_containers)
+        if result is not None:
+            logger.debug(f"找到 {result.container_count} 个文章元素 (选择器: {result.selector})")
+            return [self._article_data_from_fields(values, zipcode) for values in result.items]
+        
+        articles_data = []
+        elements = await self.find_elements_with_fallback(page, spec.containers, spec.min_count)
+        for i, element in enumerate(elements[:max_containers]):
+            try:
+                article_data = await self.extract_article_data_robust(element, zipcode)
+                if article_data:
+                    articles_data.append(article_data)
+            except Exception as e:
+                logger.warning(f"提取第 {i+1} 篇文章失败: {str(e)}", exc_info=True)
+        return articles_data
+    
+    def extract_articles_from_html(
+        self,
+        html: str,
+        max_containers: int,
+        zipcode: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        不启动浏览器，按同一提取规格解析列表页HTML文本
+        
+        Args:
+            html: 列表页HTML
+            max_containers: 最多处理的文章容器数量
+            zipcode: 邮政编码（可选）
             
-        except Exception as e:
-            logger.warning(f"提取文章数据失败: {str(e)}")
-            return None
+        Returns:
+            文章数据字典列表（格式同 extract_article_data_robust）
+        """
+        result = extract_listing_from_html(html, self.extraction_spec, max_containers=max_containers)
+        return [self._article_data_from_fields(values, zipcode) for values in result.items]
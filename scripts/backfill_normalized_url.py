@@ -0,0 +1,100 @@
+"""
+回填 play_raw_news.normalized_url
+
+执行 database/migrations/003_add_normalized_url.sql 之后运行一次：
+按 id 顺序扫描 normalized_url 为空的记录，用 DataCleaner.normalize_url 计算标准化URL并写回。
+同一标准化URL只保留最早（id最小）的一条，其余重复记录保持 NULL 并输出，供人工清理。
+
+用法：
+    python scripts/backfill_normalized_url.py            # 回填
+    python scripts/backfill_normalized_url.py --dry-run  # 只统计，不写入
+"""
+import argparse
+import asyncio
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from database.supabase_client import db_manager
+from utils.data_cleaner import DataCleaner
+
+PAGE_SIZE = 1000
+
+
+async def load_existing_normalized_urls() -> set:
+    """读取已回填的 normalized_url"""
+    existing = set()
+    last_id = 0
+    while True:
+        response = await asyncio.to_thread(
+            lambda: db_manager.client.table('play_raw_news')
+            .select('id, normalized_url')
+            .not_.is_('normalized_url', 'null')
+            .gt('id', last_id)
+            .order('id')
+            .limit(PAGE_SIZE)
+            .execute()
+        )
+        rows = response.data or []
+        existing.update(row['normalized_url'] for row in rows)
+        if len(rows) < PAGE_SIZE:
+            return existing
+        last_id = rows[-1]['id']
+
+
+async def backfill(dry_run: bool = False):
+    """回填 normalized_url 为空的记录"""
+    existing = await load_existing_normalized_urls()
+    print(f"已有 normalized_url: {len(existing)} 条")
+
+    updated = 0
+    duplicates = []
+    last_id = 0
+    while True:
+        response = await asyncio.to_thread(
+            lambda: db_manager.client.table('play_raw_news')
+            .select('id, url')
+            .is_('normalized_url', 'null')
+            .gt('id', last_id)
+            .order('id')
+            .limit(PAGE_SIZE)
+            .execute()
+        )
+        rows = response.data or []
+
+        for row in rows:
+            normalized_url = DataCleaner.normalize_url(row.get('url') or '')
+            if not normalized_url:
+                continue
+            if normalized_url in existing:
+                duplicates.append((row['id'], row.get('url')))
+                continue
+            existing.add(normalized_url)
+            if not dry_run:
+                await asyncio.to_thread(
+                    lambda: db_manager.client.table('play_raw_news')
+                    .update({'normalized_url': normalized_url})
+                    .eq('id', row['id'])
+                    .execute()
+                )
+            updated += 1
+
+        print(f"  已处理到 id={rows[-1]['id'] if rows else last_id}，回填 {updated} 条，重复 {len(duplicates)} 条")
+        if len(rows) < PAGE_SIZE:
+            break
+        last_id = rows[-1]['id']
+
+    action = "可回填" if dry_run else "已回填"
+    print(f"✅ 完成: {action} {updated} 条")
+    if duplicates:
+        print(f"⚠️  {len(duplicates)} 条重复记录保持 normalized_url 为空:")
+        for record_id, url in duplicates:
+            print(f"  - id={record_id} {url}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="回填 play_raw_news.normalized_url")
+    parser.add_argument("--dry-run", action="store_true", help="只统计，不写入数据库")
+    args = parser.parse_args()
+    asyncio.run(backfill(dry_run=args.dry_run))
@@ -0,0 +1,130 @@
+"""
+DataCleaner 基准测试
+用 analysis/dom_structures 中保存的页面正文作为文章样本（切分为正文长度的片段），
+对比关键词提取的旧实现（按类别逐个 re.findall）与单次扫描的 KeywordMatcher、
+HTML清理的旧实现（BeautifulSoup.get_text）与分层的 html_to_text（纯文本摘要、HTML片段、完整页面），
+输出每篇耗时与加速比，并检查新旧实现的结果是否一致。
+
+用法:
+    python scripts/benchmark_data_cleaner.py
+    python scripts/benchmark_data_cleaner.py --articles 2000 --body-chars 8000
+"""
+import argparse
+import html
+import re
+import sys
+import time
+from pathlib import Path
+from typing import Callable, List
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from bs4 import BeautifulSoup
+
+from utils.data_cleaner import DataCleaner
+
+SNAPSHOT_DIR = Path(__file__).parent.parent / "analysis" / "dom_structures"
+
+
+def load_bodies(count: int, body_chars: int) -> List[str]:
+    """从页面快照提取可见文本，切分为 body_chars 长度的文章正文，循环取满 count 篇"""
+    chunks: List[str] = []
+    for path in sorted(SNAPSHOT_DIR.glob("*_full_dom.html")):
+        soup = BeautifulSoup(path.read_text(encoding="utf-8"), "lxml")
+        for tag in soup(["script", "style", "noscript"]):
+            tag.decompose()
+        text = re.sub(r"\s+", " ", soup.get_text(" ")).strip()
+        chunks.extend(text[i:i + body_chars] for i in range(0, len(text), body_chars) if len(text[i:i + body_chars]) > 200)
+    if not chunks:
+        raise SystemExit(f"没有找到页面快照: {SNAPSHOT_DIR}")
+    return [chunks[i % len(chunks)] for i in range(count)]
+
+
+def load_pages() -> List[str]:
+    """完整页面快照（相当于抓取到的文章正文HTML）"""
+    return [path.read_text(encoding="utf-8") for path in sorted(SNAPSHOT_DIR.glob("*_full_dom.html"))]
+
+
+def to_html_fragment(body: str) -> str:
+    """把正文切分为段落，包装为列表页摘要式的HTML片段"""
+    return "".join(f"<p>{html.escape(sentence)}.</p>\n" for sentence in body.split(". ") if sentence)
+
+
+def legacy_clean_html(html_content: str) -> str:
+    """旧实现：每篇构建完整的 BeautifulSoup 文档树"""
+    if not html_content:
+        return ""
+    text = BeautifulSoup(html_content, "lxml").get_text(separator=" ", strip=True)
+    return re.sub(r"\s+", " ", text).strip()
+
+
+def legacy_extract_keywords(text: str, limit: int = 10) -> List[str]:
+    """旧实现：按类别逐个 re.findall，列表查找去重"""
+    if not text:
+        return []
+    text_lower = text.lower()
+    keywords = []
+    for pattern in DataCleaner.KEYWORD_PATTERNS:
+        for match in re.findall(pattern, text_lower, re.IGNORECASE):
+            if match and match not in keywords:
+                keywords.append(match)
+    return keywords[:limit] if limit is not None else keywords
+
+
+def timed(func: Callable[[], object], repeat: int) -> float:
+    """重复执行取最短耗时（秒）"""
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def bench_keywords(bodies: List[str], repeat: int):
+    cleaner = DataCleaner()
+    legacy = timed(lambda: [legacy_extract_keywords(body) for body in bodies], repeat)
+    single = timed(lambda: [cleaner.extract_keywords(body) for body in bodies], repeat)
+    batch = timed(lambda: cleaner.extract_keywords_batch(bodies), repeat)
+
+    # 新实现的输出应与旧实现完全一致（含顺序与数量限制）
+    mismatched = sum(1 for body in bodies if legacy_extract_keywords(body) != cleaner.extract_keywords(body))
+
+    per = lambda seconds: seconds / len(bodies) * 1e6
+    print(f"\n关键词提取（{len(bodies)} 篇）")
+    print(f"  旧实现 re.findall x{len(DataCleaner.KEYWORD_PATTERNS)}: {per(legacy):>9.1f} µs/篇")
+    print(f"  KeywordMatcher 单篇:           {per(single):>9.1f} µs/篇  ({legacy / single:.1f}x)")
+    print(f"  KeywordMatcher 批量:           {per(batch):>9.1f} µs/篇  ({legacy / batch:.1f}x)")
+    print(f"  结果与旧实现不一致的文章数: {mismatched}")
+
+
+def bench_clean_html(bodies: List[str], repeat: int):
+    cleaner = DataCleaner()
+    samples = {
+        "纯文本摘要": bodies,
+        "HTML片段": [to_html_fragment(body) for body in bodies],
+        "完整页面": load_pages(),
+    }
+    print("\nHTML清理")
+    for label, docs in samples.items():
+        legacy = timed(lambda: [legacy_clean_html(doc) for doc in docs], repeat)
+        tiered = timed(lambda: [cleaner.clean_html(doc) for doc in docs], repeat)
+        mismatched = sum(1 for doc in docs if legacy_clean_html(doc) != cleaner.clean_html(doc))
+        per = lambda seconds: seconds / len(docs) * 1e6
+        print(
+            f"  {label}（{len(docs)} 篇）: BeautifulSoup {per(legacy):>9.1f} µs/篇 → html_to_text {per(tiered):>9.1f} µs/篇"
+            f"  ({legacy / tiered:.1f}x)，结果不一致 {mismatched} 篇"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="DataCleaner 基准测试")
+    parser.add_argument("--articles", type=int, default=1000, help="文章样本数")
+    parser.add_argument("--body-chars", type=int, default=5000, help="每篇正文字符数")
+    parser.add_argument("--repeat", type=int, default=5, help="重复次数（取最短耗时）")
+    args = parser.parse_args()
+
+    bodies = load_bodies(args.articles, args.body_chars)
+    print(f"样本: {len(bodies)} 篇，平均 {sum(map(len, bodies)) / len(bodies):.0f} 字符")
+    bench_keywords(bodies, args.repeat)
+    bench_clean_html(bodies, args.repeat)
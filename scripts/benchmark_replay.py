@@ -0,0 +1,260 @@
+"""
+离线回放基准测试
+用本地HTTP服务器回放 analysis/dom_structures 中保存的页面快照（不访问网络），
+通过 SCRAPER_BASE_URL_OVERRIDES 把各采集器指向本地服务器，
+统计提取吞吐（文章/秒）、各步骤延迟（p50/p95，来自运行追踪）与提取过程的Python内存峰值。
+修改选择器或提取路径时，前后各跑一次并用 --compare 对比。
+
+用法:
+    python scripts/benchmark_replay.py                          # HTTP回放（默认）
+    python scripts/benchmark_replay.py --mode parse             # 直接解析快照（不经过HTTP，含Patch）
+    python scripts/benchmark_replay.py --mode browser           # Playwright 打开本地快照
+    python scripts/benchmark_replay.py --iterations 20 --json logs/bench_before.json
+    python scripts/benchmark_replay.py --compare logs/bench_before.json logs/bench_after.json
+"""
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+# 回放时不需要拟人延迟（否则测到的是 sleep 时长）
+os.environ.setdefault("SCRAPE_DELAY_MIN", "0")
+os.environ.setdefault("SCRAPE_DELAY_MAX", "0")
+
+from aiohttp import web
+
+from scrapers.newsbreak_scraper import NewsbreakScraper
+from scrapers.patch_scraper import PatchScraper
+from scrapers.nar_scraper import NARScraper
+from scrapers.redfin_scraper import RedfinScraper
+from scrapers.freddiemac_scraper import FreddieMacScraper
+from scrapers.browser_pool import browser_pool
+from utils.http_fetcher import http_fetcher
+from utils.tracing import percentile, tracer
+
+SNAPSHOT_DIR = Path(__file__).parent.parent / "analysis" / "dom_structures"
+
+ZIPCODE = "90210"
+NEWSBREAK_CITY_URL = "/beverly-hills-ca"
+NEWSBREAK_CATEGORY = "local"
+
+# 采集源 → (快照文件, 采集器类, 支持的回放模式)
+# Patch 的town页面采集会校验 patch.com 域名，只能直接解析快照
+SOURCES = {
+    "newsbreak": ("newsbreak_full_dom.html", NewsbreakScraper, ("parse", "http", "browser")),
+    "patch": ("patch_full_dom.html", PatchScraper, ("parse",)),
+    "nar": ("nar_full_dom.html", NARScraper, ("parse", "http", "browser")),
+    "redfin": ("redfin_full_dom.html", RedfinScraper, ("parse", "http", "browser")),
+    "freddiemac": ("freddiemac_full_dom.html", FreddieMacScraper, ("parse", "http", "browser")),
+}
+
+
+async def start_snapshot_server(keys: List[str]) -> Tuple[web.AppRunner, str]:
+    """
+    启动本地快照服务器：/<key> 及其下任意路径都返回该采集源的快照
+    （不返回 ETag/Last-Modified，避免重复迭代走 304 缓存路径）
+    """
+    pages = {key: (SNAPSHOT_DIR / SOURCES[key][0]).read_text(encoding="utf-8") for key in keys}
+
+    async def handle(request: web.Request) -> web.Response:
+        key = request.match_info["key"]
+        if key not in pages:
+            return web.Response(status=404)
+        return web.Response(text=pages[key], content_type="text/html")
+
+    app = web.Application()
+    app.router.add_get("/{key}", handle)
+    app.router.add_get("/{key}/{tail:.*}", handle)
+    runner = web.AppRunner(app, access_log=None)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    return runner, f"http://127.0.0.1:{port}"
+
+
+def make_runner(key: str, mode: str, scraper, limit: int) -> Callable[[], Any]:
+    """返回一次迭代的采集协程工厂（结果为文章列表）"""
+    if mode == "parse":
+        html = (SNAPSHOT_DIR / SOURCES[key][0]).read_text(encoding="utf-8")
+        if key == "newsbreak":
+            return lambda: scraper._articles_from_next_data(html, ZIPCODE, NEWSBREAK_CITY_URL, limit)
+
+        async def parse():
+            with tracer.span("parse.extract", source=scraper.source_name):
+                items = scraper.extract_articles_from_html(html, max_containers=limit, zipcode=ZIPCODE)
+            with tracer.span("parse.build", source=scraper.source_name):
+                if key == "patch":
+                    articles = [scraper._build_article(item, ZIPCODE) for item in items]
+                else:
+                    articles = [scraper._build_article(item) for item in items]
+            return [a for a in articles if a]
+        return parse
+
+    if key == "newsbreak":
+        if mode == "http":
+            async def newsbreak_http():
+                NewsbreakScraper.reset_http_path()
+                return await scraper._scrape_category_via_http(NEWSBREAK_CITY_URL, NEWSBREAK_CATEGORY, ZIPCODE, limit)
+            return newsbreak_http
+
+        async def newsbreak_browser():
+            page = await scraper._create_page()
+            try:
+                return await scraper._scrape_category(page, NEWSBREAK_CITY_URL, NEWSBREAK_CATEGORY, ZIPCODE, limit)
+            finally:
+                await page.close()
+        return newsbreak_browser
+
+    if mode == "http":
+        return lambda: scraper._scrape_listing_via_http(limit)
+    return lambda: scraper._scrape_real_estate_news(limit)
+
+
+async def bench_source(key: str, mode: str, iterations: int, warmup: int, limit: int) -> Dict[str, Any]:
+    """对单个采集源回放 iterations 次，返回吞吐、延迟与内存统计"""
+    scraper = SOURCES[key][1]()
+    if mode == "browser" and key == "newsbreak":
+        await scraper._setup_browser(headless=True)
+    run = make_runner(key, mode, scraper, limit)
+
+    for _ in range(warmup):
+        await run()
+
+    trace_run = tracer.start_run(f"replay_{mode}_{key}_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}")
+    durations: List[float] = []
+    peaks: List[int] = []
+    articles_total = 0
+    articles_last = 0
+    try:
+        for _ in range(iterations):
+            tracemalloc.start()
+            started = time.perf_counter()
+            async with tracer.span(f"replay.{key}"):
+                articles = await run() or []
+            durations.append(time.perf_counter() - started)
+            peaks.append(tracemalloc.get_traced_memory()[1])
+            tracemalloc.stop()
+            articles_last = len(articles)
+            articles_total += articles_last
+    finally:
+        steps = tracer.finish_run(trace_run)
+        await scraper.cleanup()
+
+    total = sum(durations)
+    return {
+        "source": key,
+        "mode": mode,
+        "iterations": iterations,
+        "articles": articles_last,
+        "articles_per_sec": articles_total / total if total else 0.0,
+        "p50_ms": percentile(durations, 50) * 1000,
+        "p95_ms": percentile(durations, 95) * 1000,
+        "peak_kb": max(peaks) / 1024 if peaks else 0.0,
+        "steps": {
+            name: {"count": s["count"], "p50_ms": s["p50"] * 1000, "p95_ms": s["p95"] * 1000}
+            for name, s in steps.items()
+        },
+    }
+
+
+def print_results(results: List[Dict[str, Any]]):
+    """输出结果表与各步骤延迟"""
+    print(f"\n{'采集源':<12}{'模式':<9}{'文章':>6}{'文章/秒':>12}{'p50(ms)':>10}{'p95(ms)':>10}{'内存峰值(KB)':>14}")
+    for r in results:
+        print(
+            f"{r['source']:<12}{r['mode']:<9}{r['articles']:>6}{r['articles_per_sec']:>12.1f}"
+            f"{r['p50_ms']:>10.1f}{r['p95_ms']:>10.1f}{r['peak_kb']:>14.0f}"
+        )
+    for r in results:
+        steps = sorted(r["steps"].items(), key=lambda item: item[1]["p50_ms"], reverse=True)
+        print(f"\n{r['source']} 各步骤:")
+        for name, s in steps:
+            print(f"  {name}: 次数={s['count']}, p50={s['p50_ms']:.1f}ms, p95={s['p95_ms']:.1f}ms")
+
+
+def compare(before_path: Path, after_path: Path):
+    """对比两次基准结果（按 采集源+模式 对齐），输出变化百分比"""
+    before = {(r["source"], r["mode"]): r for r in json.loads(before_path.read_text(encoding="utf-8"))["results"]}
+    after = {(r["source"], r["mode"]): r for r in json.loads(after_path.read_text(encoding="utf-8"))["results"]}
+
+    def delta(old: float, new: float) -> str:
+        return f"{(new - old) / old * 100:+.1f}%" if old else "n/a"
+
+    print(f"{'采集源':<12}{'模式':<9}{'文章':>10}{'文章/秒':>22}{'p50(ms)':>22}{'内存峰值(KB)':>22}")
+    for key in sorted(before.keys() & after.keys()):
+        b, a = before[key], after[key]
+        print(
+            f"{key[0]:<12}{key[1]:<9}{b['articles']:>4} → {a['articles']:<4}"
+            f"{b['articles_per_sec']:>9.1f} → {a['articles_per_sec']:<7.1f}({delta(b['articles_per_sec'], a['articles_per_sec'])})"
+            f"{b['p50_ms']:>8.1f} → {a['p50_ms']:<7.1f}({delta(b['p50_ms'], a['p50_ms'])})"
+            f"{b['peak_kb']:>8.0f} → {a['peak_kb']:<7.0f}({delta(b['peak_kb'], a['peak_kb'])})"
+        )
+    missing = sorted(before.keys() ^ after.keys())
+    if missing:
+        print(f"只在一侧出现的结果: {missing}")
+
+
+async def main(args) -> List[Dict[str, Any]]:
+    keys = [k for k in (args.sources or SOURCES.keys()) if args.mode in SOURCES[k][2]]
+    skipped = [k for k in (args.sources or SOURCES.keys()) if k not in keys]
+    if skipped:
+        print(f"跳过不支持 {args.mode} 模式的采集源: {', '.join(skipped)}")
+
+    runner: Optional[web.AppRunner] = None
+    try:
+        if args.mode != "parse":
+            runner, base = await start_snapshot_server(keys)
+            # 覆盖键为采集源名称（source_name）
+            overrides = {
+                "Newsbreak": f"{base}/newsbreak",
+                "NAR": f"{base}/nar",
+                "Redfin": f"{base}/redfin",
+                "Freddie Mac": f"{base}/freddiemac",
+            }
+            os.environ["SCRAPER_BASE_URL_OVERRIDES"] = json.dumps(overrides)
+            print(f"本地快照服务器: {base}")
+
+        results = []
+        for key in keys:
+            results.append(await bench_source(key, args.mode, args.iterations, args.warmup, args.limit))
+        return results
+    finally:
+        await http_fetcher.close()
+        await browser_pool.close()
+        if runner is not None:
+            await runner.cleanup()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="离线回放基准测试（analysis/dom_structures 快照）")
+    parser.add_argument("--mode", choices=["parse", "http", "browser"], default="http", help="回放模式")
+    parser.add_argument("--sources", nargs="*", choices=list(SOURCES.keys()), help="只测试指定采集源")
+    parser.add_argument("--iterations", type=int, default=10, help="每个采集源的计时迭代次数")
+    parser.add_argument("--warmup", type=int, default=1, help="预热次数（不计时）")
+    parser.add_argument("--limit", type=int, default=20, help="每次提取的文章数上限")
+    parser.add_argument("--json", type=Path, help="把结果写入JSON文件（用于 --compare）")
+    parser.add_argument("--compare", nargs=2, type=Path, metavar=("BEFORE", "AFTER"), help="对比两次结果")
+    args = parser.parse_args()
+
+    if args.compare:
+        compare(*args.compare)
+        sys.exit(0)
+
+    results = asyncio.run(main(args))
+    print_results(results)
+    if args.json:
+        args.json.parent.mkdir(parents=True, exist_ok=True)
+        args.json.write_text(
+            json.dumps({"created_at": datetime.utcnow().isoformat(), "results": results}, ensure_ascii=False, indent=2),
+            encoding="utf-8"
+        )
+        print(f"\n结果已写入: {args.json}")
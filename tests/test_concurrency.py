@@ -0,0 +1,170 @@
+"""
+并发控制工具测试
+"""
+import asyncio
+import pytest
+from utils.concurrency import TokenBucket, ConcurrencyLimiter, SingleFlight, host_of
+
+
+def test_host_of():
+    """测试域名提取"""
+    assert host_of("https://www.Newsbreak.com/locations") == "newsbreak.com"
+    assert host_of("patch.com") == "patch.com"
+    assert host_of("") == ""
+
+
+def test_token_bucket_limits_rate(monkeypatch):
+    """测试令牌桶：突发用尽后按速率等待"""
+    clock = {"now": 0.0}
+    bucket = TokenBucket(rate=2.0, capacity=2, clock=lambda: clock["now"])
+
+    async def run():
+        waits = []
+        for _ in range(3):
+            waits.append(await bucket.acquire())
+        return waits
+
+    real_sleep = asyncio.sleep
+
+    async def fake_sleep(delay):
+        clock["now"] += delay
+        await real_sleep(0)
+
+    monkeypatch.setattr(asyncio, "sleep", fake_sleep)
+    waits = asyncio.run(run())
+
+    # 前两次使用突发容量，第三次需要等待 1/rate 秒
+    assert waits[0] == 0
+    assert waits[1] == 0
+    assert waits[2] == pytest.approx(0.5)
+
+
+def test_token_bucket_rejects_invalid_rate():
+    """测试令牌桶速率校验"""
+    with pytest.raises(ValueError):
+        TokenBucket(rate=0)
+
+
+def test_concurrency_limiter_respects_per_source_limit():
+    """测试并发限制器：单信号源并发不超过上限"""
+    limiter = ConcurrencyLimiter(global_limit=10, per_source_limit=2, per_host_limit=10)
+    state = {"active": 0, "peak": 0}
+
+    async def task():
+        async with limiter.slot("Newsbreak", "newsbreak.com"):
+            state["active"] += 1
+            state["peak"] = max(state["peak"], state["active"])
+            await asyncio.sleep(0.01)
+            state["active"] -= 1
+
+    async def run():
+        await asyncio.gather(*[task() for _ in range(6)])
+
+    asyncio.run(run())
+    assert state["peak"] == 2
+
+
+def test_concurrency_limiter_gives_each_source_its_budget():
+    """测试并发限制器：全局上限按已登记信号源的预算之和扩大，域名上限不截断信号源预算"""
+    limiter = ConcurrencyLimiter(global_limit=2, per_source_limit=3, per_host_limit=1)
+    active = {"A": 0, "B": 0}
+    peak = {"A": 0, "B": 0}
+
+    async def task(source):
+        async with limiter.slot(source, f"{source.lower()}.com"):
+            active[source] += 1
+            peak[source] = max(peak[source], active[source])
+            await asyncio.sleep(0.01)
+            active[source] -= 1
+
+    async def run():
+        limiter.reserve(["A", "B"])
+        await asyncio.gather(*[task(source) for source in ("A", "B") for _ in range(6)])
+
+    asyncio.run(run())
+    assert peak == {"A": 3, "B": 3}
+
+
+def test_single_flight_coalesces_concurrent_and_recent_calls():
+    """测试请求合并：同时进行的调用只执行一次，保留期内的后续调用复用结果"""
+    flight = SingleFlight(result_ttl=60)
+    calls = {"n": 0}
+
+    async def fetch():
+        calls["n"] += 1
+        await asyncio.sleep(0.01)
+        return ["article"]
+
+    async def run():
+        concurrent = await asyncio.gather(*[flight.do("town", fetch) for _ in range(3)])
+        later = await flight.do("town", fetch)
+        return concurrent, later
+
+    concurrent, later = asyncio.run(run())
+    assert calls["n"] == 1
+    assert concurrent == [["article"]] * 3
+    assert later == ["article"]
+    assert flight.stats == {"executed": 1, "coalesced": 3}
+
+
+def test_single_flight_does_not_keep_failures():
+    """测试失败、None 与空结果不会被保留"""
+    flight = SingleFlight(result_ttl=60)
+    calls = {"n": 0}
+
+    async def flaky():
+        calls["n"] += 1
+        if calls["n"] == 1:
+            raise RuntimeError("boom")
+        return None if calls["n"] == 2 else []
+
+    async def run():
+        with pytest.raises(RuntimeError):
+            await flight.do("town", flaky)
+        assert await flight.do("town", flaky) is None
+        assert await flight.do("town", flaky) == []
+        assert await flight.do("town", flaky) == []
+
+    asyncio.run(run())
+    assert calls["n"] == 4
+
+
+def test_single_flight_prunes_expired_results():
+    """测试保留新结果时清除其他已过期的键，reset 清空结果与统计"""
+    clock = {"now": 0.0}
+    flight = SingleFlight(result_ttl=60, clock=lambda: clock["now"])
+
+    async def fetch():
+        return ["article"]
+
+    async def run():
+        await flight.do("town-a", fetch)
+        clock["now"] = 120
+        await flight.do("town-b", fetch)
+
+    asyncio.run(run())
+    assert list(flight._results) == ["town-b"]
+    flight.reset()
+    assert flight._results == {} and flight.stats == {"executed": 0, "coalesced": 0}
+
+
+def test_single_flight_waiter_takes_over_when_owner_is_cancelled():
+    """测试执行方被取消（如超时）时，等待方重新执行而不是一起失败"""
+    flight = SingleFlight()
+
+    async def slow():
+        await asyncio.sleep(10)
+        return "slow"
+
+    async def fast():
+        return "fast"
+
+    async def run():
+        owner = asyncio.create_task(flight.do("town", slow))
+        await asyncio.sleep(0)
+        waiter = asyncio.create_task(flight.do("town", fast))
+        await asyncio.sleep(0)
+        owner.cancel()
+        return await waiter
+
+    assert asyncio.run(run()) == "fast"
@@ -0,0 +1,59 @@
+"""
+正文磁盘缓存测试
+"""
+import asyncio
+import os
+import time
+from utils.content_cache import ContentCache
+
+
+def test_cache_round_trip_uses_normalized_url(tmp_path):
+    """测试写入后可按标准化URL读取（查询参数不同视为同一篇文章）"""
+    cache = ContentCache(cache_dir=tmp_path, ttl_days=1, max_bytes=10 * 1024 * 1024)
+
+    async def run():
+        await cache.put("https://patch.com/a?utm_source=x", {"text": "正文", "title": "t"})
+        return await cache.get("http://patch.com/a/"), await cache.get("https://patch.com/b")
+
+    hit, miss = asyncio.run(run())
+    assert hit == {"text": "正文", "title": "t"}
+    assert miss is None
+    assert cache.stats["hits"] == 1
+    assert cache.stats["misses"] == 1
+
+
+def test_cache_expires_and_prunes_by_size(tmp_path):
+    """测试TTL过期与按大小淘汰最旧的文件"""
+    cache = ContentCache(cache_dir=tmp_path, ttl_days=1, max_bytes=10 * 1024 * 1024)
+    asyncio.run(cache.put("https://patch.com/old", {"text": "x"}))
+    old_path = cache._path("https://patch.com/old")
+    stale = time.time() - 2 * 86400
+    os.utime(old_path, (stale, stale))
+    assert asyncio.run(cache.get("https://patch.com/old")) is None
+
+    cache = ContentCache(cache_dir=tmp_path, ttl_days=1, max_bytes=1)
+    asyncio.run(cache.put("https://patch.com/1", {"text": "a" * 100}))
+    asyncio.run(cache.put("https://patch.com/2", {"text": "b" * 100}))
+    first = cache._path("https://patch.com/1")
+    os.utime(first, (time.time() - 10, time.time() - 10))
+
+    assert asyncio.run(cache.prune()) >= 1
+    assert not first.exists()
+
+
+def test_prune_evicts_least_recently_used(tmp_path):
+    """测试命中会刷新修改时间，淘汰时保留最近访问过的旧文件"""
+    urls = ["https://patch.com/1", "https://patch.com/2", "https://patch.com/3"]
+    cache = ContentCache(cache_dir=tmp_path, ttl_days=1, max_bytes=10 * 1024 * 1024)
+    for offset, url in enumerate(urls):
+        asyncio.run(cache.put(url, {"text": url * 10}))
+        written = time.time() - 100 + offset
+        os.utime(cache._path(url), (written, written))
+    assert asyncio.run(cache.get(urls[0])) is not None
+
+    sizes = sum(cache._path(url).stat().st_size for url in urls)
+    cache.max_bytes = sizes - 1
+    assert asyncio.run(cache.prune()) == 1
+    assert cache._path(urls[0]).exists()
+    assert not cache._path(urls[1]).exists()
+    assert cache._path(urls[2]).exists()
@@ -0,0 +1,26 @@
+"""
+正文提取进程池测试
+"""
+import asyncio
+from utils.content_extractor import ContentExtractor, extract_article
+
+
+def test_extract_article_returns_empty_result_for_blank_html():
+    """测试无正文时返回空结果而不是抛异常"""
+    result = extract_article(b"", "https://example.com/a")
+    assert result["text"] is None
+    assert set(result) == {"text", "title", "author", "date", "extractor"}
+
+
+def test_process_pool_extract_round_trip():
+    """测试通过工作进程提取并返回结果字典"""
+    extractor = ContentExtractor(workers=1)
+
+    async def run():
+        return await extractor.extract("<html><body></body></html>", "https://example.com/a", timeout=60)
+
+    try:
+        result = asyncio.run(run())
+    finally:
+        extractor.shutdown()
+    assert "text" in result
@@ -18,6 +18,17 @@ def test_clean_html():
     assert "<strong>" not in result
 
 
+def test_clean_html_matches_text_node_boundaries():
+    """测试HTML转文本：文本节点之间以空格分隔，跳过脚本/样式，纯文本走快速路径"""
+    cleaner = DataCleaner()
+    
+    assert cleaner.clean_html("<p>这是<strong>测试</strong>内容</p>") == "这是 测试 内容"
+    assert cleaner.clean_html("<div>a<!-- c -->b<script>var x = 1;</script><style>p {}</style>c</div>") == "a b c"
+    assert cleaner.clean_html("<p>AT&amp;T</p>\n<p>x &lt; y</p>") == "AT&T x < y"
+    assert cleaner.clean_html("  plain\n text  summary ") == "plain text summary"
+    assert cleaner.clean_html("Q&amp;A") == "Q&A"
+
+
 def test_normalize_date():
     """测试日期标准化"""
     cleaner = DataCleaner()
@@ -43,6 +54,27 @@ def test_extract_keywords():
     assert any("房价" in k or "price" in k.lower() for k in keywords)
 
 
+def test_extract_keywords_single_pass_order_and_overlaps():
+    """测试单次扫描的关键词匹配：与按类别逐个 re.findall 的输出一致（类别内按书写顺序取词、限制10个）"""
+    cleaner = DataCleaner()
+    
+    text = "Rental demand rises as Mortgage Rates fall; wholesale market, home price 房价"
+    keywords = cleaner.extract_keywords(text)
+    
+    # "rent|rental" 对 "Rental" 只得到 "rent"；"mortgage" 与 "mortgage rate" 属于不同类别，各自匹配
+    assert keywords == ["home price", "房价", "sale", "mortgage rate", "market", "mortgage", "rent", "demand"]
+    assert cleaner.extract_keywords_batch([text, "", "no match here"]) == [keywords, [], []]
+    
+    text = (
+        "wholesale policy mortgage rates and rental prices; home price and housing market; "
+        "interest rate; supply inventory demand"
+    )
+    assert cleaner.extract_keywords(text) == [
+        "home price", "sale", "policy", "mortgage rate", "interest rate",
+        "market", "mortgage", "rent", "supply", "inventory",
+    ]
+
+
 def test_filter_by_time_range():
     """测试时间范围过滤"""
     cleaner = DataCleaner(time_range_days=7)
@@ -0,0 +1,49 @@
+"""
+日期解析引擎测试
+"""
+from datetime import datetime, timedelta, timezone
+
+from utils.date_engine import DateEngine
+
+NOW = datetime(2026, 3, 4, 12, 0, tzinfo=timezone.utc)
+
+
+def test_relative_and_absolute_dates():
+    """测试相对时间语法与ISO快速路径（相对时间以参考时钟为基准）"""
+    engine = DateEngine(clock=lambda: NOW)
+
+    assert engine.parse("5h") == NOW - timedelta(hours=5)
+    assert engine.parse("2 days ago") == NOW - timedelta(days=2)
+    assert engine.parse("Posted 30 minutes ago") == NOW - timedelta(minutes=30)
+    assert engine.parse("Yesterday") == NOW - timedelta(days=1)
+    assert engine.parse("3小时前") == NOW - timedelta(hours=3)
+    assert engine.parse("2026-01-26T21:56:00Z") == datetime(2026, 1, 26, 21, 56, tzinfo=timezone.utc)
+    assert engine.parse("2026-01-26 21:56:00") == datetime(2026, 1, 26, 21, 56, tzinfo=timezone.utc)
+
+
+def test_text_dates_and_failures():
+    """测试自然语言日期（缺失部分取参考日期）、无法解析的值与datetime透传"""
+    engine = DateEngine(clock=lambda: NOW)
+
+    assert engine.parse("10:30 AM") == datetime(2026, 3, 4, 10, 30, tzinfo=timezone.utc)
+    assert engine.parse("Jan 5, 2026") == datetime(2026, 1, 5, tzinfo=timezone.utc)
+    # 包含 "day"/"now" 的普通文本不再被误判为相对时间
+    assert engine.parse("Monday, Feb 2, 2026") == datetime(2026, 2, 2, tzinfo=timezone.utc)
+    assert engine.parse("not a known date") is None
+    assert engine.parse("") is None
+    assert engine.parse(datetime(2026, 1, 1)) == datetime(2026, 1, 1, tzinfo=timezone.utc)
+    assert DateEngine.isoformat(NOW) == "2026-03-04T12:00:00+00:00"
+
+
+def test_text_dates_never_in_future():
+    """测试缺少年份/只有星期几的文本回退到参考日期之前（dateutil 补齐后会落在未来）"""
+    saturday = datetime(2026, 10, 17, 9, 0, tzinfo=timezone.utc)
+    engine = DateEngine(clock=lambda: saturday)
+
+    assert engine.parse("Monday") == datetime(2026, 10, 12, tzinfo=timezone.utc)
+    assert engine.parse("Saturday") == datetime(2026, 10, 17, tzinfo=timezone.utc)
+    assert engine.parse("Dec 25") == datetime(2025, 12, 25, tzinfo=timezone.utc)
+    assert engine.parse("Oct 16") == datetime(2026, 10, 16, tzinfo=timezone.utc)
+    # 同一天内稍后的时间与明确的年份不回退
+    assert engine.parse("10:30 PM") == datetime(2026, 10, 17, 22, 30, tzinfo=timezone.utc)
+    assert engine.parse("Dec 25, 2026") == datetime(2026, 12, 25, tzinfo=timezone.utc)
@@ -0,0 +1,31 @@
+"""
+Dify客户端测试
+"""
+import asyncio
+from utils.dify_client import DifyClient
+
+
+def test_session_is_reused_until_closed():
+    """测试长连接会话跨调用复用，关闭后重新创建"""
+    client = DifyClient()
+
+    async def run():
+        first = client._get_session()
+        second = client._get_session()
+        await client.close()
+        third = client._get_session()
+        await client.close()
+        return first, second, third
+
+    first, second, third = asyncio.run(run())
+    assert first is second
+    assert third is not first
+    assert first.closed and third.closed
+
+
+def test_is_approved():
+    """测试审核结果判断"""
+    client = DifyClient()
+    assert client.is_approved({"data": {"outputs": {"status": "approve"}}})
+    assert not client.is_approved({"data": {"outputs": {"status": "REJECT"}}})
+    assert not client.is_approved({"error": "timeout"})
@@ -0,0 +1,95 @@
+"""
+声明式列表页提取规格测试
+"""
+import asyncio
+
+import pytest
+
+# scrapers 包在导入时会加载 Playwright 相关依赖
+pytest.importorskip("playwright")
+
+from scrapers.extraction_spec import (
+    ExtractionSpec, FieldSpec, GENERIC_ARTICLE_FIELDS, extract_listing, extract_listing_from_html
+)
+
+
+class _FakePage:
+    """记录 evaluate 调用的页面替身"""
+
+    def __init__(self, result=None, error=None):
+        self.calls = []
+        self._result = result
+        self._error = error
+
+    async def evaluate(self, script, arg):
+        self.calls.append(arg)
+        if self._error:
+            raise self._error
+        return self._result
+
+
+SPEC = ExtractionSpec(
+    containers=["article.card", "article"],
+    fields={
+        "title": FieldSpec(["h2.title", "h2"]),
+        "url": FieldSpec(["a.title-link", "a[href]"], attr="href"),
+        "publish_date": FieldSpec(["time"], attr="datetime", text_fallback=True),
+    },
+    fallback_fields=GENERIC_ARTICLE_FIELDS,
+)
+
+
+def test_spec_serializes_for_page_function():
+    """测试规格序列化为页面函数参数"""
+    args = SPEC.to_js()
+
+    assert args["containers"] == ["article.card", "article"]
+    assert args["fields"]["url"] == {"selectors": ["a.title-link", "a[href]"], "attr": "href", "textFallback": False}
+    assert args["fields"]["publish_date"]["textFallback"] is True
+    assert set(args["fallbackFields"]) == {"title", "url", "publish_date", "summary"}
+    assert args["required"] == ["title", "url"]
+
+
+def test_extract_listing_uses_single_evaluate():
+    """测试整页提取只调用一次 page.evaluate"""
+    page = _FakePage(result={
+        "selector": "article.card",
+        "containerCount": 12,
+        "items": [{"title": "A", "url": "/a", "publish_date": None}],
+    })
+
+    result = asyncio.run(extract_listing(page, SPEC, max_containers=10, limit=5))
+
+    assert len(page.calls) == 1
+    assert page.calls[0]["maxContainers"] == 10
+    assert page.calls[0]["limit"] == 5
+    assert result.selector == "article.card"
+    assert result.container_count == 12
+    assert result.items == [{"title": "A", "url": "/a", "publish_date": None}]
+
+
+def test_extract_listing_returns_none_when_page_fails():
+    """测试页面内执行失败时返回None（调用方回退逐元素提取）"""
+    page = _FakePage(error=RuntimeError("Target page, context or browser has been closed"))
+
+    assert asyncio.run(extract_listing(page, SPEC)) is None
+
+
+def test_extract_listing_from_html_matches_page_semantics():
+    """测试不启动浏览器按同一规格解析HTML：跳过隐藏容器，必需字段缺失时回退通用字段"""
+    html = """
+    <article class="card"><h2 class="title">First</h2><a class="title-link" href="/first">go</a>
+        <time datetime="2026-01-20">Jan 20</time></article>
+    <article class="card" hidden><h2 class="title">Hidden</h2><a href="/hidden">go</a></article>
+    <article class="card"><h3>Second</h3><a href="/second">go</a><time>January 21, 2026</time></article>
+    <article class="card"><h2 class="title">Third</h2><a href="/third">go</a></article>
+    """
+
+    result = extract_listing_from_html(html, SPEC, limit=2)
+
+    assert result.selector == "article.card"
+    assert result.container_count == 3
+    assert [item["url"] for item in result.items] == ["/first", "/second"]
+    assert result.items[0]["publish_date"] == "2026-01-20"
+    assert result.items[1]["title"] == "Second"
+    assert result.items[1]["publish_date"] == "January 21, 2026"
@@ -0,0 +1,101 @@
+"""
+HAR 录制/回放测试
+"""
+import asyncio
+
+from utils.har_archive import HarArchive, ReplayDatabase
+
+
+class _FakeContext:
+    def __init__(self):
+        self.routes = []
+
+    async def route(self, pattern, handler):
+        self.routes.append(("route", pattern))
+
+    async def route_from_har(self, path, not_found=None):
+        self.routes.append(("har", path, not_found))
+
+
+def test_record_options_number_contexts_per_scope(tmp_path, monkeypatch):
+    """测试录制：每个context一个HAR文件，同一zipcode第一次录制时清空旧录制"""
+    monkeypatch.setenv("HAR_MODE", "record")
+    monkeypatch.setenv("HAR_DIR", str(tmp_path))
+    stale = tmp_path / "patch" / "07042" / "007.har"
+    stale.parent.mkdir(parents=True)
+    stale.write_text("{}")
+    archive = HarArchive()
+
+    first = archive.context_options("Patch", "07042")
+    second = archive.context_options("Patch", "07042")
+    other = archive.context_options("Freddie Mac", None)
+
+    assert not stale.exists()
+    assert first["record_har_path"].endswith("patch/07042/001.har")
+    assert second["record_har_path"].endswith("patch/07042/002.har")
+    assert other["record_har_path"].endswith("freddie_mac/_all/001.har")
+
+
+def test_replay_prefers_own_scope_and_aborts_misses(tmp_path, monkeypatch):
+    """测试回放：先注册中止路由与其他zipcode的录制，本zipcode的录制最后注册（最先匹配）"""
+    monkeypatch.setenv("HAR_MODE", "replay")
+    monkeypatch.setenv("HAR_DIR", str(tmp_path))
+    monkeypatch.setenv("HAR_REPLAY_NOT_FOUND", "abort")
+    for scope in ("07042", "07043"):
+        (tmp_path / "patch" / scope).mkdir(parents=True)
+        (tmp_path / "patch" / scope / "001.har").write_text("{}")
+    archive = HarArchive()
+    context = _FakeContext()
+
+    assert asyncio.run(archive.apply_replay(context, "Patch", "07042")) is True
+    assert context.routes[0] == ("route", "**/*")
+    assert [entry[1].split("/")[-2] for entry in context.routes[1:]] == ["07043", "07042"]
+    assert all(entry[2] == "fallback" for entry in context.routes[1:])
+    assert HarArchive().context_options("Patch", "07042") == {}
+
+
+def test_new_record_run_replaces_previous_recording(tmp_path, monkeypatch):
+    """测试同一进程中的第二次录制：开始新一轮后重新清空旧录制并从001编号"""
+    monkeypatch.setenv("HAR_MODE", "record")
+    monkeypatch.setenv("HAR_DIR", str(tmp_path))
+    archive = HarArchive()
+    archive.context_options("Patch", "07042")
+    archive.context_options("Patch", "07042")
+
+    archive.start_run()
+    options = archive.context_options("Patch", "07042")
+
+    assert options["record_har_path"].endswith("patch/07042/001.har")
+    assert sorted(p.name for p in (tmp_path / "patch" / "07042").iterdir()) == []
+
+
+def test_content_and_inputs_replay_offline(tmp_path, monkeypatch):
+    """测试正文HTML与运行输入：录制时保存，回放时读取；回放的数据库写入端不入库"""
+    monkeypatch.setenv("HAR_DIR", str(tmp_path))
+    archive = HarArchive()
+    database = ReplayDatabase(archive)
+
+    async def record():
+        await archive.save_html("https://example.com/a", "<p>a</p>")
+        await archive.save_snapshot("sources", [{"id": 1, "source_name": "Patch"}])
+
+    async def replay():
+        return (
+            await archive.load_html("https://example.com/a"),
+            await archive.load_html("https://example.com/missing"),
+            await database.get_active_sources(),
+            await database.get_zipcodes_from_magnet(),
+            await database.find_existing_urls(["https://example.com/a"]),
+            await database.insert_raw_news([{"url": "https://example.com/a"}]),
+        )
+
+    monkeypatch.setenv("HAR_MODE", "record")
+    asyncio.run(record())
+    monkeypatch.setenv("HAR_MODE", "replay")
+    html, missing, sources, zipcodes, existing, inserted = asyncio.run(replay())
+
+    assert html == "<p>a</p>" and missing is None
+    assert sources == [{"id": 1, "source_name": "Patch"}] and zipcodes == []
+    assert existing == set()
+    assert inserted == (1, [{"url": "https://example.com/a", "id": 1}])
+    assert archive.stats["content_replayed"] == 1 and archive.stats["content_missing"] == 1
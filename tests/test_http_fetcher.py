@@ -0,0 +1,55 @@
+"""
+HTTP抓取层测试
+"""
+import asyncio
+from aiohttp import web
+from utils.http_fetcher import HttpFetcher
+
+
+def test_conditional_get_reuses_cached_body():
+    """测试第二次抓取发送条件请求，304时复用上次正文"""
+    seen_headers = []
+
+    async def handler(request):
+        seen_headers.append(request.headers.get("If-None-Match"))
+        if request.headers.get("If-None-Match") == '"v1"':
+            return web.Response(status=304)
+        return web.Response(text="<html>article</html>", headers={"ETag": '"v1"'}, content_type="text/html")
+
+    async def run():
+        app = web.Application()
+        app.router.add_get("/article", handler)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        fetcher = HttpFetcher()
+        try:
+            url = f"http://127.0.0.1:{port}/article"
+            first = await fetcher.fetch_text(url)
+            second = await fetcher.fetch(url)
+            return first, second, fetcher.stats
+        finally:
+            await fetcher.close()
+            await runner.cleanup()
+
+    first, second, stats = asyncio.run(run())
+    assert first == "<html>article</html>"
+    assert second.not_modified and second.text == first
+    assert seen_headers == [None, '"v1"']
+    assert stats["not_modified"] == 1
+
+
+def test_validator_cache_is_bounded_by_memory():
+    """测试条件请求缓存按正文总内存淘汰最久未使用的URL"""
+    body = "x" * 1000
+    fetcher = HttpFetcher(validator_cache_bytes=2500)
+
+    fetcher._remember("a", '"a"', None, body)
+    fetcher._remember("b", '"b"', None, body)
+    fetcher._remember("c", '"c"', None, body)
+    fetcher._remember("huge", '"h"', None, "x" * 10000)
+
+    assert list(fetcher._validators) == ["b", "c"]
+    assert fetcher._cached_bytes <= 2500
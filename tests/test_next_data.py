@@ -0,0 +1,28 @@
+"""
+Next.js 页面数据解析测试
+"""
+from pathlib import Path
+
+from utils.next_data import extract_next_data, feed_from_next_data, match_news_link, news_links_by_slug
+
+SAMPLE_HTML = Path(__file__).resolve().parent.parent / "analysis" / "dom_structures" / "newsbreak_full_dom.html"
+
+
+def test_feed_items_resolve_to_rendered_news_links():
+    """测试 feed 文章按标题slug对应到页面中的文章链接"""
+    html = SAMPLE_HTML.read_text(encoding="utf-8")
+    feed = feed_from_next_data(extract_next_data(html))
+    assert feed
+
+    links = news_links_by_slug(html)
+    paths = [match_news_link(item["title"], links) for item in feed]
+    assert all(path and path.startswith("/news/") for path in paths)
+    assert "/news/4461675687443-man-killed-in-weather-related-activity-in-arkansas" in paths
+
+
+def test_missing_or_broken_next_data_yields_empty_feed():
+    """测试没有或无法解析 __NEXT_DATA__ 时返回空feed"""
+    assert feed_from_next_data(extract_next_data("<html><body>no data</body></html>")) == []
+    broken = '<script id="__NEXT_DATA__" type="application/json">{not json</script>'
+    assert extract_next_data(broken) is None
+    assert match_news_link("Unrelated headline", {"other-story": "/news/1-other-story"}) is None
@@ -0,0 +1,30 @@
+"""
+抓取正文前去重测试
+"""
+import asyncio
+from utils.prefetch_dedupe import PrefetchDeduper
+
+
+def test_prefetch_dedupe_skips_in_run_and_stored_urls():
+    """测试剔除运行内重复与已入库的URL，并统计省下的抓取次数"""
+    async def known_lookup(normalized_urls):
+        return {u for u in normalized_urls if u.endswith("/stored")}
+
+    deduper = PrefetchDeduper(known_lookup)
+
+    async def run():
+        first = await deduper.filter_new([
+            {"url": "https://patch.com/a?utm=1"},
+            {"url": "https://patch.com/stored"},
+            {"url": ""},
+        ])
+        second = await deduper.filter_new([{"url": "http://patch.com/a/"}, {"url": "https://patch.com/b"}])
+        return first, second
+
+    first, second = asyncio.run(run())
+
+    assert [a["url"] for a in first] == ["https://patch.com/a?utm=1", ""]
+    assert [a["url"] for a in second] == ["https://patch.com/b"]
+    assert deduper.stats["in_run_duplicates"] == 1
+    assert deduper.stats["already_stored"] == 1
+    assert deduper.fetches_avoided == 2
@@ -0,0 +1,132 @@
+"""
+流式入库管道测试
+"""
+import asyncio
+from utils.raw_news_stream import RawNewsStream
+
+
+def _record(url):
+    return {"source_id": 1, "title": url, "url": url}
+
+
+def test_stream_batches_by_size_and_dedupes():
+    """测试按条数攒批、运行内去重、入库后回调"""
+    batches = []
+    reviewed = []
+
+    async def insert(batch):
+        batches.append([r["url"] for r in batch])
+        return len(batch), [dict(r, id=i) for i, r in enumerate(batch)]
+
+    async def on_inserted(records):
+        reviewed.extend(records)
+
+    async def run():
+        stream = RawNewsStream(
+            insert_func=insert,
+            key_func=lambda r: r["url"],
+            on_inserted=on_inserted,
+            batch_size=2,
+            flush_interval=60,
+            max_pending=10
+        )
+        await stream.start()
+        await stream.put([_record("a"), _record("b"), _record("a"), _record("c")])
+        return await stream.close()
+
+    stats = asyncio.run(run())
+
+    assert batches == [["a", "b"], ["c"]]
+    assert len(reviewed) == 3
+    assert stats["received"] == 4
+    assert stats["duplicates"] == 1
+    assert stats["inserted"] == 3
+
+
+def test_stream_flushes_on_interval():
+    """测试批次未满时按时间刷出（不必等到采集结束）"""
+    flushed = []
+
+    async def insert(batch):
+        flushed.append(len(batch))
+        return len(batch), []
+
+    async def run():
+        stream = RawNewsStream(
+            insert_func=insert,
+            key_func=lambda r: r["url"],
+            batch_size=100,
+            flush_interval=0.05,
+            max_pending=10
+        )
+        await stream.start()
+        await stream.put([_record("a")])
+        await asyncio.sleep(0.2)
+        flushed_before_close = list(flushed)
+        await stream.close()
+        return flushed_before_close
+
+    assert asyncio.run(run()) == [1]
+
+
+def test_stream_survives_insert_failure():
+    """测试单个批次入库失败不影响后续批次"""
+    calls = {"n": 0}
+
+    async def insert(batch):
+        calls["n"] += 1
+        if calls["n"] == 1:
+            raise RuntimeError("boom")
+        return len(batch), []
+
+    async def run():
+        stream = RawNewsStream(
+            insert_func=insert,
+            key_func=lambda r: "",
+            batch_size=1,
+            flush_interval=60,
+            max_pending=10
+        )
+        await stream.start()
+        await stream.put([_record("a"), _record("a")])
+        return await stream.close()
+
+    stats = asyncio.run(run())
+    assert stats["batches"] == 2
+    assert stats["inserted"] == 1
+
+
+def test_stream_post_queue_applies_backpressure():
+    """测试后处理跟不上时入库暂停（待后处理批次数有上限）"""
+    inserted = []
+    release = asyncio.Event()
+
+    async def insert(batch):
+        inserted.append(len(batch))
+        return len(batch), batch
+
+    async def on_inserted(records):
+        await release.wait()
+
+    async def run():
+        stream = RawNewsStream(
+            insert_func=insert,
+            key_func=lambda r: r["url"],
+            on_inserted=on_inserted,
+            batch_size=1,
+            flush_interval=60,
+            max_pending=10,
+            max_post_batches=1
+        )
+        await stream.start()
+        await stream.put([_record(str(i)) for i in range(5)])
+        await asyncio.sleep(0.05)
+        # 1 批在后处理中、1 批在队列中、1 批等待入队
+        inserted_while_blocked = len(inserted)
+        release.set()
+        stats = await stream.close()
+        return inserted_while_blocked, stats
+
+    inserted_while_blocked, stats = asyncio.run(run())
+    assert inserted_while_blocked == 3
+    assert stats["inserted"] == 5
@@ -0,0 +1,36 @@
+"""
+解析结果缓存测试
+"""
+import asyncio
+import time
+from utils.resolution_cache import ResolutionCache, flush_resolution_caches
+
+
+def test_resolution_cache_persists_and_negative_caches(tmp_path):
+    """测试正向结果与负缓存持久化：写入先留在内存，统一落盘后才写文件"""
+    cache = ResolutionCache("city", ttl_days=30, negative_ttl_days=1, cache_dir=tmp_path)
+    cache.put("90210", "/beverly-hills-ca")
+    cache.put_negative("00000")
+    assert not cache.path.exists()
+    asyncio.run(flush_resolution_caches())
+
+    reloaded = ResolutionCache("city", ttl_days=30, negative_ttl_days=1, cache_dir=tmp_path)
+    assert reloaded.get("90210") == (True, "/beverly-hills-ca")
+    assert reloaded.get("00000") == (True, None)
+    assert reloaded.get("10001") == (False, None)
+
+    reloaded.invalidate("90210")
+    assert reloaded.get("90210") == (False, None)
+
+
+def test_resolution_cache_expires_negative_entries_sooner(tmp_path):
+    """测试负缓存使用更短的TTL"""
+    cache = ResolutionCache("city", ttl_days=30, negative_ttl_days=1, cache_dir=tmp_path)
+    cache.put("90210", "/beverly-hills-ca")
+    cache.put_negative("00000")
+    two_days_ago = time.time() - 2 * 86400
+    for entry in cache._load().values():
+        entry["resolved_at"] = two_days_ago
+
+    assert cache.get("90210") == (True, "/beverly-hills-ca")
+    assert cache.get("00000") == (False, None)
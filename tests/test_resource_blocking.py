@@ -0,0 +1,74 @@
+"""
+浏览器请求拦截测试
+"""
+import asyncio
+
+from utils.resource_blocking import ESTIMATED_RESOURCE_BYTES, ResourceBlocker, ResourcePolicy, resource_policy_for
+
+
+class _FakeRequest:
+    def __init__(self, resource_type, url):
+        self.resource_type = resource_type
+        self.url = url
+
+
+class _FakeRoute:
+    def __init__(self, resource_type, url):
+        self.request = _FakeRequest(resource_type, url)
+        self.action = None
+
+    async def abort(self, error_code=None):
+        self.action = "abort"
+
+    async def fallback(self):
+        self.action = "fallback"
+
+
+class _FakeContext:
+    def __init__(self):
+        self.handler = None
+
+    async def route(self, pattern, handler):
+        self.handler = handler
+
+
+def test_policy_blocks_types_and_tracker_subdomains():
+    """测试按资源类型与域名（含子域名）拦截"""
+    policy = ResourcePolicy(block_types=frozenset({"image", "font"}), blocked_domains=("doubleclick.net",))
+
+    assert policy.block_reason("image", "https://patch.com/a.jpg") == "type"
+    assert policy.block_reason("script", "https://securepubads.g.doubleclick.net/tag.js") == "domain"
+    assert policy.block_reason("script", "https://notdoubleclick.net/x.js") is None
+    assert policy.block_reason("document", "https://patch.com/california/town") is None
+
+
+def test_blocker_routes_and_counts(monkeypatch):
+    """测试注册到context的拦截处理：拦截计数与估算节省流量，其余请求放行"""
+    monkeypatch.setenv("RESOURCE_BLOCKING_ENABLED", "true")
+    monkeypatch.setenv("RESOURCE_BLOCK_TYPES", "image,media")
+    monkeypatch.setenv("RESOURCE_BLOCK_DOMAINS", "google-analytics.com")
+    monkeypatch.setenv("RESOURCE_BLOCK_TYPES_OVERRIDES", '{"Realtor.com": []}')
+    blocker = ResourceBlocker()
+    context = _FakeContext()
+
+    assert asyncio.run(blocker.apply(context, "Patch")) is True
+    routes = [
+        _FakeRoute("image", "https://patch.com/a.jpg"),
+        _FakeRoute("script", "https://www.google-analytics.com/analytics.js"),
+        _FakeRoute("document", "https://patch.com/california/town"),
+    ]
+
+    async def run():
+        for route in routes:
+            await context.handler(route)
+
+    asyncio.run(run())
+
+    assert [route.action for route in routes] == ["abort", "abort", "fallback"]
+    assert sum(blocker.blocked.values()) == 2
+    assert blocker.allowed == 1
+    assert blocker.bytes_saved == ESTIMATED_RESOURCE_BYTES["image"] + ESTIMATED_RESOURCE_BYTES["script"]
+    assert resource_policy_for("Realtor.com") is None
+    
+    blocker.reset()
+    assert not blocker.blocked and blocker.allowed == 0 and blocker.bytes_saved == 0
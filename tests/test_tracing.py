@@ -0,0 +1,86 @@
+"""
+运行追踪测试
+"""
+import asyncio
+import json
+
+import pytest
+
+from utils.tracing import Tracer, percentile, traced
+import utils.tracing as tracing
+
+
+def test_percentile_nearest_rank():
+    """测试最近秩法百分位数"""
+    values = [float(v) for v in range(1, 21)]
+    assert percentile(values, 50) == 10.0
+    assert percentile(values, 95) == 19.0
+    assert percentile([3.0], 95) == 3.0
+    assert percentile([], 50) == 0.0
+
+
+def test_spans_write_jsonl_with_parents_and_summary(tmp_path, monkeypatch):
+    """测试span按嵌套关系写入追踪文件，装饰器记录采集源与异常，结束时写入汇总"""
+    monkeypatch.setenv("TRACE_ENABLED", "true")
+    tracer = Tracer()
+    monkeypatch.setattr(tracing, "tracer", tracer)
+
+    class _Scraper:
+        source_name = "Patch"
+
+        @traced()
+        async def scrape(self):
+            with tracer.span("parse", items=3):
+                pass
+            return 1
+
+        @traced("scrape.broken")
+        async def broken(self):
+            raise ValueError("boom")
+
+    async def run():
+        scraper = _Scraper()
+        await scraper.scrape()
+        with pytest.raises(ValueError):
+            await scraper.broken()
+
+    tracer.start_run("test", trace_dir=tmp_path)
+    asyncio.run(run())
+    summary = tracer.finish_run()
+
+    lines = [json.loads(line) for line in (tmp_path / "trace_test.jsonl").read_text(encoding="utf-8").splitlines()]
+    spans = {line["name"]: line for line in lines if "name" in line}
+    outer = spans["test_spans_write_jsonl_with_parents_and_summary.<locals>._Scraper.scrape"]
+    assert spans["parse"]["parent_id"] == outer["span_id"]
+    assert spans["parse"]["attrs"] == {"items": 3}
+    assert outer["attrs"] == {"source": "Patch"}
+    assert spans["scrape.broken"]["status"] == "error"
+    assert summary["scrape.broken"]["errors"] == 1
+    assert lines[-1]["summary"]["parse"]["count"] == 1
+    assert not tracer.active
+
+
+def test_concurrent_runs_keep_separate_traces(tmp_path, monkeypatch):
+    """测试同时进行的两次运行各自写入完整的追踪文件与汇总，互不结束对方"""
+    monkeypatch.setenv("TRACE_ENABLED", "true")
+    tracer = Tracer()
+
+    async def job(name, delay):
+        run = tracer.start_run(name, trace_dir=tmp_path)
+        for _ in range(3):
+            with tracer.span(f"{name}.step"):
+                await asyncio.sleep(delay)
+        return tracer.finish_run(run)
+
+    async def main():
+        return await asyncio.gather(job("first", 0.001), job("second", 0.002))
+
+    first, second = asyncio.run(main())
+
+    assert set(first) == {"first.step"} and first["first.step"]["count"] == 3
+    assert set(second) == {"second.step"} and second["second.step"]["count"] == 3
+    for name in ("first", "second"):
+        lines = [json.loads(line) for line in (tmp_path / f"trace_{name}.jsonl").read_text(encoding="utf-8").splitlines()]
+        assert [line["name"] for line in lines[:-1]] == [f"{name}.step"] * 3
+        assert lines[-1]["summary"][f"{name}.step"]["count"] == 3
+    assert not tracer.active
@@ -0,0 +1,31 @@
+"""
+本地URL去重索引测试
+"""
+from database.url_index import UrlSeenIndex
+
+
+def test_url_index_add_and_lookup(tmp_path):
+    """测试批量写入与批量查询"""
+    index = UrlSeenIndex(tmp_path / "url_index.sqlite3")
+    index.add_many(["https://patch.com/a", "https://patch.com/b", ""])
+
+    found = index.contains_many(["https://patch.com/a", "https://patch.com/c"])
+
+    assert found == {"https://patch.com/a"}
+    assert len(index) == 2
+    index.close()
+
+
+def test_url_index_replace_all_and_meta_persist(tmp_path):
+    """测试全量对账替换与元数据持久化"""
+    path = tmp_path / "url_index.sqlite3"
+    index = UrlSeenIndex(path)
+    index.add_many(["https://patch.com/a", "https://patch.com/b"])
+    index.replace_all(["https://patch.com/b"])
+    index.set_meta("crawl_time_watermark", "2026-01-01T00:00:00+00:00")
+    index.close()
+
+    reopened = UrlSeenIndex(path)
+    assert reopened.contains_many(["https://patch.com/a", "https://patch.com/b"]) == {"https://patch.com/b"}
+    assert reopened.get_meta("crawl_time_watermark") == "2026-01-01T00:00:00+00:00"
+    reopened.close()
@@ -0,0 +1,74 @@
+"""
+页面等待策略测试
+"""
+import asyncio
+
+import pytest
+
+from utils import wait_strategy
+from utils.wait_strategy import WaitStats, wait_for_any_selector, wait_for_selectors_gone
+
+
+@pytest.fixture
+def stats(monkeypatch):
+    """每个测试使用独立的统计实例，不写入进程级的 wait_stats"""
+    fresh = WaitStats()
+    monkeypatch.setattr(wait_strategy, "wait_stats", fresh)
+    return fresh
+
+
+class _FakeHandle:
+    def __init__(self, value):
+        self._value = value
+
+    async def json_value(self):
+        return self._value
+
+
+class _FakePage:
+    """wait_for_function 立即返回给定值或超时的页面替身"""
+
+    def __init__(self, value=None, timeout=False):
+        self.calls = []
+        self._value = value
+        self._timeout = timeout
+
+    async def wait_for_function(self, expression, arg=None, timeout=None):
+        self.calls.append((arg, timeout))
+        if self._timeout:
+            raise TimeoutError("Timeout exceeded")
+        return _FakeHandle(self._value)
+
+
+def test_any_selector_single_poll_and_records_saving(stats):
+    """测试任一选择器等待只发起一次页面轮询，并按原固定等待统计节省时间"""
+    page = _FakePage(value="article.card")
+
+    matched = asyncio.run(wait_for_any_selector(page, ["article.card", "article"], "test.ready", timeout=5, baseline=2))
+
+    assert matched == "article.card"
+    assert page.calls == [({"selectors": ["article.card", "article"], "visible": False}, 5000)]
+    entry = stats.steps["test.ready"]
+    assert entry["satisfied"] == 1
+    assert 0 < stats.saved("test.ready") <= 2
+
+
+def test_timeout_returns_none_without_raising(stats):
+    """测试超时不抛异常，由调用方按原逻辑继续"""
+    page = _FakePage(timeout=True)
+
+    assert asyncio.run(wait_for_any_selector(page, ["article"], "test.timeout", timeout=1)) is None
+    assert asyncio.run(wait_for_selectors_gone(page, ["#challenge-form"], "test.gone", timeout=1)) is False
+    assert stats.steps["test.timeout"]["satisfied"] == 0
+    stats.reset()
+    assert stats.steps == {}
+
+
+def test_saved_is_zero_for_steps_without_fixed_wait():
+    """测试原本没有固定等待的步骤不计入节省"""
+    stats = WaitStats()
+    stats.record("step", waited=1.5, baseline=0.0, satisfied=True)
+    stats.record("sleep", waited=0.5, baseline=3.0, satisfied=True)
+
+    assert stats.saved("step") == 0.0
+    assert stats.saved("sleep") == 2.5
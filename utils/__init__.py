@@ -2,5 +2,6 @@
 from utils.logger import logger, setup_logger
 from utils.data_cleaner import DataCleaner
 from utils.json_exporter import JSONExporter
+from utils.http_fetcher import HttpFetcher, http_fetcher
 
-__all__ = ['logger', 'setup_logger', 'DataCleaner', 'JSONExporter']
+__all__ = ['logger', 'setup_logger', 'DataCleaner', 'JSONExporter', 'HttpFetcher', 'http_fetcher']
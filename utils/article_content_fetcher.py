@@ -1,115 +1,65 @@
 """
 文章内容获取工具模块
-使用trafilatura和newspaper3k从URL提取文章真实内容
+命中正文磁盘缓存时直接返回；否则通过共享的 HTTP 抓取层下载一次HTML，再交给正文提取进程池（trafilatura → newspaper3k）提取文章真实内容。
+HAR 录制/回放模式下不使用正文缓存：录制时保存下载的HTML，回放时只读取录制的HTML，不访问网络
 """
-import asyncio
-from typing import Optional
+from typing import Any, Dict, Optional
 
+from config.settings import settings
+from utils.content_cache import content_cache
+from utils.content_extractor import content_extractor
+from utils.har_archive import har_archive
+from utils.http_fetcher import http_fetcher
 
-async def _fetch_with_trafilatura(url: str, timeout: int = 30) -> Optional[str]:
+
+async def fetch_article(url: str, timeout: int = 30) -> Optional[Dict[str, Any]]:
     """
-    使用trafilatura提取文章内容
-    
+    下载文章HTML（只下载一次）并提取正文与元数据，优先使用正文磁盘缓存
+
     Args:
         url: 文章URL
         timeout: 超时时间（秒）
-        
+
     Returns:
-        提取的文章文本内容，失败返回None
+        字典 {text, title, author, date, extractor}；下载失败或未提取到正文时返回None
     """
-    try:
-        from trafilatura import fetch_url, extract
-        
-        # 使用asyncio.to_thread包装同步调用
-        downloaded = await asyncio.wait_for(
-            asyncio.to_thread(fetch_url, url),
-            timeout=timeout
-        )
-        
-        if not downloaded:
-            return None
-        
-        # 提取文本内容
-        result = await asyncio.wait_for(
-            asyncio.to_thread(extract, downloaded, output_format='text'),
-            timeout=timeout
-        )
-        
-        if result and result.strip():
-            return result.strip()
-        
-        return None
-        
-    except asyncio.TimeoutError:
-        return None
-    except Exception:
+    if not url or not url.startswith(('http://', 'https://')):
         return None
 
+    # 录制时每篇都要下载并保存HTML，回放时要重新提取，都不走正文缓存
+    use_cache = settings.content_cache_enabled and not har_archive.active
+    if use_cache:
+        cached = await content_cache.get(url)
+        if cached and cached.get('text'):
+            return cached
 
-async def _fetch_with_newspaper3k(url: str, timeout: int = 30) -> Optional[str]:
-    """
-    使用newspaper3k提取文章内容
-    
-    Args:
-        url: 文章URL
-        timeout: 超时时间（秒）
-        
-    Returns:
-        提取的文章文本内容，失败返回None
-    """
-    try:
-        from newspaper import Article
-        
-        # 创建Article对象
-        article = Article(url)
-        
-        # 下载文章（使用asyncio.to_thread包装）
-        await asyncio.wait_for(
-            asyncio.to_thread(article.download),
-            timeout=timeout
-        )
-        
-        # 解析文章（使用asyncio.to_thread包装）
-        await asyncio.wait_for(
-            asyncio.to_thread(article.parse),
-            timeout=timeout
-        )
-        
-        # 获取文本内容
-        if article.text and article.text.strip():
-            return article.text.strip()
-        
-        return None
-        
-    except asyncio.TimeoutError:
+    if har_archive.mode == "replay":
+        html = await har_archive.load_html(url)
+    else:
+        html = await http_fetcher.fetch_text(url, timeout=timeout)
+        if html:
+            await har_archive.save_html(url, html)
+    if not html:
         return None
-    except Exception:
+
+    result = await content_extractor.extract(html, url, timeout=timeout)
+    if not result.get('text'):
         return None
+    if use_cache:
+        await content_cache.put(url, result)
+    return result
 
 
 async def fetch_article_content(url: str, timeout: int = 30) -> Optional[str]:
     """
     按优先级提取文章内容：trafilatura → newspaper3k
-    
+
     Args:
         url: 文章URL
         timeout: 超时时间（秒）
-        
+
     Returns:
         提取的文章文本内容，失败返回None
     """
-    if not url or not url.startswith(('http://', 'https://')):
-        return None
-    
-    # 优先尝试trafilatura
-    content = await _fetch_with_trafilatura(url, timeout)
-    if content:
-        return content
-    
-    # trafilatura失败，尝试newspaper3k
-    content = await _fetch_with_newspaper3k(url, timeout)
-    if content:
-        return content
-    
-    # 两者都失败，返回None
-    return None
+    result = await fetch_article(url, timeout)
+    return result['text'] if result else None
@@ -0,0 +1,331 @@
+"""
+并发控制工具模块
+提供令牌桶限速器（按域名）、多级并发限制（全局 / 信号源 / 域名）与请求合并（SingleFlight）
+"""
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from typing import Any, Awaitable, Callable, Dict, Iterable, Optional, Tuple
+from urllib.parse import urlparse
+
+from config.settings import settings
+from utils.logger import logger
+
+
+def host_of(url_or_host: str) -> str:
+    """
+    提取URL的域名（已是域名时原样返回），统一小写并去掉 www. 前缀
+
+    Args:
+        url_or_host: URL或域名
+
+    Returns:
+        域名字符串
+    """
+    if not url_or_host:
+        return ""
+    value = url_or_host.strip().lower()
+    if "://" in value:
+        value = urlparse(value).netloc
+    if value.startswith("www."):
+        value = value[4:]
+    return value
+
+
+class TokenBucket:
+    """令牌桶：平均速率 rate 个/秒，最多允许 capacity 个突发"""
+
+    def __init__(self, rate: float, capacity: float = 1.0, clock: Callable[[], float] = time.monotonic):
+        """
+        初始化令牌桶
+
+        Args:
+            rate: 每秒补充的令牌数
+            capacity: 桶容量（允许的突发请求数）
+            clock: 单调时钟（便于测试替换）
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.capacity = max(1.0, capacity)
+        self._clock = clock
+        self._tokens = self.capacity
+        self._updated_at = clock()
+        self._lock: Optional[asyncio.Lock] = None
+
+    def _refill(self):
+        now = self._clock()
+        elapsed = now - self._updated_at
+        if elapsed > 0:
+            self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+            self._updated_at = now
+
+    async def acquire(self, tokens: float = 1.0) -> float:
+        """
+        获取令牌，不足时等待（按到达顺序排队）
+
+        Args:
+            tokens: 需要的令牌数
+
+        Returns:
+            实际等待的秒数
+        """
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        waited = 0.0
+        async with self._lock:
+            while True:
+                self._refill()
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return waited
+                delay = (tokens - self._tokens) / self.rate
+                await asyncio.sleep(delay)
+                waited += delay
+
+
+class DomainRateLimiter:
+    """按域名的令牌桶限速器，保证对单个站点的请求密度不超过配置速率"""
+
+    def __init__(self, rate_per_minute: Optional[float] = None, burst: Optional[int] = None):
+        """
+        初始化域名限速器
+
+        Args:
+            rate_per_minute: 每个域名每分钟允许的请求数（默认使用配置）
+            burst: 每个域名允许的突发请求数（默认使用配置）
+        """
+        self._rate_per_minute = rate_per_minute
+        self._burst = burst
+        self._buckets: Dict[str, TokenBucket] = {}
+
+    def _bucket(self, host: str) -> TokenBucket:
+        bucket = self._buckets.get(host)
+        if bucket is None:
+            rate_per_minute = self._rate_per_minute or settings.scrape_host_rate_per_minute
+            burst = self._burst or settings.scrape_host_rate_burst
+            bucket = TokenBucket(rate=rate_per_minute / 60.0, capacity=burst)
+            self._buckets[host] = bucket
+        return bucket
+
+    async def acquire(self, url_or_host: str) -> float:
+        """
+        为指定域名获取一次请求配额
+
+        Args:
+            url_or_host: URL或域名
+
+        Returns:
+            等待的秒数
+        """
+        host = host_of(url_or_host)
+        if not host:
+            return 0.0
+        waited = await self._bucket(host).acquire()
+        if waited > 0:
+            logger.debug(f"域名限速: {host} 等待 {waited:.2f}s")
+        return waited
+
+
+class ConcurrencyLimiter:
+    """
+    三级并发限制：全局上限 + 每个信号源上限 + 每个域名上限
+
+    每个信号源是独立的流水线：全局上限至少为已登记信号源的并发预算之和（reserve），
+    域名上限至少为使用该域名的信号源的预算，信号源的预算不会被另外两级截断
+    """
+
+    def __init__(
+        self,
+        global_limit: Optional[int] = None,
+        per_source_limit: Optional[int] = None,
+        per_host_limit: Optional[int] = None
+    ):
+        """
+        初始化并发限制器（信号量在首次使用时创建，确保绑定到运行中的事件循环）
+
+        Args:
+            global_limit: 全局并发上限（默认使用配置）
+            per_source_limit: 单个信号源并发上限（默认使用配置）
+            per_host_limit: 单个域名并发上限（默认使用配置）
+        """
+        self._global_limit = global_limit
+        self._per_source_limit = per_source_limit
+        self._per_host_limit = per_host_limit
+        self._global: Optional[asyncio.Semaphore] = None
+        self._global_capacity = 0
+        self._sources: Dict[str, asyncio.Semaphore] = {}
+        self._hosts: Dict[str, asyncio.Semaphore] = {}
+        self._host_capacity: Dict[str, int] = {}
+        self._reserved: Dict[str, int] = {}
+
+    @staticmethod
+    def _grow(semaphore: asyncio.Semaphore, capacity: int, needed: int) -> int:
+        """扩大信号量容量（释放额外的许可），返回新的容量"""
+        for _ in range(needed - capacity):
+            semaphore.release()
+        return max(capacity, needed)
+
+    def _global_semaphore(self) -> asyncio.Semaphore:
+        if self._global is None:
+            self._global_capacity = self._global_limit or settings.scrape_concurrency
+            self._global = asyncio.Semaphore(self._global_capacity)
+        return self._global
+
+    def reserve(self, sources: Iterable[str]):
+        """
+        登记参与运行的信号源：全局上限扩大到不小于所有已登记信号源的并发预算之和，
+        各信号源流水线都能用满自己的预算，不会在全局槽位上排在其他信号源之后
+
+        Args:
+            sources: 信号源名称
+        """
+        for source in sources:
+            self._reserved[source] = self.source_limit(source)
+        semaphore = self._global_semaphore()
+        self._global_capacity = self._grow(semaphore, self._global_capacity, sum(self._reserved.values()))
+
+    def source_limit(self, source: str) -> int:
+        """
+        获取信号源的并发预算（SCRAPE_SOURCE_CONCURRENCY_OVERRIDES 中的单独配置优先）
+
+        Args:
+            source: 信号源名称
+
+        Returns:
+            并发上限
+        """
+        override = settings.scrape_source_concurrency_overrides.get(source)
+        if override:
+            return max(1, int(override))
+        return self._per_source_limit or settings.scrape_source_concurrency
+
+    def _source_semaphore(self, source: str) -> asyncio.Semaphore:
+        if source not in self._sources:
+            self._sources[source] = asyncio.Semaphore(self.source_limit(source))
+        return self._sources[source]
+
+    def _host_semaphore(self, host: str, source: str) -> asyncio.Semaphore:
+        # 域名上限不低于使用该域名的信号源的预算（单独配置的预算不会被域名上限截断）
+        needed = max(self._per_host_limit or settings.scrape_host_concurrency, self.source_limit(source))
+        if host not in self._hosts:
+            self._hosts[host] = asyncio.Semaphore(needed)
+            self._host_capacity[host] = needed
+        elif needed > self._host_capacity[host]:
+            self._host_capacity[host] = self._grow(self._hosts[host], self._host_capacity[host], needed)
+        return self._hosts[host]
+
+    @asynccontextmanager
+    async def slot(self, source: str, host: Optional[str] = None):
+        """
+        获取一个执行槽位（按 信号源 → 域名 → 全局 的顺序获取，避免占用全局槽位排队）
+
+        Args:
+            source: 信号源名称
+            host: 目标域名（可选）
+        """
+        async with self._source_semaphore(source):
+            if host:
+                async with self._host_semaphore(host_of(host), source):
+                    async with self._global_semaphore():
+                        yield
+            else:
+                async with self._global_semaphore():
+                    yield
+
+
+class SingleFlight:
+    """
+    请求合并：同一个键同时只执行一次，并发调用方共享同一个结果；
+    可选在完成后保留结果一段时间，让稍后到达的调用方直接复用（如同一次运行中多个zipcode指向同一页面）
+    """
+
+    def __init__(self, result_ttl: float = 0.0, clock: Callable[[], float] = time.monotonic):
+        """
+        初始化请求合并器
+
+        Args:
+            result_ttl: 成功结果的保留秒数（0 表示只合并同时进行的调用）
+            clock: 单调时钟（便于测试替换）
+        """
+        self.result_ttl = result_ttl
+        self._clock = clock
+        self._inflight: Dict[Any, asyncio.Future] = {}
+        self._results: Dict[Any, Tuple[float, Any]] = {}
+        self.stats: Dict[str, int] = {"executed": 0, "coalesced": 0}
+
+    async def do(self, key: Any, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        执行（或加入正在执行的）调用
+
+        Args:
+            key: 合并键
+            fn: 无参异步函数，只在没有进行中/可复用结果时调用
+
+        Returns:
+            fn 的结果（异常会传递给所有等待方，且不会被保留）；结果为 None 或空（如临时失败后返回的 []）时不保留；
+            执行方被取消时，等待方中的一个会重新执行
+        """
+        while True:
+            cached = self._results.get(key)
+            if cached is not None:
+                stored_at, value = cached
+                if self._clock() - stored_at <= self.result_ttl:
+                    self.stats["coalesced"] += 1
+                    return value
+                del self._results[key]
+
+            future = self._inflight.get(key)
+            if future is None:
+                break
+            try:
+                value = await asyncio.shield(future)
+            except asyncio.CancelledError:
+                if not future.cancelled():
+                    raise
+                # 执行方被取消（如超时），由当前调用方重新执行
+                continue
+            self.stats["coalesced"] += 1
+            return value
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        self.stats["executed"] += 1
+        try:
+            value = await fn()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # 没有其他等待方时避免 "Future exception was never retrieved"
+            future.exception()
+            raise
+        else:
+            future.set_result(value)
+            if self.result_ttl > 0 and value is not None and value != []:
+                self._prune()
+                self._results[key] = (self._clock(), value)
+            return value
+        finally:
+            self._inflight.pop(key, None)
+
+    def _prune(self):
+        """清除已过期的结果（过期键不一定会被再次请求，常驻进程中不能只在命中时删除）"""
+        now = self._clock()
+        expired = [key for key, (stored_at, _) in self._results.items() if now - stored_at > self.result_ttl]
+        for key in expired:
+            del self._results[key]
+
+    def forget(self, key: Any):
+        """丢弃已保留的结果（下次调用重新执行）"""
+        self._results.pop(key, None)
+
+    def reset(self):
+        """清空保留的结果与统计（新一轮采集开始时调用）"""
+        self._results.clear()
+        self.stats = {"executed": 0, "coalesced": 0}
+
+    def log_stats(self, name: str):
+        """输出合并统计"""
+        logger.info(f"请求合并 {name}: 实际执行={self.stats['executed']}, 合并复用={self.stats['coalesced']}")
@@ -0,0 +1,165 @@
+"""
+文章正文磁盘缓存模块
+以标准化URL为键，将提取出的正文与元数据压缩后保存在本地磁盘，按TTL与总大小淘汰
+"""
+import asyncio
+import hashlib
+import json
+import os
+import threading
+import time
+import zlib
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+from config.settings import settings
+from utils.data_cleaner import DataCleaner
+from utils.logger import logger
+
+
+class ContentCache:
+    """
+    正文磁盘缓存
+
+    - 文件路径：<cache_dir>/<哈希前2位>/<哈希>.z，内容为zlib压缩的JSON
+    - 命中时把文件修改时间更新为当前时间，修改时间即最近一次访问时间
+    - 读取时按修改时间判断是否过期（TTL，即超过TTL未被访问）
+    - prune() 删除过期文件，并按修改时间从旧到新删除直到总大小不超过上限（LRU）
+    - 压缩与文件读写都在线程中执行，不阻塞事件循环
+    """
+
+    def __init__(
+        self,
+        cache_dir: Optional[Path] = None,
+        ttl_days: Optional[float] = None,
+        max_bytes: Optional[int] = None
+    ):
+        """
+        初始化缓存
+
+        Args:
+            cache_dir: 缓存目录（默认使用配置）
+            ttl_days: 过期天数（默认使用配置）
+            max_bytes: 缓存总大小上限（默认使用配置）
+        """
+        self.cache_dir = Path(cache_dir or settings.content_cache_dir)
+        self.ttl_seconds = (ttl_days if ttl_days is not None else settings.content_cache_ttl_days) * 86400
+        self.max_bytes = max_bytes if max_bytes is not None else settings.content_cache_max_mb * 1024 * 1024
+        self.stats: Dict[str, int] = {"hits": 0, "misses": 0, "writes": 0, "evicted": 0}
+
+    def _path(self, url: str) -> Path:
+        key = hashlib.sha1(DataCleaner.normalize_url(url).encode('utf-8')).hexdigest()
+        return self.cache_dir / key[:2] / f"{key}.z"
+
+    async def get(self, url: str) -> Optional[Dict[str, Any]]:
+        """
+        读取缓存
+
+        Args:
+            url: 文章URL（内部会标准化）
+
+        Returns:
+            缓存的数据字典；不存在、过期或损坏时返回None
+        """
+        data = await asyncio.to_thread(self._read, url)
+        self.stats["hits" if data is not None else "misses"] += 1
+        return data
+
+    async def put(self, url: str, data: Dict[str, Any]):
+        """
+        写入缓存（先写临时文件再替换，避免并发读到半个文件）
+
+        Args:
+            url: 文章URL（内部会标准化）
+            data: 要缓存的数据字典（需可JSON序列化）
+        """
+        if await asyncio.to_thread(self._write, url, data):
+            self.stats["writes"] += 1
+
+    async def prune(self) -> int:
+        """
+        淘汰过期与超出容量的缓存文件
+
+        Returns:
+            删除的文件数
+        """
+        removed, total = await asyncio.to_thread(self._prune)
+        self.stats["evicted"] += removed
+        if removed:
+            logger.info(f"正文缓存淘汰 {removed} 个文件，剩余约 {total / 1024 / 1024:.1f}MB")
+        return removed
+
+    def _read(self, url: str) -> Optional[Dict[str, Any]]:
+        """在线程中读取并解压缓存文件，命中时更新修改时间"""
+        path = self._path(url)
+        try:
+            if time.time() - path.stat().st_mtime > self.ttl_seconds:
+                path.unlink(missing_ok=True)
+                return None
+            data = json.loads(zlib.decompress(path.read_bytes()))
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.debug(f"读取正文缓存失败: {url}, {str(e)}")
+            path.unlink(missing_ok=True)
+            return None
+        return data
+
+    def _write(self, url: str, data: Dict[str, Any]) -> bool:
+        """在线程中压缩并写入缓存文件，返回是否写入成功"""
+        path = self._path(url)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            payload = zlib.compress(json.dumps(data, ensure_ascii=False, default=str).encode('utf-8'), 6)
+            tmp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+            tmp_path.write_bytes(payload)
+            os.replace(tmp_path, path)
+            return True
+        except Exception as e:
+            logger.debug(f"写入正文缓存失败: {url}, {str(e)}")
+            return False
+
+    def _prune(self) -> Tuple[int, int]:
+        """在线程中扫描缓存目录并删除文件，返回 (删除的文件数, 剩余总大小)"""
+        if not self.cache_dir.exists():
+            return 0, 0
+        now = time.time()
+        entries = []
+        removed = 0
+        for path in self.cache_dir.glob("*/*.z"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            if now - stat.st_mtime > self.ttl_seconds:
+                path.unlink(missing_ok=True)
+                removed += 1
+            else:
+                entries.append((stat.st_mtime, stat.st_size, path))
+
+        total = sum(size for _, size, _ in entries)
+        if total > self.max_bytes:
+            for _, size, path in sorted(entries, key=lambda e: e[0]):
+                path.unlink(missing_ok=True)
+                removed += 1
+                total -= size
+                if total <= self.max_bytes:
+                    break
+        return removed, total
+
+    def reset_stats(self):
+        """清零统计（每轮采集开始时调用，日志中的统计只反映本轮）"""
+        for key in self.stats:
+            self.stats[key] = 0
+
+    def log_stats(self):
+        """输出缓存统计"""
+        logger.info(
+            f"正文缓存统计: 命中={self.stats['hits']}, 未命中={self.stats['misses']}, "
+            f"写入={self.stats['writes']}, 淘汰={self.stats['evicted']}"
+        )
+
+
+# 全局正文缓存实例
+content_cache = ContentCache()
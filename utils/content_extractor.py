@@ -0,0 +1,152 @@
+"""
+文章正文提取模块
+trafilatura / newspaper3k 的解析是CPU密集的lxml计算，放在独立的进程池中执行，
+避免在默认线程池里与驱动 Playwright 的事件循环争抢GIL
+"""
+import asyncio
+import json
+import multiprocessing
+from concurrent.futures import Executor, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Dict, Optional, Union
+
+from config.settings import settings
+from utils.logger import logger
+
+
+def _empty_result() -> Dict[str, Any]:
+    return {"text": None, "title": None, "author": None, "date": None, "extractor": None}
+
+
+def _extract_with_trafilatura(html: str, url: str) -> Optional[Dict[str, Any]]:
+    try:
+        from trafilatura import extract
+    except ImportError:
+        return None
+    raw = extract(html, url=url, output_format='json', with_metadata=True)
+    if not raw:
+        return None
+    data = json.loads(raw)
+    text = (data.get("text") or "").strip()
+    if not text:
+        return None
+    return {
+        "text": text,
+        "title": data.get("title"),
+        "author": data.get("author"),
+        "date": data.get("date"),
+        "extractor": "trafilatura",
+    }
+
+
+def _extract_with_newspaper3k(html: str, url: str) -> Optional[Dict[str, Any]]:
+    try:
+        from newspaper import Article
+    except ImportError:
+        return None
+    article = Article(url)
+    article.download(input_html=html)
+    article.parse()
+    text = (article.text or "").strip()
+    if not text:
+        return None
+    return {
+        "text": text,
+        "title": article.title or None,
+        "author": ", ".join(article.authors) if article.authors else None,
+        "date": article.publish_date.isoformat() if article.publish_date else None,
+        "extractor": "newspaper3k",
+    }
+
+
+def extract_article(html: Union[str, bytes], url: str) -> Dict[str, Any]:
+    """
+    从HTML提取正文与元数据：trafilatura → newspaper3k（在工作进程中执行）
+
+    Args:
+        html: 文章HTML（str或bytes）
+        url: 文章URL
+
+    Returns:
+        字典 {text, title, author, date, extractor}，提取失败时 text 为 None
+    """
+    if isinstance(html, bytes):
+        html = html.decode('utf-8', errors='replace')
+    for extractor in (_extract_with_trafilatura, _extract_with_newspaper3k):
+        try:
+            result = extractor(html, url)
+        except Exception:
+            result = None
+        if result:
+            return result
+    return _empty_result()
+
+
+class ContentExtractor:
+    """
+    进程池正文提取器
+
+    - 工作进程数由 CONTENT_EXTRACT_WORKERS 配置，0 表示退回线程池执行
+    - 进程池懒创建（spawn 方式，不继承父进程中的浏览器/事件循环状态）
+    - 工作进程异常退出时重建进程池，本次调用返回空结果
+    """
+
+    def __init__(self, workers: Optional[int] = None):
+        """
+        初始化提取器
+
+        Args:
+            workers: 工作进程数（默认使用配置）
+        """
+        self._workers = workers
+        self._executor: Optional[Executor] = None
+
+    @property
+    def workers(self) -> int:
+        return self._workers if self._workers is not None else settings.content_extract_workers
+
+    def _get_executor(self) -> Optional[Executor]:
+        if self.workers <= 0:
+            return None
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+            logger.debug(f"正文提取进程池已启动: {self.workers} 个工作进程")
+        return self._executor
+
+    async def extract(self, html: Union[str, bytes], url: str, timeout: float = 30) -> Dict[str, Any]:
+        """
+        提取文章正文与元数据
+
+        Args:
+            html: 文章HTML
+            url: 文章URL
+            timeout: 超时时间（秒）
+
+        Returns:
+            字典 {text, title, author, date, extractor}
+        """
+        loop = asyncio.get_running_loop()
+        try:
+            return await asyncio.wait_for(
+                loop.run_in_executor(self._get_executor(), extract_article, html, url),
+                timeout=timeout,
+            )
+        except asyncio.TimeoutError:
+            logger.debug(f"正文提取超时: {url}")
+        except BrokenProcessPool:
+            logger.warning("正文提取进程池异常退出，已重建")
+            self.shutdown(wait=False)
+        return _empty_result()
+
+    def shutdown(self, wait: bool = True):
+        """关闭进程池（下次提取会重新创建）"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait, cancel_futures=True)
+            self._executor = None
+
+
+# 全局正文提取器实例
+content_extractor = ContentExtractor()
@@ -3,12 +3,13 @@
 提供日期标准化、HTML清理、关键词提取等功能
 """
 import re
-from typing import List, Dict, Any, Optional
-from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional, Union
+from datetime import datetime, timedelta
 from urllib.parse import urlparse, urlunparse, parse_qs
-from bs4 import BeautifulSoup
-from dateutil import parser
 
+from utils.date_engine import date_engine
+from utils.html_text import html_to_text
+from utils.keyword_matcher import KeywordMatcher
 from utils.logger import logger
 
 
@@ -28,6 +29,8 @@ class DataCleaner:
         r'供应|supply|inventory',
         r'需求|demand',
     ]
+    # 所有类别编译为一个前缀树正则，一次扫描完成匹配
+    _keyword_matcher = KeywordMatcher(KEYWORD_PATTERNS)
     
     def __init__(self, time_range_days: int = 7):
         """
@@ -38,7 +41,7 @@ class DataCleaner:
         """
         self.time_range_days = time_range_days
         # 使用offset-aware时间，避免比较错误
-        self.cutoff_date = datetime.now(timezone.utc) - timedelta(days=time_range_days)
+        self.cutoff_date = date_engine.now() - timedelta(days=time_range_days)
     
     def clean_html(self, html_content: str) -> str:
         """
@@ -54,14 +57,11 @@ class DataCleaner:
             return ""
         
         try:
-            soup = BeautifulSoup(html_content, 'lxml')
-            text = soup.get_text(separator=' ', strip=True)
-            # 清理多余的空白字符
-            text = re.sub(r'\s+', ' ', text)
-            return text.strip()
+            # 纯文本直接规整空白，HTML用lxml流式解析提取文本节点
+            return html_to_text(html_content)
         except Exception as e:
             logger.warning(f"HTML清理失败: {str(e)}")
-            # 如果BeautifulSoup失败，使用简单正则
+            # 如果解析失败，使用简单正则
             return re.sub(r'<[^>]+>', '', html_content).strip()
     
     @staticmethod
@@ -115,50 +115,22 @@ class DataCleaner:
             url = url.split('?')[0].split('#')[0].rstrip('/')
             return url if url else ""
     
-    def normalize_date(self, date_str: str) -> Optional[str]:
+    def normalize_date(self, date_str: Union[str, datetime]) -> Optional[str]:
         """
         标准化日期格式为ISO 8601
         
         Args:
-            date_str: 日期字符串（各种格式）
+            date_str: 日期字符串（各种格式）或 datetime
             
         Returns:
             ISO格式日期字符串，如果解析失败返回None
         """
-        if not date_str:
+        parsed_date = date_engine.parse(date_str)
+        if parsed_date is None:
+            if date_str:
+                logger.warning(f"日期解析失败: {date_str}")
             return None
-        
-        date_str = date_str.strip()
-        
-        # 处理相对时间
-        now = datetime.utcnow()
-        date_lower = date_str.lower()
-        
-        if "just now" in date_lower or "now" in date_lower:
-            return now.isoformat()
-        elif "minute" in date_lower:
-            minutes = int(re.search(r'(\d+)', date_str).group(1)) if re.search(r'(\d+)', date_str) else 0
-            return (now - timedelta(minutes=minutes)).isoformat()
-        elif "hour" in date_lower:
-            hours = int(re.search(r'(\d+)', date_str).group(1)) if re.search(r'(\d+)', date_str) else 0
-            return (now - timedelta(hours=hours)).isoformat()
-        elif "day" in date_lower or "yesterday" in date_lower:
-            days = 1 if "yesterday" in date_lower else (int(re.search(r'(\d+)', date_str).group(1)) if re.search(r'(\d+)', date_str) else 1)
-            return (now - timedelta(days=days)).isoformat()
-        elif "week" in date_lower:
-            weeks = int(re.search(r'(\d+)', date_str).group(1)) if re.search(r'(\d+)', date_str) else 1
-            return (now - timedelta(weeks=weeks)).isoformat()
-        elif "month" in date_lower:
-            months = int(re.search(r'(\d+)', date_str).group(1)) if re.search(r'(\d+)', date_str) else 1
-            return (now - timedelta(days=months * 30)).isoformat()
-        else:
-            # 尝试使用dateutil解析
-            try:
-                parsed_date = parser.parse(date_str)
-                return parsed_date.isoformat()
-            except Exception as e:
-                logger.warning(f"日期解析失败: {date_str} - {str(e)}")
-                return None
+        return parsed_date.isoformat()
     
     def extract_keywords(self, text: str) -> List[str]:
         """
@@ -170,23 +142,19 @@ class DataCleaner:
         Returns:
             关键词列表
         """
-        if not text:
-            return []
-        
-        text_lower = text.lower()
-        keywords = []
-        
-        for pattern in self.KEYWORD_PATTERNS:
-            matches = re.findall(pattern, text_lower, re.IGNORECASE)
-            if matches:
-                # 去重并添加到关键词列表
-                for match in matches:
-                    if isinstance(match, tuple):
-                        match = match[0] if match else ""
-                    if match and match not in keywords:
-                        keywords.append(match)
+        return self._keyword_matcher.match(text, limit=10)  # 限制关键词数量
+    
+    def extract_keywords_batch(self, texts: List[str]) -> List[List[str]]:
+        """
+        批量提取关键词（共用同一个已编译的匹配器）
         
-        return keywords[:10]  # 限制关键词数量
+        Args:
+            texts: 文本列表
+            
+        Returns:
+            与 texts 一一对应的关键词列表
+        """
+        return self._keyword_matcher.match_many(texts, limit=10)
     
     def filter_by_time_range(self, articles: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
@@ -201,38 +169,20 @@ class DataCleaner:
         filtered = []
         
         for article in articles:
-            publish_date_str = article.get('publish_date')
-            if not publish_date_str:
+            if not article.get('publish_date'):
                 # 如果没有发布日期，跳过
                 continue
             
-            try:
-                # 解析日期
-                if isinstance(publish_date_str, str):
-                    # 尝试解析ISO格式（支持Z后缀）
-                    try:
-                        publish_date = datetime.fromisoformat(publish_date_str.replace('Z', '+00:00'))
-                    except ValueError:
-                        # 如果ISO解析失败，使用dateutil
-                        publish_date = parser.parse(publish_date_str)
-                else:
-                    publish_date = publish_date_str
-                
-                # 确保publish_date是offset-aware（与cutoff_date一致）
-                if publish_date.tzinfo is None:
-                    # 假设是UTC时间
-                    publish_date = publish_date.replace(tzinfo=timezone.utc)
-                
-                # 检查是否在时间范围内
-                if publish_date >= self.cutoff_date:
-                    filtered.append(article)
-                else:
-                    logger.debug(f"文章超出时间范围，已过滤: {article.get('title', '')[:50]}")
-                    
-            except Exception as e:
-                logger.warning(f"日期解析失败，保留文章: {str(e)}")
+            # clean_article 已解析为带时区的datetime；字符串（旧数据）在这里解析
+            publish_date = date_engine.parse(article['publish_date'])
+            if publish_date is None:
+                logger.warning(f"日期解析失败，保留文章: {article.get('publish_date')}")
                 # 如果解析失败，保留文章（避免丢失数据）
                 filtered.append(article)
+            elif publish_date >= self.cutoff_date:
+                filtered.append(article)
+            else:
+                logger.debug(f"文章超出时间范围，已过滤: {article.get('title', '')[:50]}")
         
         return filtered
     
@@ -256,14 +206,10 @@ class DataCleaner:
             cleaned['content'] = self.clean_html(cleaned['content_summary'])
             cleaned['content_summary'] = cleaned['content']  # 保持向后兼容
         
-        # 标准化日期
+        # 标准化日期（统一为带时区的datetime，入库时再转为ISO字符串）
         if 'publish_date' in cleaned and cleaned['publish_date']:
-            normalized_date = self.normalize_date(cleaned['publish_date'])
-            if normalized_date:
-                cleaned['publish_date'] = normalized_date
-            else:
-                # 如果解析失败，使用当前时间
-                cleaned['publish_date'] = datetime.utcnow().isoformat()
+            # 如果解析失败，使用当前时间
+            cleaned['publish_date'] = date_engine.parse(cleaned['publish_date']) or date_engine.now()
         
         # 提取关键词（如果没有）
         if not cleaned.get('keywords') or len(cleaned.get('keywords', [])) == 0:
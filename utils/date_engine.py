@@ -0,0 +1,152 @@
+"""
+日期解析引擎
+DataCleaner 与各采集器共用的发布时间解析：ISO 快速路径（fromisoformat）→ 编译好的相对时间语法
+（"5h"、"2 days ago"、"yesterday"、"3小时前"）→ dateutil 兜底；相同字符串的解析结果缓存（LRU）。
+结果统一为带时区的 datetime（无时区的按UTC），相对时间以参考时钟为基准
+"""
+import re
+from datetime import datetime, time, timedelta, timezone
+from functools import lru_cache
+from typing import Callable, Optional, Tuple, Union
+
+from dateutil import parser as dateutil_parser
+from dateutil.relativedelta import relativedelta
+
+from utils.logger import logger
+
+# 相对时间单位 → 秒数（月按30天、年按365天）
+_UNIT_SECONDS = {
+    "s": 1, "sec": 1, "secs": 1, "second": 1, "seconds": 1, "秒": 1,
+    "m": 60, "min": 60, "mins": 60, "minute": 60, "minutes": 60, "分钟": 60,
+    "h": 3600, "hr": 3600, "hrs": 3600, "hour": 3600, "hours": 3600, "小时": 3600,
+    "d": 86400, "day": 86400, "days": 86400, "天": 86400,
+    "w": 604800, "wk": 604800, "wks": 604800, "week": 604800, "weeks": 604800, "周": 604800,
+    "mo": 2592000, "mos": 2592000, "month": 2592000, "months": 2592000, "个月": 2592000, "月": 2592000,
+    "y": 31536000, "yr": 31536000, "yrs": 31536000, "year": 31536000, "years": 31536000, "年": 31536000,
+}
+_UNITS = "|".join(sorted(map(re.escape, _UNIT_SECONDS), key=len, reverse=True))
+
+# 整个字符串就是相对时间："5h"、"2 days"、"an hour ago"、"3小时前"
+_RELATIVE_FULL = re.compile(rf"^(\d+|an?|one)\s*({_UNITS})\.?(?:\s*ago|\s*前)?$")
+# 文本中包含 "<数量> <单位> ago"（如 "Posted 3 hours ago"）
+_RELATIVE_AGO = re.compile(r"\b(\d+|an?|one)\s+(second|minute|hour|day|week|month|year)s?\s+ago\b")
+# 关键词：刚刚 / 今天 → 0，昨天 → 1天
+_RELATIVE_WORDS = re.compile(r"^(?:just now|now|today|刚刚|今天)$|\b(just now)\b|(yesterday|昨天)")
+
+
+def _amount(token: str) -> int:
+    return int(token) if token.isdigit() else 1
+
+
+@lru_cache(maxsize=4096)
+def _classify(text: str) -> Tuple[str, Optional[Union[datetime, timedelta]]]:
+    """
+    解析与参考时间无关的部分（结果缓存）
+
+    Returns:
+        ("abs", datetime) ISO 时间；("rel", timedelta) 相对时间；("text", None) 需交给 dateutil
+    """
+    try:
+        value = datetime.fromisoformat(text[:-1] + "+00:00" if text.endswith(("Z", "z")) else text)
+        return "abs", value if value.tzinfo else value.replace(tzinfo=timezone.utc)
+    except ValueError:
+        pass
+
+    lower = text.lower()
+    match = _RELATIVE_FULL.match(lower)
+    if match:
+        return "rel", timedelta(seconds=_amount(match.group(1)) * _UNIT_SECONDS[match.group(2)])
+    match = _RELATIVE_AGO.search(lower)
+    if match:
+        return "rel", timedelta(seconds=_amount(match.group(1)) * _UNIT_SECONDS[match.group(2)])
+    match = _RELATIVE_WORDS.search(lower)
+    if match:
+        return "rel", timedelta(days=1) if match.group(2) else timedelta(0)
+    return "text", None
+
+
+# 探测缺失日期部分用的两个默认值：年份不同；星期几相差2天，只有星期几的文本在两者下得到的月日必然不同
+_PROBE_DEFAULTS = (datetime(2000, 2, 29), datetime(2004, 2, 29))
+
+
+def _roll_back(text: str, value: datetime) -> datetime:
+    """
+    晚于参考日期的解析结果回退到过去：dateutil 用参考日期补齐缺失部分且只会向后取值
+    （周六解析 "Monday" 得到下周一，"Dec 25" 得到今年的12月25日）
+
+    - 文本含年份：原样返回（明确的未来日期）
+    - 只有星期几：回退7天（上一个同名的星期几）
+    - 没有年份：回退1年
+    """
+    first, second = (dateutil_parser.parse(text, default=default) for default in _PROBE_DEFAULTS)
+    if first.year == value.year:
+        return value
+    if (first.month, first.day) != (second.month, second.day):
+        return value - timedelta(days=7)
+    return value - relativedelta(years=1)
+
+
+@lru_cache(maxsize=4096)
+def _parse_text(text: str, reference_day: datetime) -> Optional[datetime]:
+    """dateutil 兜底解析（缺失的日期部分取参考日期，晚于参考日期的结果回退到过去，按参考日期缓存）"""
+    try:
+        value = dateutil_parser.parse(text, default=reference_day)
+        if value.replace(tzinfo=None) >= reference_day + timedelta(days=1):
+            value = _roll_back(text, value)
+    except (ValueError, OverflowError) as e:
+        logger.debug(f"日期解析失败: {text} - {str(e)}")
+        return None
+    return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
+
+
+class DateEngine:
+    """
+    发布时间解析（进程内共享一个实例）
+
+    - parse() 接受字符串或 datetime，返回带时区的 datetime（无法解析时返回None）
+    - 参考时钟可注入（测试或回放时固定"现在"）
+    """
+
+    def __init__(self, clock: Optional[Callable[[], datetime]] = None):
+        self._clock = clock or (lambda: datetime.now(timezone.utc))
+
+    def now(self) -> datetime:
+        """参考时钟的当前时间（UTC）"""
+        return self._clock()
+
+    def parse(self, value: Union[str, datetime, None], reference: Optional[datetime] = None) -> Optional[datetime]:
+        """
+        解析发布时间
+
+        Args:
+            value: 日期字符串（ISO、相对时间、自然语言日期）或 datetime
+            reference: 相对时间的基准（默认参考时钟的当前时间）
+
+        Returns:
+            带时区的 datetime；空值或无法解析时返回None
+        """
+        if isinstance(value, datetime):
+            return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
+        if not value or not isinstance(value, str):
+            return None
+        text = value.strip()
+        if not text:
+            return None
+
+        kind, parsed = _classify(text)
+        if kind == "abs":
+            return parsed
+        reference = reference or self.now()
+        if kind == "rel":
+            return reference - parsed
+        reference_day = datetime.combine(reference.date(), time.min)
+        return _parse_text(text, reference_day)
+
+    @staticmethod
+    def isoformat(value: Union[str, datetime, None]) -> Optional[str]:
+        """datetime 转为 ISO 字符串（入库/导出时使用），字符串原样返回"""
+        return value.isoformat() if isinstance(value, datetime) else value
+
+
+# 全局日期解析实例
+date_engine = DateEngine()
@@ -4,9 +4,12 @@ Dify工作流客户端封装
 """
 import asyncio
 import json
+import logging
 from typing import Dict, Any, Optional
 import aiohttp
+from config.settings import settings
 from utils.logger import logger
+from utils.tracing import traced
 
 
 class DifyClient:
@@ -17,7 +20,39 @@ class DifyClient:
         self.api_key = "app-11UCJJckzZQIu14r1TZrllQm"
         self.endpoint = "http://kno.fridgechannels.com/v1/workflows/run"
         self.timeout = aiohttp.ClientTimeout(total=30)  # 30秒超时
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._session_loop: Optional[asyncio.AbstractEventLoop] = None
     
+    def _get_session(self) -> aiohttp.ClientSession:
+        """
+        获取长连接会话（连接池 + keep-alive，跨调用复用）
+        会话绑定事件循环，循环变化或会话已关闭时重新创建
+        """
+        loop = asyncio.get_running_loop()
+        if self._session is None or self._session.closed or self._session_loop is not loop:
+            connector = aiohttp.TCPConnector(
+                limit=settings.dify_max_connections,
+                keepalive_timeout=60
+            )
+            self._session = aiohttp.ClientSession(
+                timeout=self.timeout,
+                connector=connector,
+                headers={
+                    "Authorization": f"Bearer {self.api_key}",
+                    "Content-Type": "application/json"
+                }
+            )
+            self._session_loop = loop
+        return self._session
+    
+    async def close(self):
+        """关闭长连接会话（任务结束时调用，下次调用会重新创建）"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        self._session_loop = None
+    
+    @traced()
     async def run_workflow(self, play_raw_news_id: int) -> Dict[str, Any]:
         """
         调用Dify工作流接口
@@ -29,11 +64,6 @@ class DifyClient:
             包含status字段的响应字典，格式如: {"status": "APPROVE", ...}
             如果调用失败，返回 {"error": "错误信息"}
         """
-        headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json"
-        }
-        
         payload = {
             "inputs": {
                 "play_raw_news_id": play_raw_news_id
@@ -43,25 +73,22 @@ class DifyClient:
         }
         
         try:
-            async with aiohttp.ClientSession(timeout=self.timeout) as session:
-                async with session.post(
-                    self.endpoint,
-                    headers=headers,
-                    json=payload
-                ) as response:
-                    if response.status == 200:
-                        result = await response.json()
-                        # 详细日志：打印完整的响应结构（用于诊断字段位置问题）
-                        logger.info(
-                            f"Dify工作流调用成功: play_raw_news_id={play_raw_news_id}\n"
-                            f"完整响应JSON:\n{json.dumps(result, indent=2, ensure_ascii=False)}"
+            async with self._get_session().post(self.endpoint, json=payload) as response:
+                if response.status == 200:
+                    result = await response.json()
+                    logger.info(f"Dify工作流调用成功: play_raw_news_id={play_raw_news_id}")
+                    # 完整响应结构仅在DEBUG级别输出（用于诊断字段位置问题）
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug(
+                            f"完整响应JSON (play_raw_news_id={play_raw_news_id}):\n"
+                            f"{json.dumps(result, indent=2, ensure_ascii=False)}"
                         )
-                        return result
-                    else:
-                        error_text = await response.text()
-                        error_msg = f"HTTP {response.status}: {error_text}"
-                        logger.error(f"Dify工作流调用失败: play_raw_news_id={play_raw_news_id}, {error_msg}")
-                        return {"error": error_msg}
+                    return result
+                else:
+                    error_text = await response.text()
+                    error_msg = f"HTTP {response.status}: {error_text}"
+                    logger.error(f"Dify工作流调用失败: play_raw_news_id={play_raw_news_id}, {error_msg}")
+                    return {"error": error_msg}
         
         except asyncio.TimeoutError:
             error_msg = "请求超时"
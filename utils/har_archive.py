@@ -0,0 +1,241 @@
+"""
+浏览器流量 HAR 录制/回放模块
+HAR_MODE=record 时每个浏览器 context 的流量录制为 HAR（按 采集源/zipcode 分目录），
+HAR_MODE=replay 时通过 context.route_from_har 回放录制的流量，不访问线上站点，
+用于在本地可重复地对调度、并发与浏览器池的改动做端到端基准测试。
+文章正文HTML与运行输入（信号源配置、zipcode列表）同样录制到 HAR_DIR；回放时由 ReplayDatabase
+代替数据库（dry-run：不写任务日志、不入库），整次采集任务可以完全离线运行
+"""
+import asyncio
+import hashlib
+import itertools
+import json
+import re
+import shutil
+from collections import Counter
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from config.settings import settings
+from utils.logger import logger
+
+HAR_MODES = ("off", "record", "replay")
+
+# 非 zipcode 采集（房地产新闻）使用的目录名
+SOURCE_WIDE_SCOPE = "_all"
+# 文章正文HTML与运行输入快照的目录名（采集源目录名不以下划线开头，不会冲突）
+CONTENT_DIR = "_content"
+SNAPSHOT_DIR = "_run"
+
+
+def _slug(value: str) -> str:
+    """目录名（采集源名称如 'Realtor.com'、'Freddie Mac'）"""
+    return re.sub(r"[^A-Za-z0-9_-]+", "_", value).strip("_").lower() or "unknown"
+
+
+class HarArchive:
+    """
+    HAR 录制/回放（进程内共享一个实例）
+
+    - 录制：一次运行中某个 采集源/zipcode 第一次录制时清空其旧录制，之后每个 context 写一个 NNN.har
+      （HAR 在 context 关闭时写入）
+    - 回放：优先匹配本 zipcode 的录制，其次同一采集源其他 zipcode 的录制
+      （town/城市页面在运行中由多个zipcode共享，录制与回放时由哪个zipcode取得可能不同）；
+      都没有命中的请求按 HAR_REPLAY_NOT_FOUND 中止（abort）或访问网络（fallback）
+    - 文章正文：录制时按URL保存下载的HTML，回放时只从录制读取（没有录制的文章不抓取正文）
+    """
+
+    def __init__(self):
+        self._sequence: Counter = Counter()
+        self._cleared: Set[Tuple[str, str]] = set()
+        self.stats: Counter = Counter()
+
+    def start_run(self):
+        """开始新一轮运行：清空录制序号与统计，之后第一次录制某个 采集源/zipcode 时重新清空其旧录制"""
+        self._sequence.clear()
+        self._cleared.clear()
+        self.stats.clear()
+
+    @property
+    def mode(self) -> str:
+        mode = settings.har_mode
+        return mode if mode in HAR_MODES else "off"
+
+    @property
+    def active(self) -> bool:
+        """是否处于录制或回放模式（此时采集器跳过HTTP快速路径，列表页流量全部经过浏览器）"""
+        return self.mode != "off"
+
+    def scope_dir(self, source_name: str, scope: Optional[str]) -> Path:
+        """采集源/zipcode 的录制目录"""
+        return settings.har_dir / _slug(source_name) / (_slug(scope) if scope else SOURCE_WIDE_SCOPE)
+
+    def context_options(self, source_name: str, scope: Optional[str]) -> Dict[str, Any]:
+        """
+        录制模式下传给 browser.new_context 的 HAR 参数
+
+        Args:
+            source_name: 采集源名称
+            scope: zipcode（非zipcode采集为None）
+
+        Returns:
+            record_har_* 参数；非录制模式返回空字典
+        """
+        if self.mode != "record":
+            return {}
+        key = (source_name, scope or SOURCE_WIDE_SCOPE)
+        directory = self.scope_dir(source_name, scope)
+        if key not in self._cleared:
+            shutil.rmtree(directory, ignore_errors=True)
+            self._cleared.add(key)
+        directory.mkdir(parents=True, exist_ok=True)
+        self._sequence[key] += 1
+        self.stats["recorded"] += 1
+        return {
+            "record_har_path": str(directory / f"{self._sequence[key]:03d}.har"),
+            "record_har_mode": "minimal",
+        }
+
+    def _replay_files(self, source_name: str, scope: Optional[str]) -> List[Path]:
+        """回放使用的HAR文件，按匹配优先级从低到高排列（后注册的路由先匹配）"""
+        own_dir = self.scope_dir(source_name, scope)
+        own = sorted(own_dir.glob("*.har"))
+        source_dir = own_dir.parent
+        others = sorted(p for p in source_dir.glob("*/*.har") if p.parent != own_dir) if source_dir.exists() else []
+        return others + own
+
+    async def apply_replay(self, context, source_name: str, scope: Optional[str]) -> bool:
+        """
+        回放模式下在 context 上注册 HAR 路由（需在请求拦截等其他路由之前注册）
+
+        Args:
+            context: Playwright BrowserContext
+            source_name: 采集源名称
+            scope: zipcode（非zipcode采集为None）
+
+        Returns:
+            是否注册了回放
+        """
+        if self.mode != "replay":
+            return False
+        if settings.har_replay_not_found == "abort":
+            async def abort(route):
+                await route.abort()
+
+            # 最先注册的路由最后匹配：所有HAR都没有命中的请求在此中止，保证回放不访问网络
+            await context.route("**/*", abort)
+        files = self._replay_files(source_name, scope)
+        if not files:
+            self.stats["missing"] += 1
+            logger.warning(f"{source_name}: 没有找到 {scope or SOURCE_WIDE_SCOPE} 的HAR录制（{self.scope_dir(source_name, scope)}）")
+            return True
+        for path in files:
+            await context.route_from_har(str(path), not_found="fallback")
+        self.stats["replayed"] += 1
+        return True
+
+    def _content_path(self, url: str) -> Path:
+        return settings.har_dir / CONTENT_DIR / f"{hashlib.sha1(url.encode('utf-8')).hexdigest()}.html"
+
+    async def save_html(self, url: str, html: str):
+        """录制模式下保存文章正文HTML（在线程中写盘，不阻塞事件循环）"""
+        if self.mode != "record":
+            return
+        path = self._content_path(url)
+
+        def write():
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(html, encoding="utf-8")
+
+        try:
+            await asyncio.to_thread(write)
+            self.stats["content_recorded"] += 1
+        except OSError as e:
+            logger.warning(f"保存正文录制失败: {url} - {str(e)}")
+
+    async def load_html(self, url: str) -> Optional[str]:
+        """回放时读取录制的文章正文HTML，没有录制返回None"""
+        try:
+            html = await asyncio.to_thread(self._content_path(url).read_text, encoding="utf-8")
+        except OSError:
+            self.stats["content_missing"] += 1
+            return None
+        self.stats["content_replayed"] += 1
+        return html
+
+    async def save_snapshot(self, name: str, data: Any):
+        """录制模式下保存运行输入（如信号源配置、zipcode列表），回放时由 ReplayDatabase 读取"""
+        if self.mode != "record":
+            return
+        path = settings.har_dir / SNAPSHOT_DIR / f"{name}.json"
+
+        def write():
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(json.dumps(data, ensure_ascii=False, default=str), encoding="utf-8")
+
+        try:
+            await asyncio.to_thread(write)
+        except OSError as e:
+            logger.warning(f"保存运行输入快照失败: {name} - {str(e)}")
+
+    async def load_snapshot(self, name: str) -> Optional[Any]:
+        """读取录制的运行输入，没有录制返回None"""
+        path = settings.har_dir / SNAPSHOT_DIR / f"{name}.json"
+        try:
+            return json.loads(await asyncio.to_thread(path.read_text, encoding="utf-8"))
+        except (OSError, ValueError) as e:
+            logger.warning(f"没有可用的运行输入快照 {path}: {str(e)}")
+            return None
+
+    def log_stats(self):
+        """输出录制/回放统计（未启用时不输出）"""
+        if not self.active:
+            return
+        logger.info(
+            f"HAR{'录制' if self.mode == 'record' else '回放'}统计: 录制context={self.stats['recorded']}, "
+            f"回放context={self.stats['replayed']}, 缺少录制={self.stats['missing']}, "
+            f"正文录制={self.stats['content_recorded']}, 正文回放={self.stats['content_replayed']}, "
+            f"正文缺少录制={self.stats['content_missing']}, 目录: {settings.har_dir}"
+        )
+
+
+class ReplayDatabase:
+    """
+    回放模式下代替 db_manager 的 dry-run 写入端
+
+    - 信号源配置与zipcode列表来自录制时的快照
+    - 不查询已入库URL（录制时写入的新闻不会让回放跳过文章）
+    - 任务日志不写入；入库只分配本地id并原样返回，下游（JSONL导出）照常处理
+    """
+
+    def __init__(self, archive: HarArchive):
+        self._archive = archive
+        self._ids = itertools.count(1)
+
+    async def get_active_sources(self) -> List[Dict[str, Any]]:
+        return await self._archive.load_snapshot("sources") or []
+
+    async def get_zipcodes_from_magnet(self) -> List[str]:
+        return await self._archive.load_snapshot("zipcodes") or []
+
+    async def find_existing_urls(self, normalized_urls: List[str]) -> set:
+        return set()
+
+    def start_url_index_reconcile(self):
+        return None
+
+    async def log_task(self, *args, **kwargs) -> Optional[str]:
+        return None
+
+    async def update_task_log(self, *args, **kwargs):
+        return None
+
+    async def insert_raw_news(self, raw_news_list: List[Dict[str, Any]]) -> Tuple[int, List[Dict[str, Any]]]:
+        records = [dict(news, id=next(self._ids)) for news in raw_news_list]
+        return len(records), records
+
+
+# 全局HAR录制/回放实例
+har_archive = HarArchive()
+# 回放模式下代替数据库的 dry-run 写入端
+replay_database = ReplayDatabase(har_archive)
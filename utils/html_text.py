@@ -0,0 +1,71 @@
+"""
+HTML 转纯文本模块
+DataCleaner.clean_html 的分层实现：不含标签的文本直接规整空白；含标签的内容交给 lxml 的流式解析器，
+用解析器 target 回调收集文本节点（不构建文档树，也不经过 BeautifulSoup），输出与
+BeautifulSoup(html, 'lxml').get_text(separator=' ', strip=True) 一致
+"""
+import re
+from typing import List
+
+from lxml import etree
+
+# 字符实体（&amp; / &#39; / &#x27;），不含实体的 "&" 只是普通字符
+_ENTITY = re.compile(r'&(?:[a-zA-Z]|#[0-9xX])')
+
+# 内容不算作文本的标签（与 BeautifulSoup.get_text 一致）
+_SKIPPED_TAGS = frozenset(("script", "style", "template"))
+
+
+class _TextCollector:
+    """
+    lxml 解析器 target：收集文本节点，节点之间（标签/注释边界）插入空格
+
+    同一个文本节点可能分多次回调 data()，因此只在边界处分隔；空白由调用方统一合并
+    """
+
+    def __init__(self):
+        self.parts: List[str] = []
+        self._skip_depth = 0
+
+    def start(self, tag, attrib):
+        self.parts.append(" ")
+        if tag in _SKIPPED_TAGS:
+            self._skip_depth += 1
+
+    def end(self, tag):
+        self.parts.append(" ")
+        if tag in _SKIPPED_TAGS and self._skip_depth:
+            self._skip_depth -= 1
+
+    def data(self, data):
+        if not self._skip_depth:
+            self.parts.append(data)
+
+    def comment(self, text):
+        self.parts.append(" ")
+
+    def close(self) -> str:
+        return "".join(self.parts)
+
+
+def html_to_text(html_content: str) -> str:
+    """
+    提取HTML中的纯文本（文本节点之间以空格分隔，连续空白合并为一个空格）
+
+    Args:
+        html_content: HTML内容或纯文本
+
+    Returns:
+        纯文本
+    """
+    if not html_content:
+        return ""
+    # 快速路径：不含标签和实体的纯文本（如列表页摘要）无需解析
+    if "<" not in html_content and not _ENTITY.search(html_content):
+        text = html_content
+    else:
+        parser = etree.HTMLParser(target=_TextCollector())
+        parser.feed(html_content)
+        text = parser.close()
+    # 合并连续空白（str.split 比 re.sub(r'\s+', ' ') 快得多，空白字符集相同）
+    return " ".join(text.split())
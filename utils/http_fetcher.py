@@ -0,0 +1,226 @@
+"""
+HTTP抓取模块
+基于 aiohttp 长连接会话的异步抓取层：连接池 + 按域名连接上限 + 压缩 + 条件请求（ETag / Last-Modified）
+"""
+import asyncio
+import sys
+from collections import OrderedDict
+from importlib.util import find_spec
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+
+import aiohttp
+
+from config.settings import settings
+from utils.logger import logger
+
+
+def _accept_encoding() -> str:
+    """按已安装的解码库声明支持的压缩格式（aiohttp 用 brotli 或 brotlicffi 解码 br）"""
+    encodings = ["gzip", "deflate"]
+    if find_spec("brotli") or find_spec("brotlicffi"):
+        encodings.append("br")
+    return ", ".join(encodings)
+
+
+DEFAULT_HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+        "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+    ),
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+    "Accept-Language": "en-US,en;q=0.9",
+    "Accept-Encoding": _accept_encoding(),
+}
+
+
+@dataclass
+class FetchResult:
+    """一次抓取的结果"""
+    url: str
+    status: int
+    text: Optional[str] = None
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    not_modified: bool = False  # 服务端返回304，text 来自本地缓存的上一次响应
+
+
+class HttpFetcher:
+    """
+    异步HTTP抓取器
+
+    - 进程内共享一个 aiohttp 会话（keep-alive 连接池），绑定当前事件循环
+    - 总连接数与单域名连接数受配置限制，抓取吞吐随并发数而不是线程数扩展
+    - 记住最近响应的 ETag / Last-Modified，再次抓取同一URL时发送条件请求，304 时复用上次的正文
+      （按URL数量和正文总内存两个上限做LRU淘汰，常驻的调度进程内存有界）
+    """
+
+    def __init__(self, validator_cache_size: int = 2000, validator_cache_bytes: Optional[int] = None):
+        """
+        初始化抓取器
+
+        Args:
+            validator_cache_size: 内存中保留条件请求校验信息（及正文）的URL数量上限
+            validator_cache_bytes: 缓存正文占用内存的上限（字节，默认使用配置）
+        """
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._session_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._validator_cache_size = validator_cache_size
+        self._validator_cache_bytes = (
+            validator_cache_bytes if validator_cache_bytes is not None
+            else settings.http_validator_cache_mb * 1024 * 1024
+        )
+        self._validators: "OrderedDict[str, Tuple[Optional[str], Optional[str], str]]" = OrderedDict()
+        self._cached_bytes = 0
+        self.stats: Dict[str, int] = {
+            "requests": 0,
+            "not_modified": 0,
+            "errors": 0,
+        }
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """获取长连接会话，循环变化或会话已关闭时重新创建"""
+        loop = asyncio.get_running_loop()
+        if self._session is None or self._session.closed or self._session_loop is not loop:
+            connector = aiohttp.TCPConnector(
+                limit=settings.content_fetch_concurrency,
+                limit_per_host=settings.content_fetch_per_host,
+                keepalive_timeout=30,
+                ttl_dns_cache=300,
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                headers=DEFAULT_HEADERS,
+                auto_decompress=True,
+            )
+            self._session_loop = loop
+        return self._session
+
+    def _remember(self, url: str, etag: Optional[str], last_modified: Optional[str], text: str):
+        """记录条件请求校验信息（按URL数量与正文总内存LRU淘汰）"""
+        self._forget(url)
+        size = sys.getsizeof(text)
+        # 单个正文超过总上限时不缓存（304时没有正文可复用，条件请求没有意义）
+        if not (etag or last_modified) or size > self._validator_cache_bytes:
+            return
+        self._validators[url] = (etag, last_modified, text)
+        self._cached_bytes += size
+        while len(self._validators) > self._validator_cache_size or self._cached_bytes > self._validator_cache_bytes:
+            self._forget(next(iter(self._validators)))
+
+    def _forget(self, url: str):
+        entry = self._validators.pop(url, None)
+        if entry is not None:
+            self._cached_bytes -= sys.getsizeof(entry[2])
+
+    async def fetch(
+        self,
+        url: str,
+        timeout: float = 30,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None
+    ) -> Optional[FetchResult]:
+        """
+        抓取URL
+
+        Args:
+            url: 目标URL
+            timeout: 超时时间（秒）
+            etag: 上次响应的ETag（可选，未提供时使用内存中记录的值）
+            last_modified: 上次响应的Last-Modified（可选，同上）
+
+        Returns:
+            FetchResult；网络错误或超时返回None
+        """
+        cached_text: Optional[str] = None
+        if url in self._validators and not (etag or last_modified):
+            etag, last_modified, cached_text = self._validators[url]
+            self._validators.move_to_end(url)
+
+        headers = {}
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+
+        self.stats["requests"] += 1
+        try:
+            async with self._get_session().get(
+                url,
+                headers=headers,
+                timeout=aiohttp.ClientTimeout(total=timeout),
+                allow_redirects=True,
+            ) as response:
+                if response.status == 304:
+                    self.stats["not_modified"] += 1
+                    return FetchResult(
+                        url=url,
+                        status=304,
+                        text=cached_text,
+                        etag=etag,
+                        last_modified=last_modified,
+                        not_modified=True,
+                    )
+
+                text = await response.text(errors="replace")
+                result = FetchResult(
+                    url=str(response.url),
+                    status=response.status,
+                    text=text,
+                    etag=response.headers.get("ETag"),
+                    last_modified=response.headers.get("Last-Modified"),
+                )
+                if response.status == 200:
+                    self._remember(url, result.etag, result.last_modified, text)
+                return result
+
+        except asyncio.TimeoutError:
+            self.stats["errors"] += 1
+            logger.debug(f"HTTP抓取超时: {url}")
+            return None
+        except aiohttp.ClientError as e:
+            self.stats["errors"] += 1
+            logger.debug(f"HTTP抓取失败: {url}, {str(e)}")
+            return None
+
+    async def fetch_text(self, url: str, timeout: float = 30) -> Optional[str]:
+        """
+        抓取URL并返回HTML文本（仅200或304）
+
+        Args:
+            url: 目标URL
+            timeout: 超时时间（秒）
+
+        Returns:
+            HTML文本，失败返回None
+        """
+        result = await self.fetch(url, timeout=timeout)
+        if result is None:
+            return None
+        if result.status in (200, 304) and result.text:
+            return result.text
+        logger.debug(f"HTTP抓取返回 {result.status}: {url}")
+        return None
+
+    async def close(self):
+        """关闭会话（任务结束时调用，下次抓取会重新创建）"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        self._session_loop = None
+
+    def reset_stats(self):
+        """清零统计（每轮采集开始时调用，日志中的统计只反映本轮；条件请求缓存保留）"""
+        for key in self.stats:
+            self.stats[key] = 0
+
+    def log_stats(self):
+        """输出抓取统计"""
+        logger.info(
+            f"HTTP抓取统计: 请求={self.stats['requests']}, 304未修改={self.stats['not_modified']}, "
+            f"失败={self.stats['errors']}"
+        )
+
+
+# 全局HTTP抓取器实例
+http_fetcher = HttpFetcher()
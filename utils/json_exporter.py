@@ -86,6 +86,28 @@ class JSONExporter:
         
         return output_path
     
+    def append_jsonl(self, articles: List[Dict[str, Any]], filename: str) -> Path:
+        """
+        追加导出为JSON Lines（每行一条记录，供流式入库按批次写出）
+        
+        Args:
+            articles: 文章列表（play_raw_news格式）
+            filename: 输出文件名（同一次任务使用同一个文件名）
+            
+        Returns:
+            输出文件路径
+        """
+        output_path = self.output_dir / filename
+        
+        with open(output_path, 'a', encoding='utf-8') as f:
+            for article in articles:
+                f.write(json.dumps(article, ensure_ascii=False, default=str))
+                f.write('\n')
+        
+        logger.debug(f"JSONL追加完成: {output_path} (+{len(articles)} 条原始新闻)")
+        
+        return output_path
+    
     def export_simple(self, articles: List[Dict[str, Any]], filename: str = None) -> Path:
         """
         简单导出（不分组，支持play_raw_news格式）
@@ -0,0 +1,125 @@
+"""
+关键词匹配模块
+把按类别组织的关键词（每类为 "|" 分隔的字面量，如 DataCleaner.KEYWORD_PATTERNS）编译为一个前缀树形式的正则，
+一次扫描文本即可标注所有类别的关键词（取代按类别逐个 re.findall，输出与之一致）
+"""
+import re
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+
+def _trie_pattern(words: Iterable[str]) -> str:
+    """
+    把字面量集合编译为前缀树正则（共同前缀只比较一次，同一位置优先匹配最长的词）
+
+    例: ["mortgage", "mortgage rate", "market"] → "m(?:ortgage(?:\\ rate)?|arket)"
+    """
+    trie: Dict[str, dict] = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def build(node: Dict[str, dict]) -> str:
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        if "" in node:
+            # 当前位置已构成完整的词：后续部分可选（贪婪，优先更长的词）
+            return "(?:" + "|".join(branches) + ")?"
+        return branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+
+    return build(trie)
+
+
+# 小写文本中在 re.IGNORECASE 下与小写英文字母等价的其他字符（如 "ſ" 匹配 "s"）：
+# 先替换为对应字母（逐个 str.replace，比 str.translate 快得多），再按区分大小写匹配，结果与 IGNORECASE 相同但扫描快得多
+_FOLD = (("ſ", "s"), ("ı", "i"))
+
+
+class KeywordMatcher:
+    """
+    单次扫描的多类别关键词匹配器
+
+    输出与按类别逐个 re.findall(pattern, text.lower(), re.IGNORECASE) 完全一致：
+    - 一次扫描找出每个位置上出现的所有关键词（前缀树正则 finditer，匹配内部的位置再逐个锚定匹配，
+      以找出与之重叠的关键词）
+    - 再按类别模拟 findall：从左到右取不重叠的匹配，同一位置按类别内的书写顺序取第一个
+      （如 "rent|rental" 对 "rental" 只得到 "rent"）
+    - 结果按类别顺序排列，跨类别去重并限制数量
+    """
+
+    def __init__(self, patterns: Sequence[str]):
+        """
+        Args:
+            patterns: 每个类别一个 "|" 分隔的关键词字面量串（关键词需为小写英文或中文）
+        """
+        self.categories: List[List[str]] = [[w for w in pattern.split("|") if w] for pattern in patterns]
+        words = {word for category in self.categories for word in category}
+        # 最长关键词 → 同一起点上各类别 findall 会取的关键词长度 [(类别序号, 长度)]：
+        # 同一起点上出现的是它本身与作为其前缀的关键词，类别内取书写顺序中的第一个
+        self._hits: Dict[str, List[Tuple[int, int]]] = {}
+        for word in words:
+            self._hits[word] = [
+                (index, len(next(w for w in category if word.startswith(w))))
+                for index, category in enumerate(self.categories)
+                if any(word.startswith(w) for w in category)
+            ]
+        # 关键词内部可能成为另一个关键词起点的偏移（大多数关键词没有）
+        self._inner_offsets: Dict[str, List[int]] = {
+            word: [
+                offset for offset in range(1, len(word))
+                if any(word[offset:].startswith(w) or w.startswith(word[offset:]) for w in words)
+            ]
+            for word in words
+        }
+        self._regex = re.compile(_trie_pattern(words))
+
+    def match(self, text: str, limit: Optional[int] = 10) -> List[str]:
+        """
+        提取文本中的关键词
+
+        Args:
+            text: 文本内容
+            limit: 最多返回的关键词数（None 表示不限制）
+
+        Returns:
+            关键词列表
+        """
+        if not text:
+            return []
+        lowered = text.lower()
+        folded = lowered
+        for char, letter in _FOLD:
+            folded = folded.replace(char, letter)
+        # 每个类别按位置递增的 (起始位置, 长度)
+        hits: List[List[Tuple[int, int]]] = [[] for _ in self.categories]
+        for found in self._regex.finditer(folded):
+            word = found.group()
+            for index, length in self._hits[word]:
+                hits[index].append((found.start(), length))
+            # finditer 跳过的位置上没有关键词；匹配内部的位置可能是另一个关键词的起点
+            for offset in self._inner_offsets[word]:
+                inner = self._regex.match(folded, found.start() + offset)
+                if inner is not None:
+                    for index, length in self._hits[inner.group()]:
+                        hits[index].append((inner.start(), length))
+        keywords: List[str] = []
+        seen = set()
+        for category_hits in hits:
+            if limit is not None and len(keywords) >= limit:
+                break
+            cursor = 0
+            for start, length in sorted(category_hits):
+                if start < cursor:
+                    continue
+                matched = lowered[start:start + length]
+                if matched not in seen:
+                    seen.add(matched)
+                    keywords.append(matched)
+                cursor = start + length
+        return keywords[:limit] if limit is not None else keywords
+
+    def match_many(self, texts: Iterable[str], limit: Optional[int] = 10) -> List[List[str]]:
+        """批量提取（每个文本一个关键词列表）"""
+        return [self.match(text, limit) for text in texts]
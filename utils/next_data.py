@@ -0,0 +1,118 @@
+"""
+Next.js 页面数据解析模块
+从服务端渲染的HTML文本中读取 script#__NEXT_DATA__ JSON，并把列表数据与页面中的文章链接对应起来，
+无需浏览器执行脚本或等待列表渲染
+"""
+import html as html_lib
+import json
+import re
+from typing import Any, Dict, List, Optional
+
+from utils.logger import logger
+
+NEXT_DATA_PATTERN = re.compile(
+    r'<script[^>]*\bid=["\']__NEXT_DATA__["\'][^>]*>(.*?)</script>',
+    re.DOTALL | re.IGNORECASE
+)
+
+# 文章链接路径：/news/<数字ID>-<标题slug>
+NEWS_LINK_PATTERN = re.compile(r'href=["\'](?:https?://[^/"\']+)?(/news/\d+-([a-z0-9-]+))[^"\']*["\']', re.IGNORECASE)
+
+# 前缀匹配时要求的最短slug长度（标题被截断的长链接）
+MIN_PREFIX_SLUG_LENGTH = 20
+
+
+def extract_next_data(html: str) -> Optional[Dict[str, Any]]:
+    """
+    从HTML中提取 __NEXT_DATA__ JSON
+
+    Args:
+        html: 页面HTML
+
+    Returns:
+        解析后的JSON字典；不存在或解析失败时返回None
+    """
+    if not html:
+        return None
+    match = NEXT_DATA_PATTERN.search(html)
+    if not match:
+        return None
+    try:
+        data = json.loads(match.group(1))
+    except json.JSONDecodeError as e:
+        logger.warning(f"解析__NEXT_DATA__ JSON失败: {str(e)}")
+        return None
+    return data if isinstance(data, dict) else None
+
+
+def feed_from_next_data(next_data: Optional[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    取出 props.pageProps.feed 列表
+
+    Args:
+        next_data: __NEXT_DATA__ JSON
+
+    Returns:
+        feed 列表（只保留字典项），不存在时返回空列表
+    """
+    if not next_data:
+        return []
+    page_props = (next_data.get('props') or {}).get('pageProps') or {}
+    feed = page_props.get('feed') or []
+    if not isinstance(feed, list):
+        return []
+    return [item for item in feed if isinstance(item, dict)]
+
+
+def slugify_title(title: str) -> str:
+    """
+    将标题转换为URL slug（小写，非字母数字字符合并为连字符）
+
+    Args:
+        title: 文章标题
+
+    Returns:
+        slug 字符串
+    """
+    return re.sub(r'[^a-z0-9]+', '-', (title or '').lower()).strip('-')
+
+
+def news_links_by_slug(html: str) -> Dict[str, str]:
+    """
+    收集页面中的文章链接，按标题slug索引
+
+    Args:
+        html: 页面HTML
+
+    Returns:
+        {slug: 链接路径}，同一slug保留第一次出现的链接
+    """
+    links: Dict[str, str] = {}
+    for match in NEWS_LINK_PATTERN.finditer(html or ''):
+        path = html_lib.unescape(match.group(1))
+        links.setdefault(match.group(2).lower(), path)
+    return links
+
+
+def match_news_link(title: str, links: Dict[str, str]) -> Optional[str]:
+    """
+    按标题slug查找文章链接：优先精确匹配，其次在slug足够长时按前缀匹配（链接slug可能被截断）
+
+    Args:
+        title: 文章标题
+        links: news_links_by_slug 的结果
+
+    Returns:
+        链接路径；找不到时返回None
+    """
+    slug = slugify_title(title)
+    if not slug:
+        return None
+    if slug in links:
+        return links[slug]
+    for link_slug, path in links.items():
+        if min(len(slug), len(link_slug)) >= MIN_PREFIX_SLUG_LENGTH and (
+            slug.startswith(link_slug) or link_slug.startswith(slug)
+        ):
+            return path
+    return None
@@ -0,0 +1,47 @@
+"""
+采集路径命中统计模块
+记录同一采集任务走了哪条路径（如 HTTP JSON / 页面JSON / DOM），用于观察快速路径的命中率
+"""
+from collections import Counter
+from typing import Dict
+
+from utils.logger import logger
+
+
+class PathStats:
+    """按路径名计数，并输出各路径占比"""
+
+    def __init__(self, name: str):
+        """
+        初始化统计
+
+        Args:
+            name: 统计名称（用于日志）
+        """
+        self.name = name
+        self.counts: Counter = Counter()
+
+    def record(self, path: str):
+        """记录一次命中的路径"""
+        self.counts[path] += 1
+
+    def reset(self):
+        """清空计数（新一轮采集开始时调用，日志中的命中率只反映本轮）"""
+        self.counts.clear()
+
+    def hit_rates(self) -> Dict[str, float]:
+        """各路径命中率（0~1）"""
+        total = sum(self.counts.values())
+        if not total:
+            return {}
+        return {path: count / total for path, count in self.counts.items()}
+
+    def log_stats(self):
+        """输出路径命中统计（没有记录时不输出）"""
+        total = sum(self.counts.values())
+        if not total:
+            return
+        parts = ", ".join(
+            f"{path}={count}({count / total:.0%})" for path, count in self.counts.most_common()
+        )
+        logger.info(f"{self.name} 采集路径: 共{total}次, {parts}")
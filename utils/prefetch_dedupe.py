@@ -0,0 +1,91 @@
+"""
+抓取正文前的去重模块
+在抓取文章正文之前，按标准化URL剔除本次运行中已出现或数据库中已存在的文章，
+只把新文章交给正文抓取
+"""
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set
+
+from utils.data_cleaner import DataCleaner
+from utils.logger import logger
+
+KnownLookup = Callable[[List[str]], Awaitable[Set[str]]]
+
+
+class PrefetchDeduper:
+    """
+    正文抓取前去重（一次采集任务共用一个实例）
+
+    - 运行内去重：第一次出现的URL被"认领"，其他zipcode/信号源再遇到时直接剔除
+    - 数据库去重：通过 known_lookup（本地URL索引）剔除已入库的URL
+    - 统计因此省下的正文抓取次数
+    """
+
+    def __init__(self, known_lookup: Optional[KnownLookup] = None):
+        """
+        初始化去重器
+
+        Args:
+            known_lookup: 批量查询已入库标准化URL的异步函数（如 db_manager.find_existing_urls）
+        """
+        self._known_lookup = known_lookup
+        self._claimed: Set[str] = set()
+        self.stats: Dict[str, int] = {
+            "checked": 0,
+            "in_run_duplicates": 0,
+            "already_stored": 0,
+        }
+
+    @property
+    def fetches_avoided(self) -> int:
+        """省下的正文抓取次数"""
+        return self.stats["in_run_duplicates"] + self.stats["already_stored"]
+
+    async def filter_new(self, articles: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        剔除重复与已入库的文章，并认领剩余文章的URL
+
+        Args:
+            articles: 清洗后的文章列表
+
+        Returns:
+            需要抓取正文的新文章列表（没有URL的文章原样保留，交给后续验证处理）
+        """
+        if not articles:
+            return articles
+
+        keyed = []
+        for article in articles:
+            self.stats["checked"] += 1
+            keyed.append((DataCleaner.normalize_url(article.get('url', '')), article))
+
+        known: Set[str] = set()
+        if self._known_lookup:
+            candidates = [key for key, _ in keyed if key and key not in self._claimed]
+            try:
+                known = await self._known_lookup(candidates) if candidates else set()
+            except Exception as e:
+                logger.warning(f"抓取前查询已入库URL失败: {str(e)}")
+
+        new_articles = []
+        for key, article in keyed:
+            if not key:
+                new_articles.append(article)
+            elif key in self._claimed:
+                self.stats["in_run_duplicates"] += 1
+            elif key in known:
+                self.stats["already_stored"] += 1
+            else:
+                self._claimed.add(key)
+                new_articles.append(article)
+
+        skipped = len(articles) - len(new_articles)
+        if skipped:
+            logger.debug(f"抓取前去重: {len(articles)} -> {len(new_articles)} 篇（跳过 {skipped} 次正文抓取）")
+        return new_articles
+
+    def log_stats(self):
+        """输出去重统计"""
+        logger.info(
+            f"抓取前去重统计: 检查={self.stats['checked']}, 运行内重复={self.stats['in_run_duplicates']}, "
+            f"已入库={self.stats['already_stored']}, 省下正文抓取={self.fetches_avoided}"
+        )
@@ -0,0 +1,178 @@
+"""
+原始新闻流式入库模块
+采集结果边产生边流经：运行内去重 → 按条数/时间微批入库 → 入库后处理（Dify审核等）
+"""
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple
+
+from config.settings import settings
+from utils.logger import logger
+
+
+_SENTINEL = object()
+
+InsertFunc = Callable[[List[Dict[str, Any]]], Awaitable[Tuple[int, List[Dict[str, Any]]]]]
+
+
+class RawNewsStream:
+    """
+    原始新闻流式入库管道
+
+    - put() 接收采集结果，队列有上限，写入过快时对采集方形成背压
+    - 按标准化URL做运行内去重
+    - 攒够 batch_size 条或距批次第一条超过 flush_interval 秒即入库
+    - 入库后的记录交给单独的后处理 worker 顺序处理，不阻塞入库；
+      后处理队列同样有上限（按批次计），后处理跟不上时入库方等待
+    """
+
+    def __init__(
+        self,
+        insert_func: InsertFunc,
+        key_func: Callable[[Dict[str, Any]], str],
+        on_flushed: Optional[Callable[[List[Dict[str, Any]]], None]] = None,
+        on_inserted: Optional[Callable[[List[Dict[str, Any]]], Awaitable[None]]] = None,
+        batch_size: Optional[int] = None,
+        flush_interval: Optional[float] = None,
+        max_pending: Optional[int] = None,
+        max_post_batches: Optional[int] = None
+    ):
+        """
+        初始化流式管道
+
+        Args:
+            insert_func: 批量入库函数，返回 (插入数量, 插入的记录列表)
+            key_func: 去重键函数（通常为标准化URL），返回空字符串表示不参与去重
+            on_flushed: 每个批次入库前的同步回调（如追加导出）
+            on_inserted: 入库成功后的异步回调（如Dify审核），按批次顺序执行
+            batch_size: 微批条数（默认使用配置）
+            flush_interval: 微批最长等待秒数（默认使用配置）
+            max_pending: 待入库队列上限（默认使用配置）
+            max_post_batches: 待后处理的批次数上限（默认使用配置）
+        """
+        self._insert_func = insert_func
+        self._key_func = key_func
+        self._on_flushed = on_flushed
+        self._on_inserted = on_inserted
+        self.batch_size = batch_size or settings.stream_insert_batch_size
+        self.flush_interval = flush_interval or settings.stream_insert_flush_seconds
+        self._max_pending = max_pending or settings.stream_queue_max
+        self._max_post_batches = max_post_batches or settings.stream_post_queue_max
+        self._queue: Optional[asyncio.Queue] = None
+        self._post_queue: Optional[asyncio.Queue] = None
+        self._consumer: Optional[asyncio.Task] = None
+        self._post_worker: Optional[asyncio.Task] = None
+        self._seen: Set[str] = set()
+        self.stats: Dict[str, int] = {
+            "received": 0,
+            "duplicates": 0,
+            "flushed": 0,
+            "inserted": 0,
+            "batches": 0,
+        }
+
+    async def start(self) -> "RawNewsStream":
+        """启动入库与后处理 worker"""
+        self._queue = asyncio.Queue(maxsize=self._max_pending)
+        self._post_queue = asyncio.Queue(maxsize=self._max_post_batches)
+        self._consumer = asyncio.create_task(self._consume())
+        self._post_worker = asyncio.create_task(self._post_process())
+        return self
+
+    async def put(self, records: List[Dict[str, Any]]):
+        """
+        推入一批采集结果（队列满时等待）
+
+        Args:
+            records: play_raw_news 格式的记录列表
+        """
+        if self._queue is None:
+            raise RuntimeError("RawNewsStream 尚未启动")
+        for record in records:
+            self.stats["received"] += 1
+            await self._queue.put(record)
+
+    async def close(self) -> Dict[str, int]:
+        """
+        结束输入，刷出剩余批次并等待后处理完成
+
+        Returns:
+            统计信息
+        """
+        if self._queue is not None and self._consumer is not None:
+            await self._queue.put(_SENTINEL)
+            await self._consumer
+        if self._post_queue is not None and self._post_worker is not None:
+            await self._post_queue.put(_SENTINEL)
+            await self._post_worker
+        logger.info(
+            f"流式入库完成: 接收={self.stats['received']}, 运行内重复={self.stats['duplicates']}, "
+            f"入库批次={self.stats['batches']}, 成功插入={self.stats['inserted']}"
+        )
+        return self.stats
+
+    async def _consume(self):
+        """入库 worker：去重并按条数/时间攒批"""
+        loop = asyncio.get_running_loop()
+        batch: List[Dict[str, Any]] = []
+        deadline = 0.0
+
+        while True:
+            timeout = max(0.0, deadline - loop.time()) if batch else None
+            try:
+                item = await asyncio.wait_for(self._queue.get(), timeout)
+            except asyncio.TimeoutError:
+                await self._flush(batch)
+                batch = []
+                continue
+
+            if item is _SENTINEL:
+                await self._flush(batch)
+                return
+
+            key = self._key_func(item)
+            if key:
+                if key in self._seen:
+                    self.stats["duplicates"] += 1
+                    logger.debug(f"发现重复URL，已跳过: {item.get('url', '')[:100]}")
+                    continue
+                self._seen.add(key)
+
+            batch.append(item)
+            if len(batch) == 1:
+                deadline = loop.time() + self.flush_interval
+            if len(batch) >= self.batch_size:
+                await self._flush(batch)
+                batch = []
+
+    async def _flush(self, batch: List[Dict[str, Any]]):
+        """入库一个批次；失败只记录日志，不中断整条管道"""
+        if not batch:
+            return
+        self.stats["flushed"] += len(batch)
+        self.stats["batches"] += 1
+        if self._on_flushed:
+            try:
+                self._on_flushed(batch)
+            except Exception as e:
+                logger.warning(f"批次回调失败: {str(e)}")
+        try:
+            inserted_count, inserted_records = await self._insert_func(batch)
+        except Exception as e:
+            logger.error(f"流式批次入库失败（{len(batch)} 条）: {str(e)}", exc_info=True)
+            return
+        self.stats["inserted"] += inserted_count
+        logger.info(f"流式入库批次 #{self.stats['batches']}: {len(batch)} 条 → 插入 {inserted_count} 条")
+        if inserted_records and self._on_inserted:
+            # 后处理队列满时在这里等待，入库 worker 暂停取数，背压传到采集方
+            await self._post_queue.put(inserted_records)
+
+    async def _post_process(self):
+        """后处理 worker：按入库顺序逐批执行 on_inserted"""
+        while True:
+            records = await self._post_queue.get()
+            if records is _SENTINEL:
+                return
+            try:
+                await self._on_inserted(records)
+            except Exception as e:
+                logger.error(f"入库后处理失败: {str(e)}", exc_info=True)
@@ -0,0 +1,158 @@
+"""
+解析结果缓存模块
+持久化保存"输入 → 解析结果"映射（如 zipcode → 城市页面URL），支持TTL与负缓存（确认无结果的输入）
+"""
+import asyncio
+import atexit
+import json
+import os
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from config.settings import settings
+from utils.logger import logger
+
+# 进程内所有解析缓存（运行结束或进程退出时统一落盘）
+_caches: List["ResolutionCache"] = []
+
+
+class ResolutionCache:
+    """
+    基于本地JSON文件的解析结果缓存
+
+    - 文件：<RESOLUTION_CACHE_DIR>/<name>.json，格式 {key: {"value": ..., "resolved_at": 时间戳}}
+    - value 为 None 表示负缓存（已确认没有结果），使用更短的 TTL
+    - 首次访问时加载；写入只在内存中标记待落盘，运行结束时（flush_resolution_caches，在线程中写文件）
+      或进程退出时整体落盘（先写临时文件再替换），不在事件循环上同步写文件
+    """
+
+    def __init__(
+        self,
+        name: str,
+        ttl_days: Optional[float] = None,
+        negative_ttl_days: Optional[float] = None,
+        cache_dir: Optional[Path] = None
+    ):
+        """
+        初始化缓存
+
+        Args:
+            name: 缓存名称（决定文件名）
+            ttl_days: 正向结果过期天数（默认使用配置）
+            negative_ttl_days: 负缓存过期天数（默认使用配置）
+            cache_dir: 缓存目录（默认使用配置）
+        """
+        self.name = name
+        self._ttl_days = ttl_days
+        self._negative_ttl_days = negative_ttl_days
+        self._cache_dir = cache_dir
+        self._entries: Optional[Dict[str, Dict[str, Any]]] = None
+        self.stats: Dict[str, int] = {"hits": 0, "negative_hits": 0, "misses": 0}
+        self._dirty = False
+        _caches.append(self)
+
+    @property
+    def path(self) -> Path:
+        return Path(self._cache_dir or settings.resolution_cache_dir) / f"{self.name}.json"
+
+    def _ttl_seconds(self, negative: bool) -> float:
+        if negative:
+            days = self._negative_ttl_days if self._negative_ttl_days is not None else settings.resolution_cache_negative_ttl_days
+        else:
+            days = self._ttl_days if self._ttl_days is not None else settings.resolution_cache_ttl_days
+        return days * 86400
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        if self._entries is None:
+            try:
+                self._entries = json.loads(self.path.read_text(encoding='utf-8'))
+            except FileNotFoundError:
+                self._entries = {}
+            except Exception as e:
+                logger.warning(f"读取解析缓存 {self.name} 失败，重新开始: {str(e)}")
+                self._entries = {}
+        return self._entries
+
+    def _write(self, entries: Dict[str, Dict[str, Any]]):
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix(f".{os.getpid()}.tmp")
+            tmp_path.write_text(json.dumps(entries, ensure_ascii=False, indent=2), encoding='utf-8')
+            os.replace(tmp_path, self.path)
+        except Exception as e:
+            logger.warning(f"保存解析缓存 {self.name} 失败: {str(e)}")
+            self._dirty = True
+
+    def _take_snapshot(self) -> Optional[Dict[str, Dict[str, Any]]]:
+        """取出待落盘的内容（没有待写入时返回None）"""
+        if not self._dirty:
+            return None
+        self._dirty = False
+        return dict(self._load())
+
+    def flush(self):
+        """把待写入的内容落盘（同步，进程退出时调用）"""
+        snapshot = self._take_snapshot()
+        if snapshot is not None:
+            self._write(snapshot)
+
+    def get(self, key: str) -> Tuple[bool, Any]:
+        """
+        查询缓存
+
+        Args:
+            key: 输入（如zipcode）
+
+        Returns:
+            (是否命中, 解析结果)；负缓存命中时返回 (True, None)
+        """
+        entry = self._load().get(key)
+        if entry is not None:
+            negative = entry.get("value") is None
+            if time.time() - entry.get("resolved_at", 0) <= self._ttl_seconds(negative):
+                self.stats["negative_hits" if negative else "hits"] += 1
+                return True, entry.get("value")
+        self.stats["misses"] += 1
+        return False, None
+
+    def put(self, key: str, value: Any):
+        """
+        写入解析结果
+
+        Args:
+            key: 输入
+            value: 解析结果（None 表示确认没有结果）
+        """
+        self._load()[key] = {"value": value, "resolved_at": time.time()}
+        self._dirty = True
+
+    def put_negative(self, key: str):
+        """写入负缓存（确认该输入没有解析结果）"""
+        self.put(key, None)
+
+    def invalidate(self, key: str):
+        """删除缓存项（解析结果失效时调用，下次重新解析）"""
+        if self._load().pop(key, None) is not None:
+            self._dirty = True
+
+    def log_stats(self):
+        """输出缓存统计"""
+        logger.info(
+            f"解析缓存 {self.name}: 命中={self.stats['hits']}, 负缓存命中={self.stats['negative_hits']}, "
+            f"未命中={self.stats['misses']}"
+        )
+
+
+async def flush_resolution_caches():
+    """把所有解析缓存待写入的内容落盘（在线程中写文件，不阻塞事件循环；运行结束时调用）"""
+    for cache in _caches:
+        snapshot = cache._take_snapshot()
+        if snapshot is not None:
+            await asyncio.to_thread(cache._write, snapshot)
+
+
+@atexit.register
+def _flush_at_exit():
+    for cache in _caches:
+        cache.flush()
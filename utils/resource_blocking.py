@@ -0,0 +1,162 @@
+"""
+浏览器请求拦截模块
+在创建 Playwright context 时注册 context.route，按采集源的策略拦截图片/字体/媒体等资源类型与广告/统计域名，
+并统计拦截次数与估算节省的流量
+"""
+from collections import Counter
+from dataclasses import dataclass
+from typing import Dict, FrozenSet, Optional, Tuple
+from urllib.parse import urlsplit
+
+from config.settings import settings
+from utils.logger import logger
+
+# 各资源类型单个请求的估算大小（字节）：被拦截的请求没有响应，只能按类型估算节省的流量
+ESTIMATED_RESOURCE_BYTES: Dict[str, int] = {
+    "image": 60 * 1024,
+    "media": 500 * 1024,
+    "font": 40 * 1024,
+    "stylesheet": 30 * 1024,
+    "script": 50 * 1024,
+    "xhr": 5 * 1024,
+    "fetch": 5 * 1024,
+}
+DEFAULT_ESTIMATED_BYTES = 10 * 1024
+
+
+@dataclass(frozen=True)
+class ResourcePolicy:
+    """
+    请求拦截策略
+
+    - block_types: 拦截的资源类型（Playwright request.resource_type，如 image/media/font）
+    - blocked_domains: 拦截的域名（匹配域名本身及其子域名）
+    """
+    block_types: FrozenSet[str]
+    blocked_domains: Tuple[str, ...]
+
+    @property
+    def is_empty(self) -> bool:
+        return not self.block_types and not self.blocked_domains
+
+    def block_reason(self, resource_type: str, url: str) -> Optional[str]:
+        """
+        判断请求是否需要拦截
+
+        Args:
+            resource_type: 资源类型
+            url: 请求URL
+
+        Returns:
+            拦截原因（"type" 或 "domain"），不拦截时返回None
+        """
+        if resource_type in self.block_types:
+            return "type"
+        if self.blocked_domains:
+            host = (urlsplit(url).hostname or "").lower()
+            for domain in self.blocked_domains:
+                if host == domain or host.endswith("." + domain):
+                    return "domain"
+        return None
+
+
+def resource_policy_for(source_name: str) -> Optional[ResourcePolicy]:
+    """
+    获取采集源的请求拦截策略（资源类型与拦截域名都可按采集源覆盖）
+
+    Args:
+        source_name: 采集源名称
+
+    Returns:
+        ResourcePolicy；未启用或策略为空时返回None
+    """
+    if not settings.resource_blocking_enabled:
+        return None
+    block_types = settings.resource_block_types_overrides.get(source_name, settings.resource_block_types)
+    blocked_domains = settings.resource_block_domains_overrides.get(source_name, settings.resource_block_domains)
+    policy = ResourcePolicy(
+        block_types=frozenset(t.strip().lower() for t in block_types if t and t.strip()),
+        blocked_domains=tuple(d.strip().lower() for d in blocked_domains if d and d.strip()),
+    )
+    return None if policy.is_empty else policy
+
+
+class ResourceBlocker:
+    """
+    在 context 上注册请求拦截并统计（进程内共享一个实例）
+
+    - 统计按采集源与拦截原因计数，节省流量按资源类型估算
+    """
+
+    def __init__(self):
+        self.blocked: Counter = Counter()
+        self.blocked_by_type: Counter = Counter()
+        self.allowed = 0
+        self.bytes_saved = 0
+
+    def reset(self):
+        """清零统计（每轮采集开始时调用，日志中的统计只反映本轮）"""
+        self.blocked.clear()
+        self.blocked_by_type.clear()
+        self.allowed = 0
+        self.bytes_saved = 0
+
+    def record(self, source_name: str, resource_type: str, reason: Optional[str]):
+        """记录一次请求的拦截结果"""
+        if reason is None:
+            self.allowed += 1
+            return
+        self.blocked[(source_name, reason)] += 1
+        self.blocked_by_type[resource_type] += 1
+        self.bytes_saved += ESTIMATED_RESOURCE_BYTES.get(resource_type, DEFAULT_ESTIMATED_BYTES)
+
+    async def apply(self, context, source_name: str) -> bool:
+        """
+        按采集源策略在 context 上注册请求拦截
+
+        Args:
+            context: Playwright BrowserContext
+            source_name: 采集源名称
+
+        Returns:
+            是否注册了拦截
+        """
+        policy = resource_policy_for(source_name)
+        if policy is None:
+            return False
+
+        async def handle(route):
+            request = route.request
+            reason = policy.block_reason(request.resource_type, request.url)
+            self.record(source_name, request.resource_type, reason)
+            try:
+                if reason:
+                    await route.abort("blockedbyclient")
+                else:
+                    # 交给其他路由（如HAR回放）处理，没有其他路由时正常发出请求
+                    await route.fallback()
+            except Exception as e:
+                # 页面或context已关闭时路由会失败，忽略
+                logger.debug(f"{source_name}: 请求拦截处理失败: {str(e)[:100]}")
+
+        await context.route("**/*", handle)
+        return True
+
+    def log_stats(self):
+        """输出拦截统计（没有拦截记录时不输出）"""
+        total_blocked = sum(self.blocked.values())
+        if not total_blocked:
+            return
+        by_source: Counter = Counter()
+        for (source_name, _reason), count in self.blocked.items():
+            by_source[source_name] += count
+        sources = ", ".join(f"{name}={count}" for name, count in by_source.most_common())
+        types = ", ".join(f"{name}={count}" for name, count in self.blocked_by_type.most_common())
+        logger.info(
+            f"请求拦截统计: 拦截={total_blocked}, 放行={self.allowed}, "
+            f"估算节省流量={self.bytes_saved / 1024 / 1024:.1f}MB; 按采集源: {sources}; 按类型: {types}"
+        )
+
+
+# 全局请求拦截实例
+resource_blocker = ResourceBlocker()
@@ -0,0 +1,250 @@
+"""
+运行追踪模块
+轻量的分段计时（span）：可作为上下文管理器（同步/异步）或装饰器使用，按协程上下文自动记录父子关系；
+一次采集任务对应一个 JSONL 追踪文件（每个 span 一行），任务结束时输出各 span 的 p50/p95 汇总；
+同时进行的多个任务按协程上下文各自记录
+"""
+import functools
+import inspect
+import itertools
+import json
+import math
+import time
+from contextvars import ContextVar
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from config.settings import settings
+from utils.logger import logger
+
+_current_span: ContextVar[Optional["Span"]] = ContextVar("current_span", default=None)
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """最近秩法百分位数（values 为空时返回0）"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+class Span:
+    """一次计时；退出时交给 Tracer 记录（同一个对象可用 with 或 async with）"""
+
+    def __init__(self, tracer: "Tracer", name: str, attrs: Dict[str, Any]):
+        self.tracer = tracer
+        self.name = name
+        self.attrs = attrs
+        self.span_id = next(tracer._ids)
+        self.parent_id: Optional[int] = None
+        self.run: Optional["TraceRun"] = None
+        self.started_at: Optional[float] = None
+        self._started: Optional[float] = None
+        self._token = None
+
+    def set(self, **attrs: Any):
+        """在span进行中补充属性（如采集到的文章数）"""
+        self.attrs.update(attrs)
+
+    def __enter__(self) -> "Span":
+        parent = _current_span.get()
+        self.parent_id = parent.span_id if parent else None
+        self.run = _current_run.get()
+        self._token = _current_span.set(self)
+        self.started_at = time.time()
+        self._started = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        duration = time.perf_counter() - self._started
+        _current_span.reset(self._token)
+        self.tracer._record(self, duration, exc)
+        return False
+
+    async def __aenter__(self) -> "Span":
+        return self.__enter__()
+
+    async def __aexit__(self, exc_type, exc, tb) -> bool:
+        return self.__exit__(exc_type, exc, tb)
+
+
+class TraceRun:
+    """一次运行的追踪状态：追踪文件与各span的耗时汇总"""
+
+    def __init__(self, run_id: str):
+        self.run_id = run_id
+        self.path: Optional[Path] = None
+        self._file = None
+        self._durations: Dict[str, List[float]] = {}
+        self._errors: Dict[str, int] = {}
+        self._token = None
+
+    def record(self, span: Span, duration: float, exc: Optional[BaseException]):
+        self._durations.setdefault(span.name, []).append(duration)
+        if exc is not None:
+            self._errors[span.name] = self._errors.get(span.name, 0) + 1
+        if self._file is None:
+            return
+        entry = {
+            "run_id": self.run_id,
+            "span_id": span.span_id,
+            "parent_id": span.parent_id,
+            "name": span.name,
+            "start": datetime.utcfromtimestamp(span.started_at).isoformat() + "Z",
+            "duration_ms": round(duration * 1000, 2),
+            "status": "error" if exc is not None else "ok",
+        }
+        if exc is not None:
+            entry["error"] = f"{type(exc).__name__}: {str(exc)[:200]}"
+        if span.attrs:
+            entry["attrs"] = span.attrs
+        try:
+            self._file.write(json.dumps(entry, ensure_ascii=False, default=str) + "\n")
+        except Exception as e:
+            logger.debug(f"写入追踪记录失败: {str(e)}")
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """各span的次数、错误数、总耗时与 p50/p95（秒）"""
+        return {
+            name: {
+                "count": len(values),
+                "errors": self._errors.get(name, 0),
+                "total": sum(values),
+                "p50": percentile(values, 50),
+                "p95": percentile(values, 95),
+            }
+            for name, values in self._durations.items()
+        }
+
+
+_current_run: ContextVar[Optional[TraceRun]] = ContextVar("current_trace_run", default=None)
+
+
+class Tracer:
+    """
+    运行追踪器（进程内共享一个实例）
+
+    - start_run() 后的 span 写入 <TRACE_DIR>/trace_<运行ID>.jsonl，并参与结束时的汇总
+    - 运行绑定在调用方的协程上下文中（ContextVar），之后创建的子任务/线程继承同一个运行；
+      调度器中同时进行的多个采集任务各自拥有完整的追踪文件与汇总
+    - 没有进行中的运行时 span 只计时不落盘（脚本、测试中调用无副作用）
+    """
+
+    def __init__(self):
+        self._ids = itertools.count(1)
+        self._run_seq = itertools.count(1)
+
+    @property
+    def active(self) -> bool:
+        return _current_run.get() is not None
+
+    @property
+    def run_id(self) -> Optional[str]:
+        run = _current_run.get()
+        return run.run_id if run else None
+
+    def span(self, name: str, **attrs: Any) -> Span:
+        """
+        创建span（with / async with 使用）
+
+        Args:
+            name: span名称（同名span参与同一组汇总，如 "db.insert_raw_news"）
+            **attrs: 附加属性（如 source、zipcode）
+        """
+        return Span(self, name, {k: v for k, v in attrs.items() if v is not None})
+
+    def start_run(self, run_id: Optional[str] = None, trace_dir: Optional[Path] = None) -> TraceRun:
+        """
+        开始一次运行：打开追踪文件，并把运行绑定到当前协程上下文
+
+        Returns:
+            运行对象（可传给 finish_run / summary）
+        """
+        run = TraceRun(run_id or f"{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}_{next(self._run_seq)}")
+        run._token = _current_run.set(run)
+        if not settings.trace_enabled:
+            return run
+        try:
+            directory = Path(trace_dir or settings.trace_dir)
+            directory.mkdir(parents=True, exist_ok=True)
+            run.path = directory / f"trace_{run.run_id}.jsonl"
+            run._file = open(run.path, "a", encoding="utf-8")
+        except Exception as e:
+            logger.warning(f"打开追踪文件失败，仅输出汇总: {str(e)}")
+            run._file = None
+        return run
+
+    def _record(self, span: Span, duration: float, exc: Optional[BaseException]):
+        if span.run is not None:
+            span.run.record(span, duration, exc)
+
+    def summary(self, run: Optional[TraceRun] = None) -> Dict[str, Dict[str, float]]:
+        """各span的次数、错误数、总耗时与 p50/p95（秒），默认为当前上下文中的运行"""
+        run = run or _current_run.get()
+        return run.summary() if run else {}
+
+    def finish_run(self, run: Optional[TraceRun] = None) -> Dict[str, Dict[str, float]]:
+        """结束运行（默认为当前上下文中的运行）：写入并输出汇总（按总耗时降序），关闭追踪文件"""
+        run = run or _current_run.get()
+        if run is None:
+            return {}
+        summary = run.summary()
+        if summary:
+            logger.info(f"运行追踪汇总（{run.run_id}）:")
+            for name, stats in sorted(summary.items(), key=lambda item: item[1]["total"], reverse=True):
+                logger.info(
+                    f"  {name}: 次数={stats['count']}, 错误={stats['errors']}, 总计={stats['total']:.2f}s, "
+                    f"p50={stats['p50']:.2f}s, p95={stats['p95']:.2f}s"
+                )
+        if run._file is not None:
+            try:
+                run._file.write(json.dumps({"run_id": run.run_id, "summary": summary}, ensure_ascii=False) + "\n")
+                run._file.close()
+                logger.info(f"追踪文件: {run.path}")
+            except Exception as e:
+                logger.debug(f"关闭追踪文件失败: {str(e)}")
+            run._file = None
+        if _current_run.get() is run:
+            try:
+                _current_run.reset(run._token)
+            except ValueError:
+                # 在其他上下文中结束（token 不属于当前上下文）
+                _current_run.set(None)
+        return summary
+
+
+# 全局追踪器实例
+tracer = Tracer()
+
+
+def traced(name: Optional[str] = None) -> Callable:
+    """
+    装饰器：为函数（同步或异步）的每次调用创建span
+
+    Args:
+        name: span名称（默认使用函数的 __qualname__）；
+              方法所属对象有 source_name 属性时（采集器）自动记录为 source 属性
+    """
+    def decorator(func: Callable) -> Callable:
+        span_name = name or func.__qualname__
+
+        def attrs_of(args) -> Dict[str, Any]:
+            source = getattr(args[0], "source_name", None) if args else None
+            return {"source": source} if isinstance(source, str) else {}
+
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                async with tracer.span(span_name, **attrs_of(args)):
+                    return await func(*args, **kwargs)
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with tracer.span(span_name, **attrs_of(args)):
+                return func(*args, **kwargs)
+        return wrapper
+
+    return decorator
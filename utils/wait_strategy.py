@@ -0,0 +1,252 @@
+"""
+页面等待策略模块
+用条件等待（任一选择器出现、选择器消失、页面条件成立、特定响应到达）取代固定时长的 asyncio.sleep：
+条件满足立即返回，超时不抛异常（由调用方按原有逻辑继续），
+并按步骤统计实际等待时间与被取代的固定等待时长，输出节省的时间
+"""
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Dict, Iterable, Optional
+
+from utils.logger import logger
+
+# 在页面内检查任一选择器是否存在（visible=True 时要求有尺寸且未隐藏），返回命中的选择器
+_ANY_SELECTOR_JS = """
+(args) => {
+    for (const selector of args.selectors) {
+        let el = null;
+        try { el = document.querySelector(selector); } catch (e) { continue; }
+        if (!el) continue;
+        if (args.visible) {
+            const rect = el.getBoundingClientRect();
+            if (!(rect.width > 0 && rect.height > 0 && getComputedStyle(el).visibility !== 'hidden')) continue;
+        }
+        return selector;
+    }
+    return null;
+}
+"""
+
+# 所有选择器都不存在时成立
+_NONE_PRESENT_JS = """
+(selectors) => selectors.every((selector) => {
+    try { return !document.querySelector(selector); } catch (e) { return true; }
+})
+"""
+
+
+# 匹配数量超过给定值时成立（用于等待"新出现"的元素，页面上原本就有的同类元素不算）
+_MORE_MATCHES_JS = """
+(args) => {
+    let count = 0;
+    try { count = document.querySelectorAll(args.selector).length; } catch (e) { return false; }
+    return count > args.before ? count : false;
+}
+"""
+
+
+class WaitStats:
+    """
+    按步骤统计等待
+
+    - waited: 实际等待秒数
+    - baseline: 被取代的固定等待秒数（原 asyncio.sleep 时长；原本没有固定等待的步骤为0）
+    - satisfied: 条件在超时前成立的次数
+    """
+
+    def __init__(self):
+        self.steps: Dict[str, Dict[str, float]] = {}
+
+    def record(self, step: str, waited: float, baseline: float, satisfied: bool):
+        """记录一次等待"""
+        entry = self.steps.setdefault(step, {"count": 0, "satisfied": 0, "waited": 0.0, "baseline": 0.0})
+        entry["count"] += 1
+        entry["satisfied"] += 1 if satisfied else 0
+        entry["waited"] += waited
+        entry["baseline"] += baseline
+
+    def reset(self):
+        """清空统计（新一轮采集开始时调用，日志中的节省时间只反映本轮）"""
+        self.steps = {}
+
+    def saved(self, step: str) -> float:
+        """该步骤相对原固定等待累计节省的秒数（可能为负：条件等待比原固定等待更久）"""
+        entry = self.steps.get(step)
+        if not entry or not entry["baseline"]:
+            return 0.0
+        return entry["baseline"] - entry["waited"]
+
+    def log_stats(self):
+        """输出各步骤等待统计（没有记录时不输出）"""
+        if not self.steps:
+            return
+        total_saved = 0.0
+        for step, entry in sorted(self.steps.items()):
+            saved = self.saved(step)
+            total_saved += saved
+            logger.info(
+                f"等待统计 {step}: 次数={int(entry['count'])}, 条件满足={int(entry['satisfied'])}, "
+                f"平均等待={entry['waited'] / entry['count']:.2f}s, 原固定等待={entry['baseline']:.1f}s, "
+                f"节省={saved:.1f}s"
+            )
+        logger.info(f"条件等待累计节省 {total_saved:.1f}s")
+
+
+# 全局等待统计实例
+wait_stats = WaitStats()
+
+
+async def wait_for_condition(
+    page,
+    expression: str,
+    step: str,
+    timeout: float,
+    baseline: float = 0.0,
+    arg: Any = None
+) -> Any:
+    """
+    等待页面内的JS条件成立
+
+    Args:
+        page: Playwright页面对象
+        expression: 页面函数（返回真值即成立）
+        step: 步骤名（用于统计）
+        timeout: 最长等待秒数
+        baseline: 被取代的固定等待秒数
+        arg: 传给页面函数的参数
+
+    Returns:
+        条件成立时页面函数的返回值；超时或页面失败时返回None
+    """
+    started = time.monotonic()
+    value = None
+    try:
+        handle = await page.wait_for_function(expression, arg=arg, timeout=timeout * 1000)
+        value = await handle.json_value()
+    except Exception as e:
+        logger.debug(f"等待 {step} 未成立（{timeout:.0f}s）: {str(e)[:100]}")
+    wait_stats.record(step, time.monotonic() - started, baseline, bool(value))
+    return value
+
+
+async def wait_for_any_selector(
+    page,
+    selectors: Iterable[str],
+    step: str,
+    timeout: float,
+    baseline: float = 0.0,
+    visible: bool = False
+) -> Optional[str]:
+    """
+    等待任一选择器出现（一次页面内轮询，取代逐个选择器串行 wait_for_selector）
+
+    Args:
+        page: Playwright页面对象
+        selectors: 选择器列表（按优先级）
+        step: 步骤名（用于统计）
+        timeout: 最长等待秒数
+        baseline: 被取代的固定等待秒数
+        visible: 是否要求元素可见
+
+    Returns:
+        第一个命中的选择器；超时返回None
+    """
+    return await wait_for_condition(
+        page, _ANY_SELECTOR_JS, step, timeout, baseline,
+        arg={"selectors": list(selectors), "visible": visible}
+    )
+
+
+async def count_matches(page, selector: str) -> int:
+    """统计当前页面中匹配选择器的元素数量（页面失败时返回0）"""
+    try:
+        return await page.evaluate(
+            "(selector) => { try { return document.querySelectorAll(selector).length; } catch (e) { return 0; } }",
+            selector
+        )
+    except Exception:
+        return 0
+
+
+async def wait_for_new_matches(
+    page,
+    selector: str,
+    before: int,
+    step: str,
+    timeout: float,
+    baseline: float = 0.0
+) -> bool:
+    """
+    等待匹配选择器的元素数量超过 before（如输入后新出现的自动完成建议，页面上原有的同类链接不算）
+
+    Args:
+        page: Playwright页面对象
+        selector: 选择器（可用逗号组合多个）
+        before: 触发动作前的匹配数量（count_matches 的结果）
+        step: 步骤名（用于统计）
+        timeout: 最长等待秒数
+        baseline: 被取代的固定等待秒数
+
+    Returns:
+        是否在超时前出现了新元素
+    """
+    return bool(await wait_for_condition(
+        page, _MORE_MATCHES_JS, step, timeout, baseline, arg={"selector": selector, "before": before}
+    ))
+
+
+async def wait_for_selectors_gone(
+    page,
+    selectors: Iterable[str],
+    step: str,
+    timeout: float,
+    baseline: float = 0.0
+) -> bool:
+    """
+    等待所有选择器都从页面消失（如Cloudflare验证页通过）
+
+    Returns:
+        是否在超时前消失
+    """
+    return bool(await wait_for_condition(page, _NONE_PRESENT_JS, step, timeout, baseline, arg=list(selectors)))
+
+
+async def wait_for_response(
+    page,
+    predicate: Callable[[Any], bool],
+    step: str,
+    timeout: float,
+    baseline: float = 0.0,
+    trigger: Optional[Callable[[], Awaitable[Any]]] = None
+) -> Optional[Any]:
+    """
+    等待满足条件的网络响应（先开始监听再执行触发动作，避免错过响应）
+
+    Args:
+        page: Playwright页面对象
+        predicate: 响应判断函数
+        step: 步骤名（用于统计）
+        timeout: 最长等待秒数
+        baseline: 被取代的固定等待秒数
+        trigger: 触发请求的动作（如输入关键字），其异常会照常抛出
+
+    Returns:
+        匹配的响应；超时返回None
+    """
+    started = time.monotonic()
+    waiter = asyncio.ensure_future(page.wait_for_event("response", predicate=predicate, timeout=timeout * 1000))
+    response = None
+    try:
+        if trigger is not None:
+            await trigger()
+        try:
+            response = await waiter
+        except Exception as e:
+            logger.debug(f"等待 {step} 响应未到达（{timeout:.0f}s）: {str(e)[:100]}")
+    finally:
+        if not waiter.done():
+            waiter.cancel()
+        elif not waiter.cancelled():
+            waiter.exception()  # 取出异常，避免未读取的异常告警
+    wait_stats.record(step, time.monotonic() - started, baseline, response is not None)
+    return response